@@ -1,84 +1,107 @@
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Load the grayscale image
-image = cv2.imread('/content/lenna.png', cv2.IMREAD_GRAYSCALE)
+from tracing import span, traced
+from viz import plt
 
 # --- 1. Thresholding Segmentation ---
 def threshold_segmentation(image, thresh_value=127):
+    # Batches (N, H, W[, C]) are thresholded in one call viewed as a 2-D image
+    if image.ndim > 2:
+        flat = np.ascontiguousarray(image).reshape(-1, image.shape[-1])
+        _, binary = cv2.threshold(flat, thresh_value, 255, cv2.THRESH_BINARY)
+        return binary.reshape(image.shape)
     _, binary = cv2.threshold(image, thresh_value, 255, cv2.THRESH_BINARY)
     return binary
 
-thresholded_image = threshold_segmentation(image)
-
 # --- 2. Region-Based Segmentation (Watershed) ---
+@traced("region_based_segmentation")
 def region_based_segmentation(image):
     # Convert to binary image
-    _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    with span("otsu_threshold") as s:
+        _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        s.record(binary)
 
     # Noise removal using morphological operations
     kernel = np.ones((3, 3), np.uint8)
-    opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=2)
+    with span("opening") as s:
+        opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=2)
+        s.record(opening)
 
     # Sure background area
-    sure_bg = cv2.dilate(opening, kernel, iterations=3)
+    with span("dilate") as s:
+        sure_bg = cv2.dilate(opening, kernel, iterations=3)
+        s.record(sure_bg)
 
     # Sure foreground area
-    dist_transform = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
-    _, sure_fg = cv2.threshold(dist_transform, 0.7 * dist_transform.max(), 255, 0)
+    with span("distance_transform") as s:
+        dist_transform = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
+        _, sure_fg = cv2.threshold(dist_transform, 0.7 * dist_transform.max(), 255, 0)
+        s.record(dist_transform)
 
     # Unknown region
     sure_fg = np.uint8(sure_fg)
     unknown = cv2.subtract(sure_bg, sure_fg)
 
     # Marker labelling
-    _, markers = cv2.connectedComponents(sure_fg)
+    with span("connected_components") as s:
+        _, markers = cv2.connectedComponents(sure_fg)
 
-    # Add 1 to all labels so that the background is 1 instead of 0
-    markers = markers + 1
+        # Add 1 to all labels so that the background is 1 instead of 0
+        markers = markers + 1
 
-    # Mark the unknown region as 0
-    markers[unknown == 255] = 0
+        # Mark the unknown region as 0
+        markers[unknown == 255] = 0
+        s.record(markers)
 
     # Watershed algorithm
-    color_image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-    markers = cv2.watershed(color_image, markers)
-    color_image[markers == -1] = [255, 0, 0]  # Mark boundary in red
+    with span("watershed") as s:
+        color_image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        markers = cv2.watershed(color_image, markers)
+        color_image[markers == -1] = [255, 0, 0]  # Mark boundary in red
+        s.record(color_image)
 
     return color_image
 
-region_segmented_image = region_based_segmentation(image)
-
 # --- 3. Edge-Based Segmentation ---
 def edge_based_segmentation(image):
     edges = cv2.Canny(image, 100, 200)  # Canny Edge Detection
     return edges
 
-edge_segmented_image = edge_based_segmentation(image)
+def main():
+    # Load the grayscale image
+    image = cv2.imread('/content/lenna.png', cv2.IMREAD_GRAYSCALE)
+
+    thresholded_image = threshold_segmentation(image)
+
+    region_segmented_image = region_based_segmentation(image)
+
+    edge_segmented_image = edge_based_segmentation(image)
+
+    # --- Display Results ---
+    plt.figure(figsize=(10, 10))
 
-# --- Display Results ---
-plt.figure(figsize=(10, 10))
+    # Original Image
+    plt.subplot(2, 2, 1)
+    plt.title("Original Image")
+    plt.imshow(image, cmap='gray')
 
-# Original Image
-plt.subplot(2, 2, 1)
-plt.title("Original Image")
-plt.imshow(image, cmap='gray')
+    # Thresholding
+    plt.subplot(2, 2, 2)
+    plt.title("Thresholding")
+    plt.imshow(thresholded_image, cmap='gray')
 
-# Thresholding
-plt.subplot(2, 2, 2)
-plt.title("Thresholding")
-plt.imshow(thresholded_image, cmap='gray')
+    # Region-Based Segmentation
+    plt.subplot(2, 2, 3)
+    plt.title("Region-Based (Watershed)")
+    plt.imshow(cv2.cvtColor(region_segmented_image, cv2.COLOR_BGR2RGB))
 
-# Region-Based Segmentation
-plt.subplot(2, 2, 3)
-plt.title("Region-Based (Watershed)")
-plt.imshow(cv2.cvtColor(region_segmented_image, cv2.COLOR_BGR2RGB))
+    # Edge-Based Segmentation
+    plt.subplot(2, 2, 4)
+    plt.title("Edge-Based (Canny)")
+    plt.imshow(edge_segmented_image, cmap='gray')
 
-# Edge-Based Segmentation
-plt.subplot(2, 2, 4)
-plt.title("Edge-Based (Canny)")
-plt.imshow(edge_segmented_image, cmap='gray')
+    plt.tight_layout()
+    plt.show()
 
-plt.tight_layout()
-plt.show()
+if __name__ == "__main__":
+    main()
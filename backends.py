@@ -0,0 +1,251 @@
+"""
+Per-host selection of the fastest implementation of an operation.
+
+Modules that have several equivalent implementations of an operation
+declare it with define_operation() and register each implementation with
+@register_backend. A one-time calibration on the host times every
+available backend over a range of sizes and dtypes, checks that each one
+agrees with the default implementation, and stores a size/dtype ->
+fastest-backend table. dispatch() then routes each call to the winner for
+the nearest calibrated size. Without a table (or with one recorded on a
+different host or library version) the default backend is used.
+
+Usage:
+    python backends.py calibrate            # once per host / after upgrades
+    python backends.py show
+
+The table lives at ~/.cache/dip/backends.json unless DIP_BACKENDS points
+elsewhere.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# Modules that register backends; imported by calibrate() and show()
+PROVIDERS = ["lab2_a", "lab2_b", "klt"]
+
+DEFAULT_TABLE = os.path.join("~", ".cache", "dip", "backends.json")
+
+# op -> {"make_input", "sizes", "dtypes", "check", "backends": {name: (fn, available)}}
+_OPERATIONS = {}
+_table = None
+_choices = {}
+
+
+# --- 1. Registry ---
+def define_operation(op, make_input, sizes=(256, 512, 1024, 2048), dtypes=("uint8",), check=None):
+    """
+    Declare an operation with interchangeable backends.
+
+    Parameters:
+        op (str): Operation name.
+        make_input (callable): make_input(size, dtype) -> tuple of call arguments
+            used for calibration; size is the edge length of a square input.
+        sizes (tuple): Edge lengths to calibrate.
+        dtypes (tuple): Input dtypes to calibrate.
+        check (callable): check(reference, result) -> bool deciding whether a
+            backend agrees with the default. Defaults to np.allclose.
+    """
+    entry = _OPERATIONS.setdefault(op, {"backends": {}})
+    entry.update(make_input=make_input, sizes=sizes, dtypes=dtypes, check=check or _allclose)
+
+
+def register_backend(op, name, requires=None):
+    """
+    Register an implementation of an operation. The first one registered
+    is the default.
+
+    Parameters:
+        op (str): Operation name.
+        name (str): Backend name, e.g. "opencv" or "numpy".
+        requires (str): Optional module the backend needs; it is skipped
+            when that module is not installed.
+    """
+    def decorator(fn):
+        entry = _OPERATIONS.setdefault(op, {"backends": {}})
+        entry["backends"][name] = (fn, requires)
+        _choices.clear()
+        return fn
+    return decorator
+
+
+def _allclose(reference, result):
+    if isinstance(reference, tuple):
+        return all(_allclose(a, b) for a, b in zip(reference, result))
+    return np.allclose(reference, result, rtol=1e-3, atol=1e-3, equal_nan=True)
+
+
+def _available(requires):
+    return requires is None or importlib.util.find_spec(requires) is not None
+
+
+def available_backends(op):
+    """Names of the backends of op that can run on this host, default first."""
+    return [name for name, (_, requires) in _OPERATIONS[op]["backends"].items() if _available(requires)]
+
+
+# --- 2. Dispatch ---
+def fingerprint():
+    """Host and library details a calibration is only valid for."""
+    return {"host": platform.node(), "machine": platform.machine(), "cpu_count": os.cpu_count(),
+            "opencv_threads": cv2.getNumThreads(), "numpy": np.__version__, "opencv": cv2.__version__}
+
+
+def table_path():
+    return os.path.expanduser(os.environ.get("DIP_BACKENDS", DEFAULT_TABLE))
+
+
+def load_table(path=None):
+    """
+    Load the calibration table, ignoring it if it was recorded on another
+    host or library version.
+
+    Returns:
+        dict: {op: {dtype: [[pixels, backend], ...]}}, empty if unusable.
+    """
+    global _table
+    path = path or table_path()
+    _table = {}
+    _choices.clear()
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return _table
+    if data.get("fingerprint") == fingerprint():
+        _table = data.get("table", {})
+    return _table
+
+
+def select(op, pixels, dtype):
+    """
+    Name of the backend to use for an input of `pixels` elements.
+
+    Picks the calibrated winner at the nearest size (on a log scale) for
+    the dtype, falling back to the default backend.
+    """
+    dtype = np.dtype(dtype).name
+    key = (op, pixels, dtype)
+    choice = _choices.get(key)
+    if choice is not None:
+        return choice
+    if _table is None:
+        load_table()
+    names = available_backends(op)
+    choice = names[0]
+    rows = _table.get(op, {}).get(dtype)
+    if rows:
+        size, name = min(rows, key=lambda row: abs(math.log(row[0]) - math.log(max(pixels, 1))))
+        if name in names:
+            choice = name
+    _choices[key] = choice
+    return choice
+
+
+def dispatch(op, x, *args, **kwargs):
+    """Run op on x with the backend selected for x's size and dtype."""
+    x = np.asarray(x)
+    name = select(op, int(np.prod(x.shape[:2])), x.dtype)
+    return _OPERATIONS[op]["backends"][name][0](x, *args, **kwargs)
+
+
+# --- 3. Calibration ---
+def _time(fn, args, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(ops=None, repeat=3, path=None, verbose=False):
+    """
+    Time every backend on this host and store the fastest per size/dtype.
+
+    Backends whose output disagrees with the default backend are never
+    selected.
+
+    Returns:
+        dict: The table that was written.
+    """
+    for module in PROVIDERS:
+        importlib.import_module(module)
+    table = {}
+    for op in ops or sorted(_OPERATIONS):
+        entry = _OPERATIONS[op]
+        names = available_backends(op)
+        for dtype in entry["dtypes"]:
+            rows = table.setdefault(op, {}).setdefault(dtype, [])
+            for size in entry["sizes"]:
+                args = entry["make_input"](size, dtype)
+                reference = None
+                timings = {}
+                for name in names:
+                    fn = entry["backends"][name][0]
+                    with np.errstate(all="ignore"):
+                        result = fn(*args)  # Warm-up, and the agreement check
+                        if reference is None:
+                            reference = result
+                        elif not entry["check"](reference, result):
+                            if verbose:
+                                print(f"{op:<18} {dtype:<8} {size:>5}  {name}: disagrees with {names[0]}, skipped")
+                            continue
+                        timings[name] = _time(fn, args, repeat)
+                winner = min(timings, key=timings.get)
+                pixels = int(np.prod(np.asarray(args[0]).shape[:2]))
+                rows.append([pixels, winner])
+                if verbose:
+                    detail = "  ".join(f"{n} {t * 1000:.2f} ms" for n, t in timings.items())
+                    print(f"{op:<18} {dtype:<8} {size:>5}  {winner:<12} {detail}")
+
+    path = path or table_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"fingerprint": fingerprint(), "table": table}, f, indent=2)
+    load_table(path)
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("calibrate", help="time all backends and store the fastest")
+    run.add_argument("--ops", nargs="*", help="operations to calibrate (default: all)")
+    run.add_argument("--repeat", type=int, default=3, help="timed calls per backend (default: 3)")
+    run.add_argument("--path", help=f"table location (default: $DIP_BACKENDS or {DEFAULT_TABLE})")
+    show = commands.add_parser("show", help="print registered backends and the current table")
+    show.add_argument("--path", help="table location")
+    args = parser.parse_args(argv)
+
+    if args.command == "calibrate":
+        calibrate(args.ops, args.repeat, args.path, verbose=True)
+        print(f"wrote {args.path or table_path()}")
+        return 0
+
+    for module in PROVIDERS:
+        importlib.import_module(module)
+    table = load_table(args.path)
+    for op in sorted(_OPERATIONS):
+        print(f"{op}: {', '.join(available_backends(op))}")
+        for dtype, rows in table.get(op, {}).items():
+            print("    " + dtype + "  " + "  ".join(f"{int(math.sqrt(p))}^2->{name}" for p, name in rows))
+    if not table:
+        print("no calibration for this host; defaults in use")
+    return 0
+
+
+if __name__ == "__main__":
+    # Run through the importable module so the providers register into the same registry
+    import backends
+    sys.exit(backends.main())
@@ -0,0 +1,471 @@
+"""
+Micro- and macro-benchmarks for the lab operations.
+
+Every registered benchmark runs on synthetic images at several sizes and
+dtypes, with warm-up calls followed by timed repeats. For each case the
+suite records wall time (min, median, mean), megapixels per second and
+the peak memory allocated through NumPy during one call (tracemalloc;
+scratch buffers OpenCV allocates internally are not counted). Results are
+written as JSON so two runs can be compared, e.g. before and after
+upgrading OpenCV or NumPy.
+
+Usage:
+    python benchmarks.py list
+    python benchmarks.py run --sizes 512 2k --dtypes uint8 --out before.json
+    python benchmarks.py run --ops mean_filter median_filter --sizes 4k 8k --repeat 3
+    python benchmarks.py compare before.json after.json --threshold 0.10
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+import Imageenhancement
+import Imagemorphologicalprocessing
+import Imageregistration
+import Imagesegmenation
+import box_filters
+import convolution
+import frequency_filters
+import median_filters
+import lab1_A
+import lab1_b
+import lab1_c
+import lab1_d
+import lab1_e
+import lab2_a
+import lab2_b
+import lab2_c
+import lab2_d
+
+SIZES = {"512": (512, 512), "2k": (2048, 2048), "4k": (4096, 4096), "8k": (8192, 8192)}
+DTYPES = ("uint8", "uint16", "float32")
+
+# name -> (make_call, dtypes, color, max_size)
+BENCHMARKS = {}
+
+
+def register_benchmark(name, dtypes=("uint8",), color=False, max_size="8k"):
+    """
+    Register a benchmark.
+
+    The decorated function receives the synthetic image and returns a
+    zero-argument callable that performs the measured work, so setup such
+    as building kernels or warped copies is not timed.
+
+    Parameters:
+        name (str): Benchmark name.
+        dtypes (tuple): Input dtypes the operation supports.
+        color (bool): Feed a 3-channel image instead of a grayscale one.
+        max_size (str): Largest entry of SIZES worth running.
+    """
+    def decorator(make_call):
+        BENCHMARKS[name] = (make_call, dtypes, color, max_size)
+        return make_call
+    return decorator
+
+
+# --- 1. Synthetic Images ---
+def synthetic_image(shape, dtype="uint8", color=False, seed=0):
+    """
+    Smooth structure plus noise, scaled to the full range of dtype.
+
+    Blobs, gradients and rectangles give feature detectors, thresholds and
+    histograms something realistic to work on; the noise keeps filters honest.
+    """
+    rng = np.random.default_rng(seed)
+    height, width = shape
+    channels = 3 if color else 1
+    coarse = rng.random((max(2, height // 64), max(2, width // 64), channels)).astype(np.float32)
+    image = cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC).reshape(height, width, channels)
+    ramp = np.linspace(0, 0.3, width, dtype=np.float32)
+    image = image + ramp[None, :, None]
+    for _ in range(height * width // 4096):
+        x, y = int(rng.integers(0, width)), int(rng.integers(0, height))
+        w, h = rng.integers(4, 48, size=2)
+        cv2.rectangle(image, (x, y), (x + int(w), y + int(h)), rng.random(channels).tolist(), -1)
+    image = image + rng.normal(0, 0.05, image.shape).astype(np.float32)
+    image = np.clip(image / 1.4, 0, 1)
+    if not color:
+        image = image[:, :, 0]
+    if dtype == "float32":
+        return image.astype(np.float32)
+    return (image * np.iinfo(dtype).max).astype(dtype)
+
+
+# --- 2. Registered Benchmarks ---
+@register_benchmark("image_negative")
+def _(image):
+    return lambda: lab1_A.image_negative(image)
+
+
+@register_benchmark("log_transformation", dtypes=("uint8", "uint16", "float32"))
+def _(image):
+    return lambda: lab1_b.log_transformation(image)
+
+
+@register_benchmark("power_law_transformation", dtypes=("uint8", "uint16", "float32"))
+def _(image):
+    return lambda: lab1_c.power_law_transformation(image, 0.5)
+
+
+@register_benchmark("mean_filter", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.mean_filter(image, 5)
+
+
+@register_benchmark("mean_filter_101", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.mean_filter(image, 101)
+
+
+@register_benchmark("multiscale_mean", dtypes=DTYPES)
+def _(image):
+    return lambda: box_filters.multiscale_mean(image, (31, 51, 101))
+
+
+@register_benchmark("integral_image_means", dtypes=DTYPES)
+def _(image):
+    def run():
+        table = box_filters.IntegralImage(image, 101)
+        return [table.mean(k) for k in (31, 51, 101)]
+    return run
+
+
+@register_benchmark("median_filter", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.median_filter(image, 5)
+
+
+@register_benchmark("median_filter_31", dtypes=("uint8", "uint16"))
+def _(image):
+    return lambda: lab1_d.median_filter(image, 31)
+
+
+@register_benchmark("separable_median", dtypes=DTYPES, max_size="4k")
+def _(image):
+    return lambda: median_filters.separable_median_filter(image, 31)
+
+
+@register_benchmark("adaptive_median", dtypes=("uint8", "uint16"))
+def _(image):
+    noisy = image.copy()
+    rng = np.random.default_rng(1)
+    impulses = rng.random(image.shape) < 0.01
+    noisy[impulses] = np.where(rng.random(int(impulses.sum())) < 0.5, 0, np.iinfo(image.dtype).max)
+    return lambda: median_filters.adaptive_median_filter(noisy, 7)
+
+
+@register_benchmark("filter2d_gaussian_63", dtypes=DTYPES)
+def _(image):
+    kernel = cv2.getGaussianKernel(63, 10) @ cv2.getGaussianKernel(63, 10).T
+    return lambda: convolution.filter2d(image, kernel)
+
+
+@register_benchmark("filter2d_gaussian_63_opencv", dtypes=DTYPES)
+def _(image):
+    kernel = cv2.getGaussianKernel(63, 10) @ cv2.getGaussianKernel(63, 10).T
+    return lambda: cv2.filter2D(image, -1, kernel)
+
+
+@register_benchmark("five_filters_separately", dtypes=DTYPES)
+def _(image):
+    return lambda: (lab1_d.mean_filter(image, 3), lab1_d.median_filter(image, 3),
+                    lab1_d.gaussian_filter(image, 3, 1), lab1_d.sharpening_filter(image),
+                    lab1_d.laplacian_4(image))
+
+
+@register_benchmark("five_filters_bank", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.apply_all_filters(image)
+
+
+@register_benchmark("gaussian_filter", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.gaussian_filter(image, 5, 1.5)
+
+
+@register_benchmark("sharpening_filter", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.sharpening_filter(image)
+
+
+@register_benchmark("laplacian_4", dtypes=DTYPES)
+def _(image):
+    return lambda: lab1_d.laplacian_4(image)
+
+
+@register_benchmark("image_averaging", max_size="4k")
+def _(image):
+    frames = [np.roll(image, shift, axis=1) for shift in range(8)]
+    return lambda: lab1_e.image_averaging(frames)
+
+
+@register_benchmark("perform_dft", dtypes=("uint8", "float32"))
+def _(image):
+    return lambda: lab2_a.perform_dft(image)
+
+
+@register_benchmark("z_transform", dtypes=("uint8", "float32"))
+def _(image):
+    return lambda: lab2_a.z_transform(image)
+
+
+@register_benchmark("kl_transform", max_size="2k")
+def _(image):
+    return lambda: lab2_a.kl_transform(image)
+
+
+@register_benchmark("histogram_equalization")
+def _(image):
+    return lambda: lab2_b.histogram_equalization(image)
+
+
+@register_benchmark("histogram_matching")
+def _(image):
+    reference = np.ascontiguousarray(image[::-1])
+    return lambda: lab2_b.histogram_matching(image, reference)
+
+
+@register_benchmark("contrast_enhancement", dtypes=("uint8", "uint16"))
+def _(image):
+    return lambda: lab2_b.contrast_enhancement(image)
+
+
+@register_benchmark("calculate_entropy")
+def _(image):
+    return lambda: lab2_b.calculate_entropy(image)
+
+
+@register_benchmark("create_filter")
+def _(image):
+    # Repeated calls hit the mask cache; create_filter_cold measures a rebuild
+    return lambda: lab2_c.create_filter(image.shape, "low-pass", 50, kind="gaussian")
+
+
+@register_benchmark("create_filter_cold")
+def _(image):
+    def call():
+        frequency_filters.clear_mask_cache()
+        return lab2_c.create_filter(image.shape, "low-pass", 50, kind="gaussian")
+    return call
+
+
+@register_benchmark("homomorphic_filter")
+def _(image):
+    return lambda: lab2_c.homomorphic_filter(image)
+
+
+@register_benchmark("equalize_color_histogram", color=True)
+def _(image):
+    return lambda: lab2_d.equalize_color_histogram(image)
+
+
+@register_benchmark("color_edge_detection", color=True)
+def _(image):
+    return lambda: lab2_d.color_edge_detection(image)
+
+
+@register_benchmark("rgb_to_hsi", color=True, max_size="4k")
+def _(image):
+    import dip_lab
+    return lambda: dip_lab.rgb_to_hsi(image)
+
+
+@register_benchmark("add_gaussian_noise")
+def _(image):
+    return lambda: Imageenhancement.add_gaussian_noise(image)
+
+
+@register_benchmark("perform_erosion", dtypes=DTYPES)
+def _(image):
+    kernel = np.ones((5, 5), np.uint8)
+    return lambda: Imagemorphologicalprocessing.perform_erosion(image, kernel)
+
+
+@register_benchmark("perform_opening", dtypes=DTYPES)
+def _(image):
+    kernel = np.ones((5, 5), np.uint8)
+    return lambda: Imagemorphologicalprocessing.perform_opening(image, kernel)
+
+
+@register_benchmark("threshold_segmentation")
+def _(image):
+    return lambda: Imagesegmenation.threshold_segmentation(image)
+
+
+@register_benchmark("region_based_segmentation")
+def _(image):
+    return lambda: Imagesegmenation.region_based_segmentation(image)
+
+
+@register_benchmark("edge_based_segmentation")
+def _(image):
+    return lambda: Imagesegmenation.edge_based_segmentation(image)
+
+
+@register_benchmark("register_images", color=True)
+def _(image):
+    height, width = image.shape[:2]
+    rotation = cv2.getRotationMatrix2D((width / 2, height / 2), 3, 1.02)
+    moved = cv2.warpAffine(image, rotation, (width, height))
+    return lambda: Imageregistration.register_images(moved, image)
+
+
+# --- 3. Runner ---
+def run_case(name, size, dtype, repeat=5, warmup=1):
+    """
+    Time one benchmark at one size and dtype.
+
+    Returns:
+        dict: Case description with timings, throughput and peak memory,
+        or an "error" entry if the operation raised.
+    """
+    make_call, _, color, _ = BENCHMARKS[name]
+    shape = SIZES[size]
+    case = {"name": name, "size": size, "dtype": dtype, "shape": list(shape), "color": color}
+    try:
+        call = make_call(synthetic_image(shape, dtype, color))
+        for _ in range(warmup):
+            call()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call()
+            times.append(time.perf_counter() - start)
+        tracemalloc.start()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    except Exception as exc:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        case["error"] = f"{type(exc).__name__}: {exc}"
+        return case
+    median = statistics.median(times)
+    case.update({"repeat": repeat, "min_s": min(times), "median_s": median, "mean_s": statistics.fmean(times),
+                 "mpix_per_s": shape[0] * shape[1] / median / 1e6, "peak_alloc_bytes": peak})
+    return case
+
+
+def iter_cases(ops=None, sizes=None, dtypes=None):
+    """Yield (name, size, dtype) for every selected case each benchmark supports."""
+    size_order = list(SIZES)
+    for name in ops or BENCHMARKS:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark {name!r}")
+        _, supported, _, max_size = BENCHMARKS[name]
+        for size in sizes or size_order:
+            if size_order.index(size) > size_order.index(max_size):
+                continue
+            for dtype in dtypes or supported:
+                if dtype in supported:
+                    yield name, size, dtype
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "opencv": cv2.__version__,
+            "platform": platform.platform(), "cpu_count": os.cpu_count(),
+            "opencv_threads": cv2.getNumThreads(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")}
+
+
+# --- 4. Comparison ---
+def compare(baseline, current, threshold=0.10, metric="median_s"):
+    """
+    Match cases of two runs and flag slowdowns beyond a threshold.
+
+    Parameters:
+        baseline (dict): Parsed JSON of the reference run.
+        current (dict): Parsed JSON of the new run.
+        threshold (float): Relative slowdown that counts as a regression.
+        metric (str): Timing field to compare.
+
+    Returns:
+        list: Dicts with name, size, dtype, before, after, ratio and status.
+    """
+    def index(run):
+        return {(r["name"], r["size"], r["dtype"]): r for r in run["results"] if "error" not in r}
+
+    before, after = index(baseline), index(current)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key][metric], after[key][metric]
+        ratio = new / old if old else float("inf")
+        status = "regression" if ratio > 1 + threshold else "improved" if ratio < 1 - threshold else "same"
+        rows.append({"name": key[0], "size": key[1], "dtype": key[2],
+                     "before": old, "after": new, "ratio": ratio, "status": status})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list registered benchmarks")
+
+    run = commands.add_parser("run", help="run benchmarks and write JSON")
+    run.add_argument("--ops", nargs="*", help="benchmarks to run (default: all)")
+    run.add_argument("--sizes", nargs="*", choices=list(SIZES), help="image sizes (default: all)")
+    run.add_argument("--dtypes", nargs="*", choices=DTYPES, help="dtypes (default: each op's supported set)")
+    run.add_argument("--repeat", type=int, default=5, help="timed calls per case (default: 5)")
+    run.add_argument("--warmup", type=int, default=1, help="untimed calls per case (default: 1)")
+    run.add_argument("--out", help="write results to this JSON file")
+
+    diff = commands.add_parser("compare", help="flag regressions between two runs")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--threshold", type=float, default=0.10,
+                      help="relative slowdown counted as a regression (default: 0.10)")
+    diff.add_argument("--metric", default="median_s", choices=["min_s", "median_s", "mean_s"])
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, (_, dtypes, color, max_size) in BENCHMARKS.items():
+            print(f"{name:<28} {','.join(dtypes):<22} {'color' if color else 'gray':<6} up to {max_size}")
+        return 0
+
+    if args.command == "run":
+        try:
+            cases = list(iter_cases(args.ops, args.sizes, args.dtypes))
+        except ValueError as exc:
+            parser.error(str(exc))
+        results = []
+        for name, size, dtype in cases:
+            case = run_case(name, size, dtype, args.repeat, args.warmup)
+            results.append(case)
+            if "error" in case:
+                print(f"{name:<28} {size:>4} {dtype:<8} error: {case['error']}")
+            else:
+                print(f"{name:<28} {size:>4} {dtype:<8} {case['median_s'] * 1000:10.2f} ms "
+                      f"{case['mpix_per_s']:10.1f} MP/s {case['peak_alloc_bytes'] / 2**20:9.1f} MiB")
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump({"environment": environment(), "results": results}, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows = compare(baseline, current, args.threshold, args.metric)
+    for row in rows:
+        print(f"{row['name']:<28} {row['size']:>4} {row['dtype']:<8} {row['before'] * 1000:10.2f} ms "
+              f"-> {row['after'] * 1000:10.2f} ms  x{row['ratio']:.2f}  {row['status']}")
+    regressions = [row for row in rows if row["status"] == "regression"]
+    print(f"{len(regressions)} regressions over {args.threshold:.0%} in {len(rows)} matched cases")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
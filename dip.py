@@ -0,0 +1,269 @@
+"""
+Command-line entry point for running the lab operations in bulk.
+
+Usage:
+    python dip.py list
+    python dip.py check
+    python dip.py batch gamma --in scans/ --out out/ --workers 8 --param gamma=0.5
+    python dip.py batch register --in frames/ --out aligned/ --param reference=ref.png
+    python dip.py tile mean --in slide.npy --out slide_mean.npy --tile-size 2048 --param kernel_size=15
+
+`batch` walks the input tree lazily, submits files to a process pool in
+chunks with a bounded number of chunks in flight, and mirrors the tree
+under the output directory. Inside each worker the next file is decoded
+and the previous result encoded on I/O threads while the current file is
+processed, so decode, process and encode overlap.
+
+`tile` runs one local operation over a single large image in tiles with
+the halo the operation declares (see tiling.py); .npy input and output
+are memory-mapped.
+
+`check` runs every tileable operation tiled and untiled at its default
+parameters and fails if any declared halo leaves seams.
+"""
+
+import argparse
+import ast
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import cv2
+import numpy as np
+
+import operations
+import tiling
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp", ".pgm", ".ppm"}
+
+
+# --- 1. Job Discovery ---
+def iter_jobs(in_dir, out_dir, ext=None):
+    """
+    Yield (source, destination) paths for every image under in_dir.
+
+    Parameters:
+        in_dir (str): Root of the input tree.
+        out_dir (str): Root of the mirrored output tree.
+        ext (str): Output extension, e.g. ".png". Defaults to the source's.
+    """
+    for root, dirs, files in os.walk(in_dir):
+        dirs.sort()
+        rel = os.path.relpath(root, in_dir)
+        for name in sorted(files):
+            stem, suffix = os.path.splitext(name)
+            if suffix.lower() not in IMAGE_EXTENSIONS:
+                continue
+            yield os.path.join(root, name), os.path.normpath(os.path.join(out_dir, rel, stem + (ext or suffix)))
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items from an iterable without materializing it."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_params(pairs):
+    """
+    Turn ["gamma=0.5", "reference=ref.png"] into keyword arguments.
+
+    Values are parsed as Python literals where possible and kept as strings otherwise.
+    """
+    params = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Expected key=value, got {pair!r}")
+        try:
+            params[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            params[key] = value
+    return params
+
+
+# --- 2. Worker Side ---
+def _init_worker():
+    # One OpenCV thread per process; the pool provides the parallelism
+    cv2.setNumThreads(1)
+
+
+def _to_writable(image):
+    if image.dtype == np.bool_:
+        return image.astype(np.uint8) * 255
+    if image.dtype in (np.uint8, np.uint16):
+        return image
+    return cv2.normalize(image, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+
+def _write(path, image):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if not cv2.imwrite(path, _to_writable(image)):
+        raise OSError(f"Could not encode {path}")
+
+
+def run_chunk(op_name, params, jobs):
+    """
+    Process one chunk of (source, destination) jobs inside a worker.
+
+    Returns:
+        list: (source, error message or None) for every job.
+    """
+    fn, imread_flag = operations.get_operation(op_name)
+    results, writes = [], []
+    with ThreadPoolExecutor(max_workers=2) as io:
+        next_read = io.submit(cv2.imread, jobs[0][0], imread_flag)
+        for i, (src, dst) in enumerate(jobs):
+            image = next_read.result()
+            if i + 1 < len(jobs):
+                next_read = io.submit(cv2.imread, jobs[i + 1][0], imread_flag)
+            if image is None:
+                results.append((src, "could not decode"))
+                continue
+            try:
+                result = fn(image, **params)
+            except Exception as exc:
+                results.append((src, f"{type(exc).__name__}: {exc}"))
+                continue
+            writes.append((src, io.submit(_write, dst, result)))
+        for src, write in writes:
+            try:
+                write.result()
+                results.append((src, None))
+            except Exception as exc:
+                results.append((src, f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+# --- 3. Driver ---
+def run_batch(op_name, in_dir, out_dir, workers=None, params=None, chunksize=16,
+              max_in_flight=None, ext=None):
+    """
+    Run a registered operation over every image in a directory tree.
+
+    Parameters:
+        op_name (str): Registered operation name (see operations.py).
+        in_dir (str): Input directory, walked recursively.
+        out_dir (str): Output directory; the input tree is mirrored.
+        workers (int): Worker processes. Defaults to the CPU count.
+        params (dict): Keyword parameters for the operation.
+        chunksize (int): Files per submitted task.
+        max_in_flight (int): Chunks queued at once. Defaults to 2 * workers.
+        ext (str): Output extension. Defaults to the source extension.
+
+    Returns:
+        dict: {"processed", "failed", "errors", "seconds"}.
+    """
+    operations.get_operation(op_name)  # Fail fast on unknown names
+    params = params or {}
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    summary = {"processed": 0, "failed": 0, "errors": []}
+
+    def collect(futures):
+        for future in futures:
+            for src, error in future.result():
+                if error is None:
+                    summary["processed"] += 1
+                else:
+                    summary["failed"] += 1
+                    summary["errors"].append((src, error))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = set()
+        for chunk in chunked(iter_jobs(in_dir, out_dir, ext), chunksize):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(run_chunk, op_name, params, chunk))
+        collect(wait(pending).done)
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def run_tile(op_name, in_path, out_path, halo, params, tile_size, workers):
+    fn, imread_flag = operations.get_operation(op_name)
+    if in_path.endswith(".npy"):
+        image = np.load(in_path, mmap_mode="r")
+    else:
+        image = cv2.imread(in_path, imread_flag)
+        if image is None:
+            print(f"error: could not decode {in_path}", file=sys.stderr)
+            return 1
+    start = time.perf_counter()
+    out = tiling.run_tiled(fn, image, halo, out=out_path if out_path.endswith(".npy") else None,
+                           tile_size=tile_size, workers=workers, **params)
+    if not out_path.endswith(".npy"):
+        _write(out_path, out)
+    print(f"{image.shape[1]}x{image.shape[0]} in {time.perf_counter() - start:.1f} s "
+          f"(tile {tile_size}, halo {halo})")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="dip", description="Digital image processing lab tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list registered operations")
+    commands.add_parser("check", help="check tiled against untiled output of every tileable operation")
+
+    batch = commands.add_parser("batch", help="run an operation over a directory tree")
+    batch.add_argument("op", help="registered operation name")
+    batch.add_argument("--in", dest="in_dir", required=True, help="input directory")
+    batch.add_argument("--out", dest="out_dir", required=True, help="output directory")
+    batch.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    batch.add_argument("--param", action="append", metavar="KEY=VALUE", help="operation parameter, repeatable")
+    batch.add_argument("--chunksize", type=int, default=16, help="files per task (default: 16)")
+    batch.add_argument("--max-in-flight", type=int, default=None, help="tasks queued at once (default: 2 * workers)")
+    batch.add_argument("--ext", default=None, help="output extension, e.g. .png (default: keep)")
+
+    tile = commands.add_parser("tile", help="run a local operation over one large image in tiles")
+    tile.add_argument("op", help="registered operation name")
+    tile.add_argument("--in", dest="in_path", required=True, help="input .npy (memory-mapped) or image file")
+    tile.add_argument("--out", dest="out_path", required=True, help="output .npy (memory-mapped) or image file")
+    tile.add_argument("--workers", type=int, default=None, help="parallel workers (default: CPU count)")
+    tile.add_argument("--param", action="append", metavar="KEY=VALUE", help="operation parameter, repeatable")
+    tile.add_argument("--tile-size", type=int, default=1024, help="tile edge in pixels (default: 1024)")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name in sorted(operations.OPERATIONS):
+            tiled = "" if name in operations.HALOS else "  (not tileable)"
+            print(f"{name}{tiled}")
+        return 0
+
+    if args.command == "check":
+        mismatches = operations.check_halos()
+        for name, count in mismatches.items():
+            print(f"{name:<12} {'ok' if count == 0 else f'{count} pixels differ'}")
+        return 1 if any(mismatches.values()) else 0
+
+    try:
+        operations.get_operation(args.op)
+        params = parse_params(args.param)
+        if args.command == "tile":
+            halo = operations.get_halo(args.op, params)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.command == "tile":
+        return run_tile(args.op, args.in_path, args.out_path, halo, params, args.tile_size, args.workers)
+
+    summary = run_batch(args.op, args.in_dir, args.out_dir, args.workers, params,
+                        args.chunksize, args.max_in_flight, args.ext)
+    for src, error in summary["errors"]:
+        print(f"error: {src}: {error}", file=sys.stderr)
+    rate = summary["processed"] / summary["seconds"] if summary["seconds"] else 0.0
+    print(f"{summary['processed']} processed, {summary['failed']} failed "
+          f"in {summary['seconds']:.1f} s ({rate:.1f} images/s)")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
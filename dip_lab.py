@@ -11,7 +11,7 @@ Implement the image negative transformation function and apply it to a grayscale
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
 def apply_negative_transformation(image):
     """
@@ -67,7 +67,7 @@ contrast).
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
 # Function to compute image negative
 def image_negative(image):
@@ -94,22 +94,23 @@ def display_images(original, transformed, title1="Original", title2="Transformed
 
 # Load sample images
 
-low_contrast_image = cv2.imread('/content/low_and_heigh_contrast_gray_scale_image.jpg', cv2.IMREAD_GRAYSCALE)
-high_contrast_image = cv2.imread('/content/grayscale_image.jpg', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    low_contrast_image = cv2.imread('/content/low_and_heigh_contrast_gray_scale_image.jpg', cv2.IMREAD_GRAYSCALE)
+    high_contrast_image = cv2.imread('/content/grayscale_image.jpg', cv2.IMREAD_GRAYSCALE)
 
-if low_contrast_image is None or high_contrast_image is None:
-    print("Please ensure the image files are available in the specified paths.")
-else:
-    # Apply image negative transformation
-    low_contrast_negative = image_negative(low_contrast_image)
-    high_contrast_negative = image_negative(high_contrast_image)
+    if low_contrast_image is None or high_contrast_image is None:
+        print("Please ensure the image files are available in the specified paths.")
+    else:
+        # Apply image negative transformation
+        low_contrast_negative = image_negative(low_contrast_image)
+        high_contrast_negative = image_negative(high_contrast_image)
 
-    # Display results
-    print("Low Contrast Image Analysis")
-    display_images(low_contrast_image, low_contrast_negative, "Low Contrast and High Contrast ", "Negative")
+        # Display results
+        print("Low Contrast Image Analysis")
+        display_images(low_contrast_image, low_contrast_negative, "Low Contrast and High Contrast ", "Negative")
 
-    print("High Contrast Image Analysis")
-    display_images(high_contrast_image, high_contrast_negative, "High Contrast", "Negative")
+        print("High Contrast Image Analysis")
+        display_images(high_contrast_image, high_contrast_negative, "High Contrast", "Negative")
 
 """Compare the histogram of an original image with its negative. Explain the observed
 differences.
@@ -117,44 +118,45 @@ differences.
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Load a grayscale image
-image = cv2.imread('/content/grayscale_image.jpg', cv2.IMREAD_GRAYSCALE)
-
-# Create the negative of the image
-negative_image = 255 - image
-
-# Calculate histograms for the original and negative images
-original_hist = cv2.calcHist([image], [0], None, [256], [0, 256])
-negative_hist = cv2.calcHist([negative_image], [0], None, [256], [0, 256])
-
-# Normalize histograms for better comparison
-original_hist /= original_hist.sum()
-negative_hist /= negative_hist.sum()
-
-# Plot the histograms
-plt.figure(figsize=(12, 6))
-
-# Original Image Histogram
-plt.subplot(1, 2, 1)
-plt.title("Original Image Histogram")
-plt.xlabel("Pixel Intensity")
-plt.ylabel("Frequency")
-plt.plot(original_hist, color='blue')
-plt.grid()
-
-# Negative Image Histogram
-plt.subplot(1, 2, 2)
-plt.title("Negative Image Histogram")
-plt.xlabel("Pixel Intensity")
-plt.ylabel("Frequency")
-plt.plot(negative_hist, color='red')
-plt.grid()
-
-# Show the plots
-plt.tight_layout()
-plt.show()
+if __name__ == "__main__":
+    # Load a grayscale image
+    image = cv2.imread('/content/grayscale_image.jpg', cv2.IMREAD_GRAYSCALE)
+
+    # Create the negative of the image
+    negative_image = 255 - image
+
+    # Calculate histograms for the original and negative images
+    original_hist = cv2.calcHist([image], [0], None, [256], [0, 256])
+    negative_hist = cv2.calcHist([negative_image], [0], None, [256], [0, 256])
+
+    # Normalize histograms for better comparison
+    original_hist /= original_hist.sum()
+    negative_hist /= negative_hist.sum()
+
+    # Plot the histograms
+    plt.figure(figsize=(12, 6))
+
+    # Original Image Histogram
+    plt.subplot(1, 2, 1)
+    plt.title("Original Image Histogram")
+    plt.xlabel("Pixel Intensity")
+    plt.ylabel("Frequency")
+    plt.plot(original_hist, color='blue')
+    plt.grid()
+
+    # Negative Image Histogram
+    plt.subplot(1, 2, 2)
+    plt.title("Negative Image Histogram")
+    plt.xlabel("Pixel Intensity")
+    plt.ylabel("Frequency")
+    plt.plot(negative_hist, color='red')
+    plt.grid()
+
+    # Show the plots
+    plt.tight_layout()
+    plt.show()
 
 """Implement the log transformation function and apply it to an image with a narrow range of
 low gray-level values.
@@ -162,7 +164,8 @@ low gray-level values.
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
 
 def log_transform(image):
     """
@@ -174,6 +177,10 @@ def log_transform(image):
     Returns:
         numpy.ndarray: Log-transformed image.
     """
+    # 8-bit input: one gather through the memoized lookup table
+    if image.dtype == np.uint8:
+        return apply_point_op(image, "log_max")
+
     # Convert the image to float32 for precision in log transformation
     image_float = image.astype(np.float32)
 
@@ -186,39 +193,41 @@ def log_transform(image):
 
     return log_image
 
-# Load an image with a narrow range of low gray-level values
-# You can replace 'low_gray_image.jpg' with the path to your image
-image_path = "/content/grayscale_image.jpg"
-image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load an image with a narrow range of low gray-level values
+    # You can replace 'low_gray_image.jpg' with the path to your image
+    image_path = "/content/grayscale_image.jpg"
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
 
-if image is None:
-    raise FileNotFoundError(f"Image not found at {image_path}")
+    if image is None:
+        raise FileNotFoundError(f"Image not found at {image_path}")
 
-# Apply the log transformation
-log_image = log_transform(image)
+    # Apply the log transformation
+    log_image = log_transform(image)
 
-# Display the original and log-transformed images
-plt.figure(figsize=(10, 5))
+    # Display the original and log-transformed images
+    plt.figure(figsize=(10, 5))
 
-plt.subplot(1, 2, 1)
-plt.title("Original Image")
-plt.imshow(image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 1)
+    plt.title("Original Image")
+    plt.imshow(image, cmap='gray')
+    plt.axis('off')
 
-plt.subplot(1, 2, 2)
-plt.title("Log-Transformed Image")
-plt.imshow(log_image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 2)
+    plt.title("Log-Transformed Image")
+    plt.imshow(log_image, cmap='gray')
+    plt.axis('off')
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
 
-# Save the log-transformed image (optional)
-cv2.imwrite("log_transformed_image.jpg", log_image)
+    # Save the log-transformed image (optional)
+    cv2.imwrite("log_transformed_image.jpg", log_image)
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
 
 def log_transform(image):
     """
@@ -230,6 +239,10 @@ def log_transform(image):
     Returns:
         numpy.ndarray: Log-transformed image.
     """
+    # 8-bit input: one gather through the memoized lookup table
+    if image.dtype == np.uint8:
+        return apply_point_op(image, "log_max")
+
     # Convert the image to float32 for precision in log transformation
     image_float = image.astype(np.float32)
 
@@ -242,41 +255,43 @@ def log_transform(image):
 
     return log_image
 
-# Load an image with a narrow range of low gray-level values
-# You can replace 'low_gray_image.jpg' with the path to your image
-image_path = "/content/einstein.jpg"
-image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load an image with a narrow range of low gray-level values
+    # You can replace 'low_gray_image.jpg' with the path to your image
+    image_path = "/content/einstein.jpg"
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
 
-if image is None:
-    raise FileNotFoundError(f"Image not found at {image_path}")
+    if image is None:
+        raise FileNotFoundError(f"Image not found at {image_path}")
 
-# Apply the log transformation
-log_image = log_transform(image)
+    # Apply the log transformation
+    log_image = log_transform(image)
 
-# Display the original and log-transformed images
-plt.figure(figsize=(10, 5))
+    # Display the original and log-transformed images
+    plt.figure(figsize=(10, 5))
 
-plt.subplot(1, 2, 1)
-plt.title("Original Image")
-plt.imshow(image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 1)
+    plt.title("Original Image")
+    plt.imshow(image, cmap='gray')
+    plt.axis('off')
 
-plt.subplot(1, 2, 2)
-plt.title("Log-Transformed Image")
-plt.imshow(log_image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 2)
+    plt.title("Log-Transformed Image")
+    plt.imshow(log_image, cmap='gray')
+    plt.axis('off')
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
 
-# Save the log-transformed image (optional)
-cv2.imwrite("log_transformed_image.jpg", log_image)
+    # Save the log-transformed image (optional)
+    cv2.imwrite("log_transformed_image.jpg", log_image)
 
 """Analyze the effect of the log transformation on enhancing details in dark regions of an image."""
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
 
 def log_transform(image):
     """
@@ -288,6 +303,10 @@ def log_transform(image):
     Returns:
         numpy.ndarray: Log-transformed image.
     """
+    # 8-bit input: one gather through the memoized lookup table
+    if image.dtype == np.uint8:
+        return apply_point_op(image, "log_max")
+
     # Convert the image to float32 for precision in log transformation
     image_float = image.astype(np.float32)
 
@@ -342,68 +361,70 @@ def analyze_log_transformation(original_image, transformed_image):
     plt.tight_layout()
     plt.show()
 
-# Load an image with a narrow range of low gray-level values
-# You can replace 'low_gray_image.jpg' with the path to your image
-image_path = "/content/einstein.jpg"
-image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load an image with a narrow range of low gray-level values
+    # You can replace 'low_gray_image.jpg' with the path to your image
+    image_path = "/content/einstein.jpg"
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
 
-if image is None:
-    raise FileNotFoundError(f"Image not found at {image_path}")
+    if image is None:
+        raise FileNotFoundError(f"Image not found at {image_path}")
 
-# Apply the log transformation
-log_image = log_transform(image)
+    # Apply the log transformation
+    log_image = log_transform(image)
 
-# Display the original and log-transformed images
-plt.figure(figsize=(10, 5))
+    # Display the original and log-transformed images
+    plt.figure(figsize=(10, 5))
 
-plt.subplot(1, 2, 1)
-plt.title("Original Image")
-plt.imshow(image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 1)
+    plt.title("Original Image")
+    plt.imshow(image, cmap='gray')
+    plt.axis('off')
 
-plt.subplot(1, 2, 2)
-plt.title("Log-Transformed Image")
-plt.imshow(log_image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 2)
+    plt.title("Log-Transformed Image")
+    plt.imshow(log_image, cmap='gray')
+    plt.axis('off')
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
 
-# Analyze the effect
-analyze_log_transformation(image, log_image)
+    # Analyze the effect
+    analyze_log_transformation(image, log_image)
 
-# Save the log-transformed image (optional)
-cv2.imwrite("log_transformed_image.jpg", log_image)
+    # Save the log-transformed image (optional)
+    cv2.imwrite("log_transformed_image.jpg", log_image)
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Load the image
-image = cv2.imread('/content/images (7).jpeg', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load the image
+    image = cv2.imread('/content/images (7).jpeg', cv2.IMREAD_GRAYSCALE)
 
-# Apply log transformation
-c = 255 / np.log(1 + np.max(image))  # Scaling constant
-log_transformed = c * np.log(1 + image.astype(np.float32))
+    # Apply log transformation
+    c = 255 / np.log(1 + np.max(image))  # Scaling constant
+    log_transformed = c * np.log(1 + image.astype(np.float32))
 
-# Normalize the log-transformed image
-log_transformed = np.uint8(cv2.normalize(log_transformed, None, 0, 255, cv2.NORM_MINMAX))
+    # Normalize the log-transformed image
+    log_transformed = np.uint8(cv2.normalize(log_transformed, None, 0, 255, cv2.NORM_MINMAX))
 
-# Plot the original and transformed images
-plt.figure(figsize=(10, 5))
+    # Plot the original and transformed images
+    plt.figure(figsize=(10, 5))
 
-plt.subplot(1, 2, 1)
-plt.title("Original Image")
-plt.imshow(image, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 1)
+    plt.title("Original Image")
+    plt.imshow(image, cmap='gray')
+    plt.axis('off')
 
-plt.subplot(1, 2, 2)
-plt.title("Log Transformed Image")
-plt.imshow(log_transformed, cmap='gray')
-plt.axis('off')
+    plt.subplot(1, 2, 2)
+    plt.title("Log Transformed Image")
+    plt.imshow(log_transformed, cmap='gray')
+    plt.axis('off')
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
 
 """Experiment with different values of the constant 'c' in the log transformation equation and
 observe the changes in output image.
@@ -411,7 +432,7 @@ observe the changes in output image.
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
 def log_transformation(image, c):
     """
@@ -455,32 +476,34 @@ def display_images(images, titles, rows, cols):
     plt.tight_layout()
     plt.show()
 
-# Load the input image
-image_path = "/content/grayscale_image.jpg"  # Replace with your image path
-image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load the input image
+    image_path = "/content/grayscale_image.jpg"  # Replace with your image path
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
 
-if image is None:
-    raise ValueError("Image not found at the specified path.")
+    if image is None:
+        raise ValueError("Image not found at the specified path.")
 
-# Define different values of c to experiment with
-c_values = [1, 5, 10, 20]
+    # Define different values of c to experiment with
+    c_values = [1, 5, 10, 20]
 
-# Apply log transformation for each value of c and store the results
-images = [image]
-titles = ["Original Image"]
+    # Apply log transformation for each value of c and store the results
+    images = [image]
+    titles = ["Original Image"]
 
-for c in c_values:
-    transformed_image = log_transformation(image, c)
-    images.append(transformed_image)
-    titles.append(f"Log Transform (c = {c})")
+    for c in c_values:
+        transformed_image = log_transformation(image, c)
+        images.append(transformed_image)
+        titles.append(f"Log Transform (c = {c})")
 
-# Display the images
-display_images(images, titles, rows=1, cols=len(images))
+    # Display the images
+    display_images(images, titles, rows=1, cols=len(images))
 
 """Implement the power-law transformation function with different values of gamma."""
 
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
 
 def power_law_transformation(image, gamma):
     """
@@ -493,6 +516,10 @@ def power_law_transformation(image, gamma):
     Returns:
         transformed_image (ndarray): Gamma-transformed image.
     """
+    # 8-bit input: one gather through the memoized lookup table
+    if image.dtype == np.uint8:
+        return apply_point_op(image, "gamma", gamma=gamma)
+
     # Normalize the image to the range [0, 1]
     image_normalized = image / 255.0
 
@@ -528,9 +555,14 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
 
 def power_law_transformation(image, gamma):
+    # 8-bit input: one gather through the memoized lookup table
+    if image.dtype == np.uint8:
+        return apply_point_op(image, "gamma", gamma=gamma)
+
     # Normalize the image to the range [0, 1]
     normalized_image = image / 255.0
 
@@ -542,30 +574,31 @@ def power_law_transformation(image, gamma):
 
     return transformed_image
 
-# Read an image
-image_path = '/content/einstein.jpg'  # Replace with your image path
-image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)  # Load the image in grayscale
+if __name__ == "__main__":
+    # Read an image
+    image_path = '/content/einstein.jpg'  # Replace with your image path
+    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)  # Load the image in grayscale
 
-# Apply the power-law transformation with a gamma value
-gamma = 2.0  # You can adjust this value
-transformed_image = power_law_transformation(image, gamma)
+    # Apply the power-law transformation with a gamma value
+    gamma = 2.0  # You can adjust this value
+    transformed_image = power_law_transformation(image, gamma)
 
-# Display the original and transformed images side by side
-plt.figure(figsize=(10, 5))
+    # Display the original and transformed images side by side
+    plt.figure(figsize=(10, 5))
 
-# Original Image
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
+    # Original Image
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
 
-# Transformed Image
-plt.subplot(1, 2, 2)
-plt.imshow(transformed_image, cmap='gray')
-plt.title(f'Power-Law Transformed Image (Gamma={gamma})')
-plt.axis('off')
+    # Transformed Image
+    plt.subplot(1, 2, 2)
+    plt.imshow(transformed_image, cmap='gray')
+    plt.title(f'Power-Law Transformed Image (Gamma={gamma})')
+    plt.axis('off')
 
-plt.show()
+    plt.show()
 
 """Analyze the effect of gamma values on the image appearance, especially for values less than
 and greater than 1
@@ -573,10 +606,15 @@ and greater than 1
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
 
 # Function to apply gamma correction
 def gamma_correction(image, gamma):
+    # 8-bit input: one gather through the memoized lookup table
+    if image.dtype == np.uint8:
+        return apply_point_op(image, "gamma", gamma=gamma)
+
     # Normalize the image to range [0, 1]
     image_normalized = image / 255.0
     # Apply gamma correction
@@ -585,34 +623,35 @@ def gamma_correction(image, gamma):
     image_corrected = np.uint8(image_corrected * 255)
     return image_corrected
 
-# Read the image
-image = cv2.imread('/content/einstein.jpg')
-
-# Convert BGR to RGB for displaying with Matplotlib
-image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+if __name__ == "__main__":
+    # Read the image
+    image = cv2.imread('/content/einstein.jpg')
 
-# Different gamma values to test
-gamma_values = [0.5, 1, 1.5, 2.0]
+    # Convert BGR to RGB for displaying with Matplotlib
+    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-# Plot the original image and images with different gamma values
-plt.figure(figsize=(12, 8))
+    # Different gamma values to test
+    gamma_values = [0.5, 1, 1.5, 2.0]
 
-# Original image
-plt.subplot(2, 3, 1)
-plt.imshow(image_rgb)
-plt.title('Original Image')
-plt.axis('off')
+    # Plot the original image and images with different gamma values
+    plt.figure(figsize=(12, 8))
 
-# Gamma corrected images
-for i, gamma in enumerate(gamma_values):
-    corrected_image = gamma_correction(image_rgb, gamma)
-    plt.subplot(2, 3, i + 2)
-    plt.imshow(corrected_image)
-    plt.title(f'Gamma = {gamma}')
+    # Original image
+    plt.subplot(2, 3, 1)
+    plt.imshow(image_rgb)
+    plt.title('Original Image')
     plt.axis('off')
 
-plt.tight_layout()
-plt.show()
+    # Gamma corrected images
+    for i, gamma in enumerate(gamma_values):
+        corrected_image = gamma_correction(image_rgb, gamma)
+        plt.subplot(2, 3, i + 2)
+        plt.imshow(corrected_image)
+        plt.title(f'Gamma = {gamma}')
+        plt.axis('off')
+
+    plt.tight_layout()
+    plt.show()
 
 """Experiment with different image types (e.g., medical, satellite, natural) to observe the impact
 of transformations
@@ -620,11 +659,19 @@ of transformations
 
 import numpy as np
 import cv2
-from PIL import Image
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import LazyModule
+
+Image = LazyModule("PIL.Image")
 
 # Function to apply power-law transformation
 def powerlaw_transformation(image, gamma=1.0):
+    # 8-bit input: one gather through the memoized lookup table
+    pixels = np.asarray(image)
+    if pixels.dtype == np.uint8:
+        return apply_point_op(pixels, "gamma", gamma=gamma)
+
     # Normalize image to the range [0, 1]
     image = np.array(image, dtype=np.float32) / 255.0
     # Apply the power-law transformation
@@ -633,37 +680,38 @@ def powerlaw_transformation(image, gamma=1.0):
     transformed_image = np.uint8(transformed_image * 255)
     return transformed_image
 
-# Load sample images of different types
-# Replace these paths with actual paths to your images
-image_paths = [
-    "/content/grayscale_image.jpg",   # e.g., X-ray or MRI image
-    "/content/Greyscale-satellite-image-centred-on-SIRTAs-Laboratory-48713-N-2208-E_Q320.jpg",  # e.g., satellite imagery
-    "/content/einstein.jpg"    # e.g., landscape or nature image
-]
-
-# Set gamma values to experiment with
-gamma_values = [0.5, 1.0, 2.0]
-
-# Plot original and transformed images for each type
-fig, axes = plt.subplots(len(image_paths), len(gamma_values) + 1, figsize=(12, 6))
-for i, image_path in enumerate(image_paths):
-    # Load image using OpenCV or PIL
-    image = Image.open(image_path)
-
-    # Show original image
-    axes[i][0].imshow(image)
-    axes[i][0].set_title("Original")
-    axes[i][0].axis('off')
-
-    # Apply and display power-law transformations for each gamma value
-    for j, gamma in enumerate(gamma_values):
-        transformed_image = powerlaw_transformation(image, gamma)
-        axes[i][j + 1].imshow(transformed_image, cmap='gray')
-        axes[i][j + 1].set_title(f"Gamma = {gamma}")
-        axes[i][j + 1].axis('off')
-
-plt.tight_layout()
-plt.show()
+if __name__ == "__main__":
+    # Load sample images of different types
+    # Replace these paths with actual paths to your images
+    image_paths = [
+        "/content/grayscale_image.jpg",   # e.g., X-ray or MRI image
+        "/content/Greyscale-satellite-image-centred-on-SIRTAs-Laboratory-48713-N-2208-E_Q320.jpg",  # e.g., satellite imagery
+        "/content/einstein.jpg"    # e.g., landscape or nature image
+    ]
+
+    # Set gamma values to experiment with
+    gamma_values = [0.5, 1.0, 2.0]
+
+    # Plot original and transformed images for each type
+    fig, axes = plt.subplots(len(image_paths), len(gamma_values) + 1, figsize=(12, 6))
+    for i, image_path in enumerate(image_paths):
+        # Load image using OpenCV or PIL
+        image = Image.open(image_path)
+
+        # Show original image
+        axes[i][0].imshow(image)
+        axes[i][0].set_title("Original")
+        axes[i][0].axis('off')
+
+        # Apply and display power-law transformations for each gamma value
+        for j, gamma in enumerate(gamma_values):
+            transformed_image = powerlaw_transformation(image, gamma)
+            axes[i][j + 1].imshow(transformed_image, cmap='gray')
+            axes[i][j + 1].set_title(f"Gamma = {gamma}")
+            axes[i][j + 1].axis('off')
+
+    plt.tight_layout()
+    plt.show()
 
 """Spatial Filtering
 1. Implement mean, median, and Gaussian filters. Apply them to images with different noise
@@ -676,10 +724,13 @@ edge detection capabilities.
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from box_filters import box_filter
+from median_filters import median_filter
 
-# Read the image
-image = cv2.imread('/content/einstein.jpg', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Read the image
+    image = cv2.imread('/content/einstein.jpg', cv2.IMREAD_GRAYSCALE)
 
 # Adding salt-and-pepper noise to the image
 def add_salt_pepper_noise(image, salt_prob, pepper_prob):
@@ -706,78 +757,83 @@ def add_gaussian_noise(image, mean=0, var=0.01):
     noisy = np.uint8(np.clip(image + gauss, 0, 255))
     return noisy
 
-# Apply filters
-mean_filtered = cv2.blur(image, (5, 5))
-median_filtered = cv2.medianBlur(image, 5)
-gaussian_filtered = cv2.GaussianBlur(image, (5, 5), 0)
-
-# Show results
-fig, axes = plt.subplots(1, 4, figsize=(20, 5))
-axes[0].imshow(image, cmap='gray')
-axes[0].set_title('Original Image')
-axes[1].imshow(mean_filtered, cmap='gray')
-axes[1].set_title('Mean Filter')
-axes[2].imshow(median_filtered, cmap='gray')
-axes[2].set_title('Median Filter')
-axes[3].imshow(gaussian_filtered, cmap='gray')
-axes[3].set_title('Gaussian Filter')
-for ax in axes:
-    ax.axis('off')
-plt.show()
+if __name__ == "__main__":
+    # Apply filters
+    mean_filtered = box_filter(image, 5)
+    median_filtered = median_filter(image, 5)
+    gaussian_filtered = cv2.GaussianBlur(image, (5, 5), 0)
+
+    # Show results
+    fig, axes = plt.subplots(1, 4, figsize=(20, 5))
+    axes[0].imshow(image, cmap='gray')
+    axes[0].set_title('Original Image')
+    axes[1].imshow(mean_filtered, cmap='gray')
+    axes[1].set_title('Mean Filter')
+    axes[2].imshow(median_filtered, cmap='gray')
+    axes[2].set_title('Median Filter')
+    axes[3].imshow(gaussian_filtered, cmap='gray')
+    axes[3].set_title('Gaussian Filter')
+    for ax in axes:
+        ax.axis('off')
+    plt.show()
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Read the image
-image = cv2.imread('/content/einstein.jpg', cv2.IMREAD_GRAYSCALE)
-
-# Custom sharpening kernel
-sharpening_kernel = np.array([[0, -1, 0],
-                               [-1, 5,-1],
-                               [0, -1, 0]])
-
-# Apply the filter
-sharpened_image = cv2.filter2D(image, -1, sharpening_kernel)
-
-# Show results
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-plt.subplot(1, 2, 2)
-plt.imshow(sharpened_image, cmap='gray')
-plt.title('Sharpened Image')
-plt.axis('off')
-plt.show()
+from viz import plt
+from convolution import filter2d
+
+if __name__ == "__main__":
+    # Read the image
+    image = cv2.imread('/content/einstein.jpg', cv2.IMREAD_GRAYSCALE)
+
+    # Custom sharpening kernel
+    sharpening_kernel = np.array([[0, -1, 0],
+                                   [-1, 5,-1],
+                                   [0, -1, 0]])
+
+    # Apply the filter
+    sharpened_image = filter2d(image, sharpening_kernel)
+
+    # Show results
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+    plt.subplot(1, 2, 2)
+    plt.imshow(sharpened_image, cmap='gray')
+    plt.title('Sharpened Image')
+    plt.axis('off')
+    plt.show()
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Read the image
-image = cv2.imread('/content/einstein.jpg', cv2.IMREAD_GRAYSCALE)
-
-# Apply Laplacian filters with different connectivity
-laplacian_4 = cv2.Laplacian(image, cv2.CV_64F, ksize=3, borderType=cv2.BORDER_DEFAULT)
-laplacian_8 = cv2.filter2D(image, -1, np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]]))
-
-# Show results
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 3, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-plt.subplot(1, 3, 2)
-plt.imshow(laplacian_4, cmap='gray')
-plt.title('Laplacian 4-connected')
-plt.axis('off')
-plt.subplot(1, 3, 3)
-plt.imshow(laplacian_8, cmap='gray')
-plt.title('Laplacian 8-connected')
-plt.axis('off')
-plt.show()
+from viz import plt
+from convolution import filter2d
+
+if __name__ == "__main__":
+    # Read the image
+    image = cv2.imread('/content/einstein.jpg', cv2.IMREAD_GRAYSCALE)
+
+    # Apply Laplacian filters with different connectivity
+    laplacian_4 = cv2.Laplacian(image, cv2.CV_64F, ksize=3, borderType=cv2.BORDER_DEFAULT)
+    laplacian_8 = filter2d(image, np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]]))
+
+    # Show results
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 3, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+    plt.subplot(1, 3, 2)
+    plt.imshow(laplacian_4, cmap='gray')
+    plt.title('Laplacian 4-connected')
+    plt.axis('off')
+    plt.subplot(1, 3, 3)
+    plt.imshow(laplacian_8, cmap='gray')
+    plt.title('Laplacian 8-connected')
+    plt.axis('off')
+    plt.show()
 
 """Image Enhancement: Arithmetic/Logic Operations
 4. Implement image subtraction to detect changes between two images (e.g., before and after an
@@ -790,197 +846,203 @@ event).
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Load the images
-image_before = cv2.imread('/content/star-1-300x168.jpg', cv2.IMREAD_GRAYSCALE)
-image_after = cv2.imread('/content/dot-300x168.jpg', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load the images
+    image_before = cv2.imread('/content/star-1-300x168.jpg', cv2.IMREAD_GRAYSCALE)
+    image_after = cv2.imread('/content/dot-300x168.jpg', cv2.IMREAD_GRAYSCALE)
 
-# Ensure both images are the same size
-if image_before.shape != image_after.shape:
-    print("Error: Images must have the same dimensions.")
-    exit()
+    # Ensure both images are the same size
+    if image_before.shape != image_after.shape:
+        print("Error: Images must have the same dimensions.")
+        exit()
 
-# Perform image subtraction
-difference = cv2.absdiff(image_before, image_after)
+    # Perform image subtraction
+    difference = cv2.absdiff(image_before, image_after)
 
-plt.figure(figsize=(10, 5))
+    plt.figure(figsize=(10, 5))
 
-# Original images
-plt.subplot(1, 3, 1)
-plt.imshow(cv2.cvtColor(image_before, cv2.COLOR_BGR2RGB))
-plt.title('Before Image')
-plt.axis('off')
+    # Original images
+    plt.subplot(1, 3, 1)
+    plt.imshow(cv2.cvtColor(image_before, cv2.COLOR_BGR2RGB))
+    plt.title('Before Image')
+    plt.axis('off')
 
-plt.subplot(1, 3, 2)
-plt.imshow(cv2.cvtColor(image_after, cv2.COLOR_BGR2RGB))
-plt.title('After Image')
-plt.axis('off')
+    plt.subplot(1, 3, 2)
+    plt.imshow(cv2.cvtColor(image_after, cv2.COLOR_BGR2RGB))
+    plt.title('After Image')
+    plt.axis('off')
 
-# Difference image
-plt.subplot(1, 3, 3)
-plt.imshow(difference, cmap='gray')
-plt.title('Difference (Subtraction)')
-plt.axis('off')
+    # Difference image
+    plt.subplot(1, 3, 3)
+    plt.imshow(difference, cmap='gray')
+    plt.title('Difference (Subtraction)')
+    plt.axis('off')
 
-plt.show()
+    plt.show()
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Load the original image and the watermark image
-image = cv2.imread('/content/1-500x250-3.jpg')
-watermark = cv2.imread('/content/2-500x250-2.jpg', cv2.IMREAD_UNCHANGED)  # Assuming watermark has transparency
-
-# Resize watermark to fit the original image (optional)
-watermark_resized = cv2.resize(watermark, (image.shape[1], image.shape[0]))
-
-# Convert watermark to 3 channels if it has an alpha channel (transparency)
-if watermark_resized.shape[2] == 4:
-    watermark_resized_rgb = cv2.cvtColor(watermark_resized, cv2.COLOR_BGRA2BGR)
-else:
-    watermark_resized_rgb = watermark_resized
-
-# Add watermark to the original image (using simple addition)
-watermarked_image = cv2.addWeighted(image, 1, watermark_resized_rgb, 0.5, 0)
-
-# Display the original image, watermark, resized watermark, watermarked image, and image without watermark
-plt.figure(figsize=(15, 10))
-
-# Original image
-plt.subplot(2, 3, 1)
-plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-plt.title('Original Image')
-plt.axis('off')
-
-# Watermark image
-plt.subplot(2, 3, 2)
-plt.imshow(cv2.cvtColor(watermark_resized, cv2.COLOR_BGRA2RGBA))  # If watermark has transparency
-plt.title('Watermark Image')
-plt.axis('off')
-
-# Resized watermark image
-plt.subplot(2, 3, 3)
-plt.imshow(cv2.cvtColor(watermark_resized_rgb, cv2.COLOR_BGR2RGB))
-plt.title('Resized Watermark')
-plt.axis('off')
-
-# Watermarked image (image with watermark added)
-plt.subplot(2, 3, 4)
-plt.imshow(cv2.cvtColor(watermarked_image, cv2.COLOR_BGR2RGB))
-plt.title('Watermarked Image')
-plt.axis('off')
-
-# Subtract the watermark to reveal the original image
-image_without_watermark = cv2.subtract(watermarked_image, watermark_resized_rgb)
-
-plt.subplot(2, 3, 5)
-plt.imshow(cv2.cvtColor(image_without_watermark, cv2.COLOR_BGR2RGB))
-plt.title('Image Without Watermark')
-plt.axis('off')
-
-plt.tight_layout()
-plt.show()
+from viz import plt
+
+if __name__ == "__main__":
+    # Load the original image and the watermark image
+    image = cv2.imread('/content/1-500x250-3.jpg')
+    watermark = cv2.imread('/content/2-500x250-2.jpg', cv2.IMREAD_UNCHANGED)  # Assuming watermark has transparency
+
+    # Resize watermark to fit the original image (optional)
+    watermark_resized = cv2.resize(watermark, (image.shape[1], image.shape[0]))
+
+    # Convert watermark to 3 channels if it has an alpha channel (transparency)
+    if watermark_resized.shape[2] == 4:
+        watermark_resized_rgb = cv2.cvtColor(watermark_resized, cv2.COLOR_BGRA2BGR)
+    else:
+        watermark_resized_rgb = watermark_resized
+
+    # Add watermark to the original image (using simple addition)
+    watermarked_image = cv2.addWeighted(image, 1, watermark_resized_rgb, 0.5, 0)
+
+    # Display the original image, watermark, resized watermark, watermarked image, and image without watermark
+    plt.figure(figsize=(15, 10))
+
+    # Original image
+    plt.subplot(2, 3, 1)
+    plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    plt.title('Original Image')
+    plt.axis('off')
+
+    # Watermark image
+    plt.subplot(2, 3, 2)
+    plt.imshow(cv2.cvtColor(watermark_resized, cv2.COLOR_BGRA2RGBA))  # If watermark has transparency
+    plt.title('Watermark Image')
+    plt.axis('off')
+
+    # Resized watermark image
+    plt.subplot(2, 3, 3)
+    plt.imshow(cv2.cvtColor(watermark_resized_rgb, cv2.COLOR_BGR2RGB))
+    plt.title('Resized Watermark')
+    plt.axis('off')
+
+    # Watermarked image (image with watermark added)
+    plt.subplot(2, 3, 4)
+    plt.imshow(cv2.cvtColor(watermarked_image, cv2.COLOR_BGR2RGB))
+    plt.title('Watermarked Image')
+    plt.axis('off')
+
+    # Subtract the watermark to reveal the original image
+    image_without_watermark = cv2.subtract(watermarked_image, watermark_resized_rgb)
+
+    plt.subplot(2, 3, 5)
+    plt.imshow(cv2.cvtColor(image_without_watermark, cv2.COLOR_BGR2RGB))
+    plt.title('Image Without Watermark')
+    plt.axis('off')
+
+    plt.tight_layout()
+    plt.show()
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Load a sequence of images
-image1 = cv2.imread('/content/2-500x250-2.jpg')
-image2 = cv2.imread('/content/1-500x250-3.jpg')
-image3 = cv2.imread('/content/2-500x250-2.jpg')
+if __name__ == "__main__":
+    # Load a sequence of images
+    image1 = cv2.imread('/content/2-500x250-2.jpg')
+    image2 = cv2.imread('/content/1-500x250-3.jpg')
+    image3 = cv2.imread('/content/2-500x250-2.jpg')
 
-# Convert images to grayscale (optional, depending on the application)
-image1_gray = cv2.cvtColor(image1, cv2.COLOR_BGR2GRAY)
-image2_gray = cv2.cvtColor(image2, cv2.COLOR_BGR2GRAY)
-image3_gray = cv2.cvtColor(image3, cv2.COLOR_BGR2GRAY)
+    # Convert images to grayscale (optional, depending on the application)
+    image1_gray = cv2.cvtColor(image1, cv2.COLOR_BGR2GRAY)
+    image2_gray = cv2.cvtColor(image2, cv2.COLOR_BGR2GRAY)
+    image3_gray = cv2.cvtColor(image3, cv2.COLOR_BGR2GRAY)
 
-# Stack images
-images = np.stack([image1_gray, image2_gray, image3_gray], axis=0)
+    # Stack images
+    images = np.stack([image1_gray, image2_gray, image3_gray], axis=0)
 
-# Average the images to reduce noise
-averaged_image = np.mean(images, axis=0).astype(np.uint8)
+    # Average the images to reduce noise
+    averaged_image = np.mean(images, axis=0).astype(np.uint8)
 
-# Display the original images and the averaged image
-plt.figure(figsize=(20, 10))
+    # Display the original images and the averaged image
+    plt.figure(figsize=(20, 10))
 
-# Original images
-plt.subplot(1, 4, 1)
-plt.imshow(image1_gray, cmap='gray')
-plt.title('Image 1')
-plt.axis('off')
+    # Original images
+    plt.subplot(1, 4, 1)
+    plt.imshow(image1_gray, cmap='gray')
+    plt.title('Image 1')
+    plt.axis('off')
 
-plt.subplot(1, 4, 2)
-plt.imshow(image2_gray, cmap='gray')
-plt.title('Image 2')
-plt.axis('off')
+    plt.subplot(1, 4, 2)
+    plt.imshow(image2_gray, cmap='gray')
+    plt.title('Image 2')
+    plt.axis('off')
 
-plt.subplot(1, 4, 3)
-plt.imshow(image3_gray, cmap='gray')
-plt.title('Image 3')
-plt.axis('off')
+    plt.subplot(1, 4, 3)
+    plt.imshow(image3_gray, cmap='gray')
+    plt.title('Image 3')
+    plt.axis('off')
 
-# Averaged image
-plt.subplot(1, 4, 4)
-plt.imshow(averaged_image, cmap='gray')
-plt.title('Averaged Image')
-plt.axis('off')
+    # Averaged image
+    plt.subplot(1, 4, 4)
+    plt.imshow(averaged_image, cmap='gray')
+    plt.title('Averaged Image')
+    plt.axis('off')
 
-plt.show()
+    plt.show()
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Load a sequence of images
-image1 = cv2.imread('/content/2-500x250-2.jpg')
-image2 = cv2.imread('/content/1-500x250-3.jpg')
-image3 = cv2.imread('/content/2-500x250-2.jpg')
+if __name__ == "__main__":
+    # Load a sequence of images
+    image1 = cv2.imread('/content/2-500x250-2.jpg')
+    image2 = cv2.imread('/content/1-500x250-3.jpg')
+    image3 = cv2.imread('/content/2-500x250-2.jpg')
 
-# Convert images to grayscale (optional, depending on the application)
-image1_gray = cv2.cvtColor(image1, cv2.COLOR_BGR2GRAY)
-image2_gray = cv2.cvtColor(image2, cv2.COLOR_BGR2GRAY)
-image3_gray = cv2.cvtColor(image3, cv2.COLOR_BGR2GRAY)
+    # Convert images to grayscale (optional, depending on the application)
+    image1_gray = cv2.cvtColor(image1, cv2.COLOR_BGR2GRAY)
+    image2_gray = cv2.cvtColor(image2, cv2.COLOR_BGR2GRAY)
+    image3_gray = cv2.cvtColor(image3, cv2.COLOR_BGR2GRAY)
 
-# Stack images
-images = np.stack([image1_gray, image2_gray, image3_gray], axis=0)
+    # Stack images
+    images = np.stack([image1_gray, image2_gray, image3_gray], axis=0)
 
-# Average the images to reduce noise
-averaged_image = np.mean(images, axis=0).astype(np.uint8)
+    # Average the images to reduce noise
+    averaged_image = np.mean(images, axis=0).astype(np.uint8)
 
-# Display the original images and the averaged image
-plt.figure(figsize=(20, 10))
+    # Display the original images and the averaged image
+    plt.figure(figsize=(20, 10))
 
-# Original images
-plt.subplot(1, 4, 1)
-plt.imshow(image1_gray, cmap='gray')
-plt.title('Image 1')
-plt.axis('off')
+    # Original images
+    plt.subplot(1, 4, 1)
+    plt.imshow(image1_gray, cmap='gray')
+    plt.title('Image 1')
+    plt.axis('off')
 
-plt.subplot(1, 4, 2)
-plt.imshow(image2_gray, cmap='gray')
-plt.title('Image 2')
-plt.axis('off')
+    plt.subplot(1, 4, 2)
+    plt.imshow(image2_gray, cmap='gray')
+    plt.title('Image 2')
+    plt.axis('off')
 
-plt.subplot(1, 4, 3)
-plt.imshow(image3_gray, cmap='gray')
-plt.title('Image 3')
-plt.axis('off')
+    plt.subplot(1, 4, 3)
+    plt.imshow(image3_gray, cmap='gray')
+    plt.title('Image 3')
+    plt.axis('off')
 
-# Averaged image
-plt.subplot(1, 4, 4)
-plt.imshow(averaged_image, cmap='gray')
-plt.title('Averaged Image')
-plt.axis('off')
+    # Averaged image
+    plt.subplot(1, 4, 4)
+    plt.imshow(averaged_image, cmap='gray')
+    plt.title('Averaged Image')
+    plt.axis('off')
 
-plt.show()
+    plt.show()
 
 """Perform Discrete Fourier Transform, Z- transform KL Transform on a gray scale image."""
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.linalg import eigh
+from viz import plt
+from lazy_imports import lazy_function
+
+eigh = lazy_function("scipy.linalg", "eigh")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1073,10 +1135,12 @@ visually and quantitatively using metrics like entropy
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.linalg import eigh
-from skimage.exposure import match_histograms
-from scipy.stats import entropy
+from viz import plt
+from lazy_imports import lazy_function
+
+eigh = lazy_function("scipy.linalg", "eigh")
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
+entropy = lazy_function("scipy.stats", "entropy")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1215,8 +1279,11 @@ world image and evaluate its effectiveness.
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1232,8 +1299,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -1287,8 +1353,11 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1304,8 +1373,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -1361,8 +1429,11 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1378,8 +1449,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -1469,8 +1539,11 @@ image and analyze the results
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1486,8 +1559,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -1617,8 +1689,11 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1634,8 +1709,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -1767,51 +1841,52 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Step 1: Read the image
-image = cv2.imread('/content/56368408-58561980-61c5-11e9-9800-0678dc02b4e7.png', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Step 1: Read the image
+    image = cv2.imread('/content/56368408-58561980-61c5-11e9-9800-0678dc02b4e7.png', cv2.IMREAD_GRAYSCALE)
 
-# Step 2: Log Transformation
-log_image = np.log1p(np.float32(image))
+    # Step 2: Log Transformation
+    log_image = np.log1p(np.float32(image))
 
-# Step 3: Fourier Transform
-dft = cv2.dft(log_image, flags=cv2.DFT_COMPLEX_OUTPUT)
-dft_shift = np.fft.fftshift(dft)
+    # Step 3: Fourier Transform
+    dft = cv2.dft(log_image, flags=cv2.DFT_COMPLEX_OUTPUT)
+    dft_shift = np.fft.fftshift(dft)
 
-# Step 4: Create High-Pass Filter
-rows, cols = image.shape
-crow, ccol = rows // 2, cols // 2
+    # Step 4: Create High-Pass Filter
+    rows, cols = image.shape
+    crow, ccol = rows // 2, cols // 2
 
-# Create a circular high-pass filter
-radius = 30  # Adjust the radius as needed
-mask = np.ones((rows, cols, 2), np.float32)
-cv2.circle(mask, (ccol, crow), radius, (0, 0, 0), -1)
+    # Create a circular high-pass filter
+    radius = 30  # Adjust the radius as needed
+    mask = np.ones((rows, cols, 2), np.float32)
+    cv2.circle(mask, (ccol, crow), radius, (0, 0, 0), -1)
 
-# Step 5: Apply the filter
-filtered_dft = dft_shift * mask
+    # Step 5: Apply the filter
+    filtered_dft = dft_shift * mask
 
-# Step 6: Inverse Fourier Transform
-dft_ishift = np.fft.ifftshift(filtered_dft)
-img_back = cv2.idft(dft_ishift)
-img_back = cv2.magnitude(img_back[:, :, 0], img_back[:, :, 1])
+    # Step 6: Inverse Fourier Transform
+    dft_ishift = np.fft.ifftshift(filtered_dft)
+    img_back = cv2.idft(dft_ishift)
+    img_back = cv2.magnitude(img_back[:, :, 0], img_back[:, :, 1])
 
-# Step 7: Exponential Transformation
-result_image = np.expm1(img_back)
+    # Step 7: Exponential Transformation
+    result_image = np.expm1(img_back)
 
-# Step 8: Normalize the Resulting Image
-result_image = np.uint8(cv2.normalize(result_image, None, 0, 255, cv2.NORM_MINMAX))
+    # Step 8: Normalize the Resulting Image
+    result_image = np.uint8(cv2.normalize(result_image, None, 0, 255, cv2.NORM_MINMAX))
 
-# Step 9: Display the results
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 3, 1), plt.imshow(image, cmap='gray'), plt.title('Original Image')
-plt.subplot(1, 3, 2), plt.imshow(log_image, cmap='gray'), plt.title('Log-Transformed Image')
-plt.subplot(1, 3, 3), plt.imshow(result_image, cmap='gray'), plt.title('Homomorphic Filtered Image')
-plt.show()
+    # Step 9: Display the results
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 3, 1), plt.imshow(image, cmap='gray'), plt.title('Original Image')
+    plt.subplot(1, 3, 2), plt.imshow(log_image, cmap='gray'), plt.title('Log-Transformed Image')
+    plt.subplot(1, 3, 3), plt.imshow(result_image, cmap='gray'), plt.title('Homomorphic Filtered Image')
+    plt.show()
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
 def homomorphic_filtering(image_path):
     # Load image
@@ -1877,14 +1952,18 @@ def homomorphic_filtering(image_path):
 
     plt.show()
 
-# Apply homomorphic filtering to an image with uneven illumination
-image_path = '/content/MainAfter.jpg'  # Replace with your image path
-homomorphic_filtering(image_path)
+if __name__ == "__main__":
+    # Apply homomorphic filtering to an image with uneven illumination
+    image_path = '/content/MainAfter.jpg'  # Replace with your image path
+    homomorphic_filtering(image_path)
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -1900,8 +1979,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -2071,8 +2149,11 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage.exposure import match_histograms
+from viz import plt
+from point_ops import apply_point_op
+from lazy_imports import lazy_function
+
+match_histograms = lazy_function("skimage.exposure", "match_histograms")
 
 # Load a grayscale image
 def load_grayscale_image(image_path):
@@ -2088,8 +2169,7 @@ def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8), gamma=1.2
     enhanced_image = clahe.apply(image)
 
     # 2. Apply Gamma Correction
-    gamma_corrected = np.power(enhanced_image / 255.0, gamma) * 255
-    gamma_corrected = np.clip(gamma_corrected, 0, 255).astype(np.uint8)
+    gamma_corrected = apply_point_op(enhanced_image, "gamma", gamma=gamma)
 
     return gamma_corrected
 
@@ -2259,7 +2339,7 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
 def homomorphic_filtering(image_path):
     # Load image
@@ -2325,64 +2405,66 @@ def homomorphic_filtering(image_path):
 
     plt.show()
 
-# Apply homomorphic filtering to an image with uneven illumination
-image_path = 'your_image_path.jpg'  # Replace with your image path
-homomorphic_filtering(image_path)
+if __name__ == "__main__":
+    # Apply homomorphic filtering to an image with uneven illumination
+    image_path = 'your_image_path.jpg'  # Replace with your image path
+    homomorphic_filtering(image_path)
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Load the image
-image = cv2.imread('/content/56368408-58561980-61c5-11e9-9800-0678dc02b4e7.png', cv2.IMREAD_GRAYSCALE)
-
-# Convert the image to float32 and normalize
-image_float = np.float32(image) + 1.0
-
-# Log transformation to separate illumination and reflectance
-log_image = np.log(image_float)
-
-# Apply Fourier Transform
-f_image = np.fft.fft2(log_image)
-fshift = np.fft.fftshift(f_image)
-
-# Create a high-pass filter (Gaussian filter for low-frequency removal)
-rows, cols = image.shape
-crow, ccol = rows // 2, cols // 2
-d0 = 30  # cutoff frequency
-x = np.arange(0, cols)
-y = np.arange(0, rows)
-X, Y = np.meshgrid(x, y)
-distance = np.sqrt((X - ccol) ** 2 + (Y - crow) ** 2)
-hp_filter = np.exp(-(distance ** 2) / (2 * (d0 ** 2)))
-
-# Apply the filter in the frequency domain
-fshift_hp = fshift * hp_filter
-
-# Inverse FFT to get back to the spatial domain
-f_ishift = np.fft.ifftshift(fshift_hp)
-image_hp = np.fft.ifft2(f_ishift)
-image_hp = np.real(image_hp)
-
-# Exponentiate to reverse the log transformation
-image_result = np.exp(image_hp) - 1.0
-
-# Normalize the image to be in range [0, 255]
-image_result = np.uint8(np.clip(image_result, 0, 255))
-
-# Display the original and filtered images
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.subplot(1, 2, 2)
-plt.imshow(image_result, cmap='gray')
-plt.title('Filtered Image')
-plt.show()
+from viz import plt
+
+if __name__ == "__main__":
+    # Load the image
+    image = cv2.imread('/content/56368408-58561980-61c5-11e9-9800-0678dc02b4e7.png', cv2.IMREAD_GRAYSCALE)
+
+    # Convert the image to float32 and normalize
+    image_float = np.float32(image) + 1.0
+
+    # Log transformation to separate illumination and reflectance
+    log_image = np.log(image_float)
+
+    # Apply Fourier Transform
+    f_image = np.fft.fft2(log_image)
+    fshift = np.fft.fftshift(f_image)
+
+    # Create a high-pass filter (Gaussian filter for low-frequency removal)
+    rows, cols = image.shape
+    crow, ccol = rows // 2, cols // 2
+    d0 = 30  # cutoff frequency
+    x = np.arange(0, cols)
+    y = np.arange(0, rows)
+    X, Y = np.meshgrid(x, y)
+    distance = np.sqrt((X - ccol) ** 2 + (Y - crow) ** 2)
+    hp_filter = np.exp(-(distance ** 2) / (2 * (d0 ** 2)))
+
+    # Apply the filter in the frequency domain
+    fshift_hp = fshift * hp_filter
+
+    # Inverse FFT to get back to the spatial domain
+    f_ishift = np.fft.ifftshift(fshift_hp)
+    image_hp = np.fft.ifft2(f_ishift)
+    image_hp = np.real(image_hp)
+
+    # Exponentiate to reverse the log transformation
+    image_result = np.exp(image_hp) - 1.0
+
+    # Normalize the image to be in range [0, 255]
+    image_result = np.uint8(np.clip(image_result, 0, 255))
+
+    # Display the original and filtered images
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.subplot(1, 2, 2)
+    plt.imshow(image_result, cmap='gray')
+    plt.title('Filtered Image')
+    plt.show()
 
 import numpy as np
 import cv2
-import matplotlib.pyplot as plt
+from viz import plt
 
 # Function for RGB to HSI conversion
 def rgb_to_hsi(rgb_image):
@@ -2459,51 +2541,52 @@ def ycbcr_to_rgb(ycbcr_image):
 
     return np.stack((r, g, b), axis=-1)
 
-# Load an example image (replace 'your_image.jpg' with your image file)
-image = cv2.imread('/content/images (6).jpeg')
+if __name__ == "__main__":
+    # Load an example image (replace 'your_image.jpg' with your image file)
+    image = cv2.imread('/content/images (6).jpeg')
 
-# Convert to RGB (OpenCV loads images in BGR by default)
-image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    # Convert to RGB (OpenCV loads images in BGR by default)
+    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-# Perform the color space conversions
-hsi_image = rgb_to_hsi(image_rgb)
-ycbcr_image = rgb_to_ycbcr(image_rgb)
+    # Perform the color space conversions
+    hsi_image = rgb_to_hsi(image_rgb)
+    ycbcr_image = rgb_to_ycbcr(image_rgb)
 
-# Convert back to RGB from HSI and YCbCr
-image_rgb_from_hsi = hsi_to_rgb(hsi_image)
-image_rgb_from_ycbcr = ycbcr_to_rgb(ycbcr_image)
+    # Convert back to RGB from HSI and YCbCr
+    image_rgb_from_hsi = hsi_to_rgb(hsi_image)
+    image_rgb_from_ycbcr = ycbcr_to_rgb(ycbcr_image)
 
-# Display the results
-plt.figure(figsize=(10, 10))
+    # Display the results
+    plt.figure(figsize=(10, 10))
 
-plt.subplot(2, 3, 1)
-plt.imshow(image_rgb)
-plt.title('Original RGB Image')
+    plt.subplot(2, 3, 1)
+    plt.imshow(image_rgb)
+    plt.title('Original RGB Image')
 
-plt.subplot(2, 3, 2)
-plt.imshow(hsi_image)
-plt.title('HSI Image')
+    plt.subplot(2, 3, 2)
+    plt.imshow(hsi_image)
+    plt.title('HSI Image')
 
-plt.subplot(2, 3, 3)
-plt.imshow(ycbcr_image)
-plt.title('YCbCr Image')
+    plt.subplot(2, 3, 3)
+    plt.imshow(ycbcr_image)
+    plt.title('YCbCr Image')
 
-plt.subplot(2, 3, 4)
-plt.imshow(image_rgb_from_hsi)
-plt.title('RGB from HSI')
+    plt.subplot(2, 3, 4)
+    plt.imshow(image_rgb_from_hsi)
+    plt.title('RGB from HSI')
 
-plt.subplot(2, 3, 5)
-plt.imshow(image_rgb_from_ycbcr)
-plt.title('RGB from YCbCr')
+    plt.subplot(2, 3, 5)
+    plt.imshow(image_rgb_from_ycbcr)
+    plt.title('RGB from YCbCr')
 
-plt.show()
+    plt.show()
 
 """Perform color histogram equalization on a color image and analyze the results."""
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from google.colab.patches import cv2_imshow
+from viz import plt
+from viz import cv2_imshow
 
 def histogram_equalization_color(image):
     # Convert the image from BGR to HSV color space
@@ -2570,7 +2653,7 @@ if __name__ == "__main__":
 
 import cv2
 import numpy as np
-from google.colab.patches import cv2_imshow
+from viz import cv2_imshow
 
 def sobel_edge_detection(image):
     # Convert the image to grayscale
@@ -2626,11 +2709,12 @@ techniques.
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Read the image
-image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_COLOR)
-gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+if __name__ == "__main__":
+    # Read the image
+    image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_COLOR)
+    gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
 # Thresholding Segmentation
 def thresholding_segmentation(image):
@@ -2681,53 +2765,55 @@ def edge_based_segmentation(image):
 
     return edges
 
-# Apply Thresholding Segmentation
-thresholded_image = thresholding_segmentation(gray_image)
+if __name__ == "__main__":
+    # Apply Thresholding Segmentation
+    thresholded_image = thresholding_segmentation(gray_image)
+
+    # Apply Region-based Segmentation
+    region_based_image = region_based_segmentation(image.copy())
 
-# Apply Region-based Segmentation
-region_based_image = region_based_segmentation(image.copy())
+    # Apply Edge-based Segmentation
+    edge_based_image = edge_based_segmentation(image)
 
-# Apply Edge-based Segmentation
-edge_based_image = edge_based_segmentation(image)
+    # Plotting the results
+    plt.figure(figsize=(12, 8))
 
-# Plotting the results
-plt.figure(figsize=(12, 8))
+    # Original Image
+    plt.subplot(2, 2, 1)
+    plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    plt.title("Original Image")
+    plt.axis('off')
 
-# Original Image
-plt.subplot(2, 2, 1)
-plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-plt.title("Original Image")
-plt.axis('off')
+    # Thresholding Segmentation
+    plt.subplot(2, 2, 2)
+    plt.imshow(thresholded_image, cmap='gray')
+    plt.title("Thresholding Segmentation")
+    plt.axis('off')
 
-# Thresholding Segmentation
-plt.subplot(2, 2, 2)
-plt.imshow(thresholded_image, cmap='gray')
-plt.title("Thresholding Segmentation")
-plt.axis('off')
-
-# Region-based Segmentation
-plt.subplot(2, 2, 3)
-plt.imshow(cv2.cvtColor(region_based_image, cv2.COLOR_BGR2RGB))
-plt.title("Region-based Segmentation")
-plt.axis('off')
-
-# Edge-based Segmentation
-plt.subplot(2, 2, 4)
-plt.imshow(edge_based_image, cmap='gray')
-plt.title("Edge-based Segmentation (Canny)")
-plt.axis('off')
-
-# Show the segmented images
-plt.tight_layout()
-plt.show()
+    # Region-based Segmentation
+    plt.subplot(2, 2, 3)
+    plt.imshow(cv2.cvtColor(region_based_image, cv2.COLOR_BGR2RGB))
+    plt.title("Region-based Segmentation")
+    plt.axis('off')
+
+    # Edge-based Segmentation
+    plt.subplot(2, 2, 4)
+    plt.imshow(edge_based_image, cmap='gray')
+    plt.title("Edge-based Segmentation (Canny)")
+    plt.axis('off')
+
+    # Show the segmented images
+    plt.tight_layout()
+    plt.show()
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Read the image
-image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_COLOR)
-gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+if __name__ == "__main__":
+    # Read the image
+    image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_COLOR)
+    gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
 # Thresholding Segmentation
 def thresholding_segmentation(image):
@@ -2784,84 +2870,86 @@ def edge_based_segmentation(image):
 
     return edges
 
-# Apply Thresholding Segmentation
-thresholded_image = thresholding_segmentation(gray_image)
+if __name__ == "__main__":
+    # Apply Thresholding Segmentation
+    thresholded_image = thresholding_segmentation(gray_image)
 
-# Apply Region-based Segmentation
-region_based_image = region_based_segmentation(image.copy())
+    # Apply Region-based Segmentation
+    region_based_image = region_based_segmentation(image.copy())
 
-# Apply Edge-based Segmentation
-edge_based_image = edge_based_segmentation(image)
+    # Apply Edge-based Segmentation
+    edge_based_image = edge_based_segmentation(image)
 
-# Plotting the results
-plt.figure(figsize=(12, 8))
+    # Plotting the results
+    plt.figure(figsize=(12, 8))
 
-# Original Image
-plt.subplot(2, 2, 1)
-plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-plt.title("Original Image")
-plt.axis('off')
+    # Original Image
+    plt.subplot(2, 2, 1)
+    plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    plt.title("Original Image")
+    plt.axis('off')
 
-# Thresholding Segmentation
-plt.subplot(2, 2, 2)
-plt.imshow(thresholded_image, cmap='gray')
-plt.title("Thresholding Segmentation")
-plt.axis('off')
-
-# Region-based Segmentation
-plt.subplot(2, 2, 3)
-plt.imshow(cv2.cvtColor(region_based_image, cv2.COLOR_BGR2RGB))
-plt.title("Region-based Segmentation")
-plt.axis('off')
-
-# Edge-based Segmentation
-plt.subplot(2, 2, 4)
-plt.imshow(edge_based_image, cmap='gray')
-plt.title("Edge-based Segmentation (Canny)")
-plt.axis('off')
-
-# Show the segmented images
-plt.tight_layout()
-plt.show()
+    # Thresholding Segmentation
+    plt.subplot(2, 2, 2)
+    plt.imshow(thresholded_image, cmap='gray')
+    plt.title("Thresholding Segmentation")
+    plt.axis('off')
+
+    # Region-based Segmentation
+    plt.subplot(2, 2, 3)
+    plt.imshow(cv2.cvtColor(region_based_image, cv2.COLOR_BGR2RGB))
+    plt.title("Region-based Segmentation")
+    plt.axis('off')
+
+    # Edge-based Segmentation
+    plt.subplot(2, 2, 4)
+    plt.imshow(edge_based_image, cmap='gray')
+    plt.title("Edge-based Segmentation (Canny)")
+    plt.axis('off')
+
+    # Show the segmented images
+    plt.tight_layout()
+    plt.show()
 
 import cv2
 import numpy as np
-from google.colab.patches import cv2_imshow
+from viz import cv2_imshow
 
-# Load the image
-image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load the image
+    image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_GRAYSCALE)
 
-# Check if the image is loaded successfully
-if image is None:
-    print("Error: Image not found.")
-    exit()
+    # Check if the image is loaded successfully
+    if image is None:
+        print("Error: Image not found.")
+        exit()
 
-# --- 1. Thresholding Segmentation ---
-# Apply global thresholding
-_, thresholded_image = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
+    # --- 1. Thresholding Segmentation ---
+    # Apply global thresholding
+    _, thresholded_image = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
 
-# Show thresholded image
-cv2_imshow(thresholded_image)
+    # Show thresholded image
+    cv2_imshow(thresholded_image)
 
-# --- 2. Region-Based Segmentation ---
-# Apply binary thresholding first to create a binary image
-_, binary_image = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
+    # --- 2. Region-Based Segmentation ---
+    # Apply binary thresholding first to create a binary image
+    _, binary_image = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
 
-# Find connected components (regions)
-num_labels, labels = cv2.connectedComponents(binary_image)
+    # Find connected components (regions)
+    num_labels, labels = cv2.connectedComponents(binary_image)
 
-# Convert labels to a displayable format (scaling them for visualization)
-segmented_image = np.uint8(labels * 255 / num_labels)
+    # Convert labels to a displayable format (scaling them for visualization)
+    segmented_image = np.uint8(labels * 255 / num_labels)
 
-# Show region-based segmentation result
-cv2_imshow(segmented_image)
+    # Show region-based segmentation result
+    cv2_imshow(segmented_image)
 
-# --- 3. Edge-Based Segmentation ---
-# Apply the Canny edge detection algorithm
-edges = cv2.Canny(image, 100, 200)
+    # --- 3. Edge-Based Segmentation ---
+    # Apply the Canny edge detection algorithm
+    edges = cv2.Canny(image, 100, 200)
 
-# Show edge-based segmentation result
-cv2_imshow(edges)
+    # Show edge-based segmentation result
+    cv2_imshow(edges)
 
 """mage Morphological Processing: Perform erosion, dilation, opening, and closing operations
 on binary images.
@@ -2869,189 +2957,193 @@ on binary images.
 
 import cv2
 import numpy as np
-from google.colab.patches import cv2_imshow
+from viz import cv2_imshow
 
-# Load the image in grayscale
-image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load the image in grayscale
+    image = cv2.imread('/content/images (6).jpeg', cv2.IMREAD_GRAYSCALE)
 
-# Check if the image is loaded successfully
-if image is None:
-    print("Error: Image not found.")
-    exit()
+    # Check if the image is loaded successfully
+    if image is None:
+        print("Error: Image not found.")
+        exit()
 
-# Convert the image to a binary image using thresholding
-_, binary_image = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
+    # Convert the image to a binary image using thresholding
+    _, binary_image = cv2.threshold(image, 127, 255, cv2.THRESH_BINARY)
 
-# --- 1. Erosion ---
-# Erosion operation reduces the boundaries of the foreground object in the image
-kernel = np.ones((5, 5), np.uint8)  # 5x5 kernel
-eroded_image = cv2.erode(binary_image, kernel, iterations=1)
+    # --- 1. Erosion ---
+    # Erosion operation reduces the boundaries of the foreground object in the image
+    kernel = np.ones((5, 5), np.uint8)  # 5x5 kernel
+    eroded_image = cv2.erode(binary_image, kernel, iterations=1)
 
-# Show the result of erosion
-cv2_imshow(eroded_image)
+    # Show the result of erosion
+    cv2_imshow(eroded_image)
 
-# --- 2. Dilation ---
-# Dilation operation increases the boundaries of the foreground object in the image
-dilated_image = cv2.dilate(binary_image, kernel, iterations=1)
+    # --- 2. Dilation ---
+    # Dilation operation increases the boundaries of the foreground object in the image
+    dilated_image = cv2.dilate(binary_image, kernel, iterations=1)
 
-# Show the result of dilation
-cv2_imshow(dilated_image)
+    # Show the result of dilation
+    cv2_imshow(dilated_image)
 
-# --- 3. Opening ---
-# Opening operation is erosion followed by dilation, useful for removing small noise
-opened_image = cv2.morphologyEx(binary_image, cv2.MORPH_OPEN, kernel)
+    # --- 3. Opening ---
+    # Opening operation is erosion followed by dilation, useful for removing small noise
+    opened_image = cv2.morphologyEx(binary_image, cv2.MORPH_OPEN, kernel)
 
-# Show the result of opening
-cv2_imshow(opened_image)
+    # Show the result of opening
+    cv2_imshow(opened_image)
 
-# --- 4. Closing ---
-# Closing operation is dilation followed by erosion, useful for closing small holes inside the object
-closed_image = cv2.morphologyEx(binary_image, cv2.MORPH_CLOSE, kernel)
+    # --- 4. Closing ---
+    # Closing operation is dilation followed by erosion, useful for closing small holes inside the object
+    closed_image = cv2.morphologyEx(binary_image, cv2.MORPH_CLOSE, kernel)
 
-# Show the result of closing
-cv2_imshow(closed_image)
+    # Show the result of closing
+    cv2_imshow(closed_image)
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Load a binary image
-image = cv2.imread('/content/download-(6).png', cv2.IMREAD_GRAYSCALE)
+from viz import plt
 
-# Create a kernel for morphological operations
-kernel = np.ones((5, 5), np.uint8)
+if __name__ == "__main__":
+    # Load a binary image
+    image = cv2.imread('/content/download-(6).png', cv2.IMREAD_GRAYSCALE)
 
-# Perform morphological operations
-erosion = cv2.erode(image, kernel, iterations=1)
-dilation = cv2.dilate(image, kernel, iterations=1)
-opening = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
-closing = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
+    # Create a kernel for morphological operations
+    kernel = np.ones((5, 5), np.uint8)
 
-# Display results
-titles = ['Original Image', 'Erosion', 'Dilation', 'Opening', 'Closing']
-images = [image, erosion, dilation, opening, closing]
+    # Perform morphological operations
+    erosion = cv2.erode(image, kernel, iterations=1)
+    dilation = cv2.dilate(image, kernel, iterations=1)
+    opening = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
+    closing = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
 
-plt.figure(figsize=(10, 8))
-for i in range(5):
-    plt.subplot(2, 3, i + 1)
-    plt.imshow(images[i], cmap='gray')
-    plt.title(titles[i])
-    plt.axis('off')
+    # Display results
+    titles = ['Original Image', 'Erosion', 'Dilation', 'Opening', 'Closing']
+    images = [image, erosion, dilation, opening, closing]
+
+    plt.figure(figsize=(10, 8))
+    for i in range(5):
+        plt.subplot(2, 3, i + 1)
+        plt.imshow(images[i], cmap='gray')
+        plt.title(titles[i])
+        plt.axis('off')
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
 
 """Image Registration: Implement image registration techniques for aligning multiple images"""
 
 import cv2
 import numpy as np
-from google.colab.patches import cv2_imshow  # For displaying images in Colab
+from viz import cv2_imshow  # For displaying images in Colab
 
-# Load reference (fixed) and moving images in grayscale
-ref_image = cv2.imread('/content/im1-copy.png', cv2.IMREAD_GRAYSCALE)
-moving_image = cv2.imread('/content/im2-copy.png', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load reference (fixed) and moving images in grayscale
+    ref_image = cv2.imread('/content/im1-copy.png', cv2.IMREAD_GRAYSCALE)
+    moving_image = cv2.imread('/content/im2-copy.png', cv2.IMREAD_GRAYSCALE)
 
-# Check if images are loaded properly
-if ref_image is None or moving_image is None:
-    print("Error: Unable to load images.")
-    exit()
+    # Check if images are loaded properly
+    if ref_image is None or moving_image is None:
+        print("Error: Unable to load images.")
+        exit()
 
-# Step 1: Detect ORB keypoints and descriptors
-orb = cv2.ORB_create()
-keypoints1, descriptors1 = orb.detectAndCompute(ref_image, None)
-keypoints2, descriptors2 = orb.detectAndCompute(moving_image, None)
+    # Step 1: Detect ORB keypoints and descriptors
+    orb = cv2.ORB_create()
+    keypoints1, descriptors1 = orb.detectAndCompute(ref_image, None)
+    keypoints2, descriptors2 = orb.detectAndCompute(moving_image, None)
 
-# Step 2: Match features using BFMatcher with Hamming distance
-bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
-matches = bf.match(descriptors1, descriptors2)
+    # Step 2: Match features using BFMatcher with Hamming distance
+    bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
+    matches = bf.match(descriptors1, descriptors2)
 
-# Sort matches by distance
-matches = sorted(matches, key=lambda x: x.distance)
+    # Sort matches by distance
+    matches = sorted(matches, key=lambda x: x.distance)
 
-# Draw matches for visualization (optional)
-matched_image = cv2.drawMatches(ref_image, keypoints1, moving_image, keypoints2, matches[:10], None, flags=2)
-cv2_imshow(matched_image)  # Use cv2_imshow to display the matches
+    # Draw matches for visualization (optional)
+    matched_image = cv2.drawMatches(ref_image, keypoints1, moving_image, keypoints2, matches[:10], None, flags=2)
+    cv2_imshow(matched_image)  # Use cv2_imshow to display the matches
 
-# Step 3: Extract matched keypoints
-src_pts = np.float32([keypoints1[m.queryIdx].pt for m in matches]).reshape(-1, 1, 2)
-dst_pts = np.float32([keypoints2[m.trainIdx].pt for m in matches]).reshape(-1, 1, 2)
+    # Step 3: Extract matched keypoints
+    src_pts = np.float32([keypoints1[m.queryIdx].pt for m in matches]).reshape(-1, 1, 2)
+    dst_pts = np.float32([keypoints2[m.trainIdx].pt for m in matches]).reshape(-1, 1, 2)
 
-# Step 4: Estimate Homography matrix
-homography_matrix, mask = cv2.findHomography(dst_pts, src_pts, cv2.RANSAC, 5.0)
+    # Step 4: Estimate Homography matrix
+    homography_matrix, mask = cv2.findHomography(dst_pts, src_pts, cv2.RANSAC, 5.0)
 
-# Step 5: Warp the moving image using the homography matrix
-aligned_image = cv2.warpPerspective(moving_image, homography_matrix, (ref_image.shape[1], ref_image.shape[0]))
+    # Step 5: Warp the moving image using the homography matrix
+    aligned_image = cv2.warpPerspective(moving_image, homography_matrix, (ref_image.shape[1], ref_image.shape[0]))
 
-# Step 6: Display results
-cv2_imshow(ref_image)  # Display reference image
-cv2_imshow(aligned_image)  # Display aligned image
+    # Step 6: Display results
+    cv2_imshow(ref_image)  # Display reference image
+    cv2_imshow(aligned_image)  # Display aligned image
 
-# Save the aligned image
-cv2.imwrite('aligned_image.jpg', aligned_image)
-print("Aligned image saved as 'aligned_image.jpg'")
+    # Save the aligned image
+    cv2.imwrite('aligned_image.jpg', aligned_image)
+    print("Aligned image saved as 'aligned_image.jpg'")
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
 
-# Load the images
-image1 = cv2.imread('/content/im1-copy.png', cv2.IMREAD_GRAYSCALE)
-image2 = cv2.imread('/content/im2-copy.png', cv2.IMREAD_GRAYSCALE)
+if __name__ == "__main__":
+    # Load the images
+    image1 = cv2.imread('/content/im1-copy.png', cv2.IMREAD_GRAYSCALE)
+    image2 = cv2.imread('/content/im2-copy.png', cv2.IMREAD_GRAYSCALE)
 
-# Initialize SIFT detector
-sift = cv2.SIFT_create()
+    # Initialize SIFT detector
+    sift = cv2.SIFT_create()
 
-# Detect keypoints and descriptors
-kp1, des1 = sift.detectAndCompute(image1, None)
-kp2, des2 = sift.detectAndCompute(image2, None)
+    # Detect keypoints and descriptors
+    kp1, des1 = sift.detectAndCompute(image1, None)
+    kp2, des2 = sift.detectAndCompute(image2, None)
 
-# Create a FLANN based matcher (Fast Library for Approximate Nearest Neighbors)
-index_params = dict(algorithm=1, trees=10)
-search_params = dict(checks=50)
+    # Create a FLANN based matcher (Fast Library for Approximate Nearest Neighbors)
+    index_params = dict(algorithm=1, trees=10)
+    search_params = dict(checks=50)
 
-flann = cv2.FlannBasedMatcher(index_params, search_params)
+    flann = cv2.FlannBasedMatcher(index_params, search_params)
 
-# Perform knn matching
-matches = flann.knnMatch(des1, des2, k=2)
+    # Perform knn matching
+    matches = flann.knnMatch(des1, des2, k=2)
 
-# Apply ratio test (Lowe's ratio test)
-good_matches = []
-for m, n in matches:
-    if m.distance < 0.7 * n.distance:
-        good_matches.append(m)
+    # Apply ratio test (Lowe's ratio test)
+    good_matches = []
+    for m, n in matches:
+        if m.distance < 0.7 * n.distance:
+            good_matches.append(m)
 
-# Draw the matches
-img_matches = cv2.drawMatches(image1, kp1, image2, kp2, good_matches, None, flags=cv2.DrawMatchesFlags_NOT_DRAW_SINGLE_POINTS)
+    # Draw the matches
+    img_matches = cv2.drawMatches(image1, kp1, image2, kp2, good_matches, None, flags=cv2.DrawMatchesFlags_NOT_DRAW_SINGLE_POINTS)
 
-# Display the matching results
-plt.figure(figsize=(10, 5))
-plt.imshow(img_matches)
-plt.title('Feature Matching')
-plt.show()
+    # Display the matching results
+    plt.figure(figsize=(10, 5))
+    plt.imshow(img_matches)
+    plt.title('Feature Matching')
+    plt.show()
 
-# Extract location of good matches
-points1 = np.zeros((len(good_matches), 2), dtype=np.float32)
-points2 = np.zeros((len(good_matches), 2), dtype=np.float32)
+    # Extract location of good matches
+    points1 = np.zeros((len(good_matches), 2), dtype=np.float32)
+    points2 = np.zeros((len(good_matches), 2), dtype=np.float32)
 
-for i, match in enumerate(good_matches):
-    points1[i] = kp1[match.queryIdx].pt
-    points2[i] = kp2[match.trainIdx].pt
+    for i, match in enumerate(good_matches):
+        points1[i] = kp1[match.queryIdx].pt
+        points2[i] = kp2[match.trainIdx].pt
 
-# Compute homography (transformation matrix)
-H, mask = cv2.findHomography(points1, points2, cv2.RANSAC, 5.0)
+    # Compute homography (transformation matrix)
+    H, mask = cv2.findHomography(points1, points2, cv2.RANSAC, 5.0)
 
-# Warp image2 to align with image1
-height, width = image1.shape
-im2_aligned = cv2.warpPerspective(image2, H, (width, height))
+    # Warp image2 to align with image1
+    height, width = image1.shape
+    im2_aligned = cv2.warpPerspective(image2, H, (width, height))
 
-# Show the result
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image1, cmap='gray')
-plt.title('Image 1')
+    # Show the result
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image1, cmap='gray')
+    plt.title('Image 1')
 
-plt.subplot(1, 2, 2)
-plt.imshow(im2_aligned, cmap='gray')
-plt.title('Aligned Image 2')
+    plt.subplot(1, 2, 2)
+    plt.imshow(im2_aligned, cmap='gray')
+    plt.title('Aligned Image 2')
 
-plt.show()
\ No newline at end of file
+    plt.show()
\ No newline at end of file
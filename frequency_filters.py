@@ -0,0 +1,207 @@
+import functools
+
+import numpy as np
+
+# Filter families and shapes understood by frequency_mask
+FILTER_KINDS = ("ideal", "butterworth", "gaussian")
+FILTER_TYPES = ("low-pass", "high-pass", "band-pass")
+
+
+# --- 1. Radial Distance Grid ---
+@functools.lru_cache(maxsize=4)
+def _squared_distance_grid(shape, center):
+    rows, cols = shape
+    crow, ccol = center
+    u = np.arange(rows, dtype=np.float32) - np.float32(crow)
+    v = np.arange(cols, dtype=np.float32) - np.float32(ccol)
+    grid = u[:, None] ** 2 + v[None, :] ** 2
+    grid.setflags(write=False)
+    return grid
+
+
+def squared_distance_grid(shape, center=None):
+    """
+    Squared distance of every frequency sample from the spectrum centre.
+
+    The grid is built with two broadcast 1-D ramps instead of a per-pixel
+    loop and is cached per (shape, centre), so every mask of the same size
+    reuses it.
+
+    Parameters:
+        shape (tuple): (rows, cols) of the (shifted) spectrum.
+        center (tuple): (row, col) of the zero frequency. Defaults to
+            (rows // 2, cols // 2), matching np.fft.fftshift.
+
+    Returns:
+        numpy.ndarray: Read-only float32 array of shape (rows, cols).
+    """
+    rows, cols = shape[:2]
+    if center is None:
+        center = (rows // 2, cols // 2)
+    return _squared_distance_grid((int(rows), int(cols)), tuple(center))
+
+
+# --- 2. Mask Builders ---
+def _ideal(d2, filter_type, d0, w):
+    if filter_type == "low-pass":
+        return d2 <= d0 ** 2
+    if filter_type == "high-pass":
+        return d2 > d0 ** 2
+    low, high = d0 - w / 2, d0 + w / 2
+    inside = d2 < high ** 2
+    if low >= 0:
+        inside &= d2 > low ** 2
+    return inside
+
+
+def _butterworth(d2, filter_type, d0, w, order):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if filter_type == "band-pass":
+            ratio = (np.sqrt(d2) * w) / (d2 - d0 ** 2)
+            return 1 - 1 / (1 + ratio ** (2 * order))
+        low_pass = 1 / (1 + (d2 / d0 ** 2) ** order)
+    return low_pass if filter_type == "low-pass" else 1 - low_pass
+
+
+def _gaussian(d2, filter_type, d0, w):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if filter_type == "band-pass":
+            return np.exp(-((d2 - d0 ** 2) / (np.sqrt(d2) * w)) ** 2)
+        low_pass = np.exp(-d2 / (2 * d0 ** 2))
+    return low_pass if filter_type == "low-pass" else 1 - low_pass
+
+
+@functools.lru_cache(maxsize=16)
+def _build_mask(shape, filter_type, d0, w, order, kind, center):
+    d2 = squared_distance_grid(shape, center)
+    if kind == "ideal":
+        mask = _ideal(d2, filter_type, d0, w)
+    elif kind == "butterworth":
+        mask = _butterworth(d2, filter_type, d0, w, order)
+    else:
+        mask = _gaussian(d2, filter_type, d0, w)
+    mask = mask.astype(np.float32, copy=False)
+    mask.setflags(write=False)
+    return mask
+
+
+def frequency_mask(shape, filter_type, d0, w=10, order=2, kind="ideal", center=None):
+    """
+    Build a centred low-, high- or band-pass transfer function.
+
+    Masks are memoized in an LRU cache keyed by (shape, type, d0, w, order,
+    kind, centre), so a batch of same-sized frames pays the build cost once.
+    The returned array is shared between callers and therefore read-only;
+    copy it before modifying.
+
+    Parameters:
+        shape (tuple): (rows, cols) of the shifted spectrum.
+        filter_type (str): "low-pass", "high-pass" or "band-pass".
+        d0 (float): Cutoff (or band centre) radius in frequency samples.
+        w (float): Band width, used by "band-pass" only.
+        order (int): Butterworth order, used by kind="butterworth" only.
+        kind (str): "ideal", "butterworth" or "gaussian".
+        center (tuple): (row, col) of the zero frequency.
+
+    Returns:
+        numpy.ndarray: Read-only float32 mask of shape (rows, cols).
+    """
+    if filter_type not in FILTER_TYPES:
+        raise ValueError(f"Unknown filter type: {filter_type!r}")
+    if kind not in FILTER_KINDS:
+        raise ValueError(f"Unknown filter kind: {kind!r}")
+    if d0 <= 0:
+        raise ValueError("Cutoff radius d0 must be positive.")
+
+    rows, cols = shape[:2]
+    if center is None:
+        center = (rows // 2, cols // 2)
+    if kind != "butterworth":
+        order = None  # Keep cache keys for ideal/gaussian masks independent of order
+    if filter_type != "band-pass":
+        w = None
+    return _build_mask((int(rows), int(cols)), filter_type, float(d0),
+                       None if w is None else float(w), order, kind, tuple(center))
+
+
+# --- 3. Homomorphic Filtering ---
+class HomomorphicPlan:
+    """
+    Precomputed homomorphic filter for frames of a fixed shape.
+
+    The Gaussian high-emphasis transfer function
+    H = (gamma_high - gamma_low) * (1 - exp(-c * D^2 / d0^2)) + gamma_low
+    is built once, directly in unshifted half-spectrum layout, so applying
+    it needs only a real-input FFT pair and no fftshift/ifftshift.
+
+    Parameters:
+        shape (tuple): (rows, cols) of the frames to be filtered.
+        gamma_low (float): Gain applied to low frequencies (illumination).
+        gamma_high (float): Gain applied to high frequencies (reflectance).
+        c (float): Sharpness of the transition between the two gains.
+        d0 (float): Cutoff radius in frequency samples.
+    """
+
+    def __init__(self, shape, gamma_low=0.5, gamma_high=1.5, c=1, d0=50):
+        if d0 <= 0:
+            raise ValueError("Cutoff radius d0 must be positive.")
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.gamma_low = gamma_low
+        self.gamma_high = gamma_high
+        self.c = c
+        self.d0 = d0
+
+        rows, cols = self.shape
+        u = np.fft.fftfreq(rows, 1 / rows).astype(np.float32)
+        v = np.fft.rfftfreq(cols, 1 / cols).astype(np.float32)
+        d2 = u[:, None] ** 2 + v[None, :] ** 2
+        transfer = (gamma_high - gamma_low) * (1 - np.exp(-c * (d2 / d0 ** 2))) + gamma_low
+        self.transfer = transfer.astype(np.float32)
+        self.transfer.setflags(write=False)
+
+    def _filter(self, frames):
+        spectrum = np.fft.rfft2(np.log1p(frames, dtype=np.float32))
+        spectrum *= self.transfer
+        result = np.expm1(np.fft.irfft2(spectrum, s=self.shape))
+        return np.clip(result, 0, 255, out=result).astype(np.uint8)
+
+    def apply(self, frame):
+        """
+        Filter a single frame.
+
+        Parameters:
+            frame (numpy.ndarray): Grayscale image of shape self.shape.
+
+        Returns:
+            numpy.ndarray: Filtered uint8 image.
+        """
+        if frame.shape != self.shape:
+            raise ValueError(f"Expected frame of shape {self.shape}, got {frame.shape}.")
+        return self._filter(frame)
+
+    def apply_batch(self, stack):
+        """
+        Filter a stack of frames with one batched FFT pair.
+
+        Parameters:
+            stack (numpy.ndarray): Array of shape (N, rows, cols).
+
+        Returns:
+            numpy.ndarray: Filtered uint8 stack of shape (N, rows, cols).
+        """
+        if stack.ndim != 3 or stack.shape[1:] != self.shape:
+            raise ValueError(f"Expected stack of shape (N, {self.shape[0]}, {self.shape[1]}), got {stack.shape}.")
+        return self._filter(stack)
+
+
+@functools.lru_cache(maxsize=8)
+def homomorphic_plan(shape, gamma_low=0.5, gamma_high=1.5, c=1, d0=50):
+    """Return a cached HomomorphicPlan for the given shape and parameters."""
+    return HomomorphicPlan(shape, gamma_low, gamma_high, c, d0)
+
+
+def clear_mask_cache():
+    """Drop all cached distance grids, masks and homomorphic plans."""
+    homomorphic_plan.cache_clear()
+    _build_mask.cache_clear()
+    _squared_distance_grid.cache_clear()
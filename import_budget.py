@@ -0,0 +1,95 @@
+"""
+Import-time benchmark for the lab modules.
+
+Each module is imported in a fresh interpreter several times; the best
+wall time is compared against a budget, and the heavy optional
+dependencies (sklearn, skimage, scipy, matplotlib, PIL) must not have
+been loaded by the import. Exits with status 1 if any module breaks
+either rule, so it can guard the cold-start budget in CI or before a
+worker image is rolled out.
+
+Usage:
+    python import_budget.py                   # all lab modules, default budget
+    python import_budget.py --budget-ms 150 lab2_b dip_lab
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Modules that make up the library layer
+DEFAULT_MODULES = [
+    "lab1_A", "lab1_b", "lab1_c", "lab1_d", "lab1_e",
+    "lab2_a", "lab2_b", "lab2_c", "lab2_d",
+    "Imageenhancement", "Imagemorphologicalprocessing", "Imageregistration", "Imagesegmenation",
+    "dip", "dip_lab", "frequency_filters", "klt", "point_ops", "viz",
+    "backends", "benchmarks", "box_filters", "convolution", "filter_bank", "median_filters",
+    "operations", "result_cache", "shared_pool", "stack_store", "streaming", "tiling", "tracing",
+]
+
+# Dependencies that must only be imported by the functions that need them
+HEAVY_MODULES = ["sklearn", "skimage", "scipy", "matplotlib", "PIL"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure_import(module, repeat=5):
+    """
+    Time a cold import of a module in fresh interpreters.
+
+    Parameters:
+        module (str): Module name to import.
+        repeat (int): Number of fresh interpreters to try.
+
+    Returns:
+        dict: {"module", "ms" (best of repeat), "heavy" (loaded heavy deps)}.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    best, heavy = None, []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code], cwd=here,
+                                capture_output=True, text=True, check=True)
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        if best is None or sample["seconds"] < best:
+            best = sample["seconds"]
+        heavy = sample["heavy"]
+    return {"module": module, "ms": best * 1000, "heavy": heavy}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--budget-ms", type=float, default=400.0,
+                        help="maximum cold import time per module (default: 400)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="fresh interpreters per module; the best time counts (default: 5)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [measure_import(module, args.repeat) for module in args.modules]
+    failed = [r for r in results if r["ms"] > args.budget_ms or r["heavy"]]
+
+    if args.json:
+        print(json.dumps({"budget_ms": args.budget_ms, "results": results}, indent=2))
+    else:
+        for r in results:
+            status = "FAIL" if r in failed else "ok"
+            heavy = f"  loaded: {', '.join(r['heavy'])}" if r["heavy"] else ""
+            print(f"{r['module']:<30} {r['ms']:8.1f} ms  {status}{heavy}")
+        print(f"{len(failed)} of {len(results)} modules over the {args.budget_ms:.0f} ms budget "
+              f"or loading heavy dependencies")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
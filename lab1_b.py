@@ -1,8 +1,15 @@
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
+from point_ops import apply_point_op, sweep_point_op
+from viz import plt
+
+def log_transformation(image, c=1, out_dtype=None):
+    # 8/16-bit input has at most 65,536 levels: map it through the memoized
+    # lookup table at the input bit depth; float input with an explicit
+    # out_dtype is processed in float32
+    if image.dtype in (np.uint8, np.uint16) or out_dtype is not None:
+        return apply_point_op(image, "log", out_dtype=out_dtype, c=c)
 
-def log_transformation(image, c=1):
     # Apply the log transformation with a constant c
     # Ensure that pixel values are in float32 for calculation
     image_log = c * np.log1p(image.astype(np.float32))  # np.log1p is log(1 + image)
@@ -12,39 +19,43 @@ def log_transformation(image, c=1):
     
     return image_log
 
-# Load a grayscale image
-image = cv2.imread('low_and_heigh_contrast_gray_scale_image.jpg', cv2.IMREAD_GRAYSCALE)
+def main():
+    # Load a grayscale image
+    image = cv2.imread('low_and_heigh_contrast_gray_scale_image.jpg', cv2.IMREAD_GRAYSCALE)
+
+    # Apply the log transformation
+    log_image = log_transformation(image)
 
-# Apply the log transformation
-log_image = log_transformation(image)
+    # Display the original and log-transformed images
+    plt.figure(figsize=(10, 5))
 
-# Display the original and log-transformed images
-plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
 
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
+    plt.subplot(1, 2, 2)
+    plt.imshow(log_image, cmap='gray')
+    plt.title('Log Transformed Image')
+    plt.axis('off')
 
-plt.subplot(1, 2, 2)
-plt.imshow(log_image, cmap='gray')
-plt.title('Log Transformed Image')
-plt.axis('off')
+    plt.show()
 
-plt.show()
+    # Experiment with different values of the constant 'c'
+    c_values = [1, 5, 10, 20]
 
+    plt.figure(figsize=(15, 10))
 
-# Experiment with different values of the constant 'c'
-c_values = [1, 5, 10, 20]
+    # All values of c in one sweep: shared normalization, one table per c
+    log_images = sweep_point_op(image, "log", "c", c_values)
 
-plt.figure(figsize=(15, 10))
+    for i, (c, log_image) in enumerate(zip(c_values, log_images), 1):
+        plt.subplot(2, 3, i)
+        plt.imshow(log_image, cmap='gray')
+        plt.title(f'Log Transformed Image (c={c})')
+        plt.axis('off')
 
-for i, c in enumerate(c_values, 1):
-    log_image = log_transformation(image, c)
-    
-    plt.subplot(2, 3, i)
-    plt.imshow(log_image, cmap='gray')
-    plt.title(f'Log Transformed Image (c={c})')
-    plt.axis('off')
+    plt.show()
 
-plt.show()
+if __name__ == "__main__":
+    main()
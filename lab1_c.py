@@ -1,17 +1,26 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from viz import plt
+from point_ops import apply_point_op, sweep_point_op
 
-def power_law_transformation(image, gamma):
+def power_law_transformation(image, gamma, out_dtype=None):
     """
     Apply power-law (gamma) transformation to an image.
 
     Parameters:
         image (ndarray): Input image (can be grayscale or color).
         gamma (float): Gamma value for the transformation.
+        out_dtype (dtype): Output dtype. Defaults to the input dtype for
+            8/16-bit input and uint8 otherwise.
 
     Returns:
         transformed_image (ndarray): Gamma-transformed image.
     """
+    # 8/16-bit input has at most 65,536 levels: map it through the memoized
+    # lookup table at the input bit depth; float input with an explicit
+    # out_dtype is processed in float32
+    if image.dtype in (np.uint8, np.uint16) or out_dtype is not None:
+        return apply_point_op(image, "gamma", out_dtype=out_dtype, gamma=gamma)
+
     # Normalize the image to the range [0, 1]
     image_normalized = image / 255.0
 
@@ -34,8 +43,10 @@ if __name__ == "__main__":
 
     plt.figure(figsize=(12, 4))
 
-    for i, gamma in enumerate(gamma_values):
-        transformed_image = power_law_transformation(image, gamma)
+    # All gamma values in one sweep instead of one full pass per value
+    transformed_images = sweep_point_op(image, "gamma", "gamma", gamma_values)
+
+    for i, (gamma, transformed_image) in enumerate(zip(gamma_values, transformed_images)):
         plt.subplot(1, len(gamma_values), i+1)
         plt.imshow(transformed_image)
         plt.title(f'Gamma = {gamma}')
@@ -1,109 +1,164 @@
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-def mean_filter(image, kernel_size=3):
-    return cv2.blur(image, (kernel_size, kernel_size))
-
-# Apply Mean filter
-image = cv2.imread('path_to_image', cv2.IMREAD_GRAYSCALE)
-mean_filtered_image = mean_filter(image)
-
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-
-plt.subplot(1, 2, 2)
-plt.imshow(mean_filtered_image, cmap='gray')
-plt.title('Mean Filtered Image')
-plt.axis('off')
-
-plt.show()
-
-
-def median_filter(image, kernel_size=3):
-    return cv2.medianBlur(image, kernel_size)
-
-# Apply Median filter
-median_filtered_image = median_filter(image)
-
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-
-plt.subplot(1, 2, 2)
-plt.imshow(median_filtered_image, cmap='gray')
-plt.title('Median Filtered Image')
-plt.axis('off')
-
-plt.show()
-
+from viz import plt
+from box_filters import box_filter
+from convolution import filter2d
+from filter_bank import FilterBank, FilterSpec
+import median_filters
+
+def mean_filter(image, kernel_size=3, dtype=None):
+    """
+    Mean filter with a per-pixel cost independent of the kernel size.
+
+    Parameters:
+        image (numpy.ndarray): Input image.
+        kernel_size (int or tuple): Window size, or (rows, cols) per axis.
+        dtype (numpy.dtype): Output dtype, e.g. np.float32 to keep the
+            unrounded means. Defaults to the input dtype.
+
+    Returns:
+        numpy.ndarray: Filtered image.
+    """
+    return box_filter(image, kernel_size, dtype=dtype)
+
+def median_filter(image, kernel_size=3, workers=None):
+    """
+    Median filter for 8- and 16-bit images with any odd kernel size.
+
+    Parameters:
+        image (numpy.ndarray): Input image.
+        kernel_size (int): Odd window size.
+        workers (int): Threads over row bands. Defaults to the CPU count.
+
+    Returns:
+        numpy.ndarray: Filtered image.
+    """
+    return median_filters.median_filter(image, kernel_size, workers)
 
 def gaussian_filter(image, kernel_size=3, sigma=1):
     return cv2.GaussianBlur(image, (kernel_size, kernel_size), sigma)
 
-# Apply Gaussian filter
-gaussian_filtered_image = gaussian_filter(image)
-
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-
-plt.subplot(1, 2, 2)
-plt.imshow(gaussian_filtered_image, cmap='gray')
-plt.title('Gaussian Filtered Image')
-plt.axis('off')
-
-plt.show()
-
-
 def sharpening_filter(image):
     kernel = np.array([[0, -1, 0],
                        [-1, 5,-1],
                        [0, -1, 0]])
-    return cv2.filter2D(image, -1, kernel)
-
-# Apply Sharpening filter
-sharpened_image = sharpening_filter(image)
-
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-
-plt.subplot(1, 2, 2)
-plt.imshow(sharpened_image, cmap='gray')
-plt.title('Sharpened Image')
-plt.axis('off')
-
-plt.show()
-
+    return filter2d(image, kernel)
 
 def laplacian_4(image):
     kernel = np.array([[0, 1, 0],
                        [1, -4, 1],
                        [0, 1, 0]])
-    return cv2.filter2D(image, -1, kernel)
-
-# Apply 4-connected Laplacian filter
-laplacian_4_image = laplacian_4(image)
-
-plt.figure(figsize=(10, 5))
-plt.subplot(1, 2, 1)
-plt.imshow(image, cmap='gray')
-plt.title('Original Image')
-plt.axis('off')
-
-plt.subplot(1, 2, 2)
-plt.imshow(laplacian_4_image, cmap='gray')
-plt.title('4-Connected Laplacian Image')
-plt.axis('off')
-
-plt.show()
+    return filter2d(image, kernel)
+
+def apply_all_filters(image, kernel_size=3, sigma=1):
+    """
+    Mean, median, Gaussian, sharpening and 4-connected Laplacian outputs
+    from a single strip-wise pass over the image, with per-filter timings.
+    On a single core this is slower than calling the five filters directly
+    (see filter_bank.py), so it is opt-in.
+
+    Parameters:
+        image (numpy.ndarray): Input image.
+        kernel_size (int): Window size of the mean, median and Gaussian filters.
+        sigma (float): Standard deviation of the Gaussian filter.
+
+    Returns:
+        tuple: (outputs, timings) where outputs maps "mean", "median",
+        "gaussian", "sharpen" and "laplacian" to images and timings maps
+        the same names to seconds.
+    """
+    radius = kernel_size // 2
+    bank = FilterBank([
+        FilterSpec(mean_filter, radius, name="mean", kernel_size=kernel_size),
+        FilterSpec(median_filter, radius, name="median", kernel_size=kernel_size),
+        FilterSpec(gaussian_filter, radius, name="gaussian", kernel_size=kernel_size, sigma=sigma),
+        FilterSpec(sharpening_filter, 1, name="sharpen"),
+        FilterSpec(laplacian_4, 1, name="laplacian"),
+    ])
+    outputs = bank.apply(image)
+    return outputs, bank.timings
+
+def main():
+    # Apply Mean filter
+    image = cv2.imread('path_to_image', cv2.IMREAD_GRAYSCALE)
+    mean_filtered_image = mean_filter(image)
+
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+
+    plt.subplot(1, 2, 2)
+    plt.imshow(mean_filtered_image, cmap='gray')
+    plt.title('Mean Filtered Image')
+    plt.axis('off')
+
+    plt.show()
+
+    # Apply Median filter
+    median_filtered_image = median_filter(image)
+
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+
+    plt.subplot(1, 2, 2)
+    plt.imshow(median_filtered_image, cmap='gray')
+    plt.title('Median Filtered Image')
+    plt.axis('off')
+
+    plt.show()
+
+    # Apply Gaussian filter
+    gaussian_filtered_image = gaussian_filter(image)
+
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+
+    plt.subplot(1, 2, 2)
+    plt.imshow(gaussian_filtered_image, cmap='gray')
+    plt.title('Gaussian Filtered Image')
+    plt.axis('off')
+
+    plt.show()
+
+    # Apply Sharpening filter
+    sharpened_image = sharpening_filter(image)
+
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+
+    plt.subplot(1, 2, 2)
+    plt.imshow(sharpened_image, cmap='gray')
+    plt.title('Sharpened Image')
+    plt.axis('off')
+
+    plt.show()
+
+    # Apply 4-connected Laplacian filter
+    laplacian_4_image = laplacian_4(image)
+
+    plt.figure(figsize=(10, 5))
+    plt.subplot(1, 2, 1)
+    plt.imshow(image, cmap='gray')
+    plt.title('Original Image')
+    plt.axis('off')
+
+    plt.subplot(1, 2, 2)
+    plt.imshow(laplacian_4_image, cmap='gray')
+    plt.title('4-Connected Laplacian Image')
+    plt.axis('off')
+
+    plt.show()
+
+if __name__ == "__main__":
+    main()
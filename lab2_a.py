@@ -1,70 +1,97 @@
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.decomposition import PCA
-
-# Load the grayscale image
-image = cv2.imread('/content/barbara.jpg', cv2.IMREAD_GRAYSCALE)
+import backends
+from klt import KLTBasis
+from viz import plt
 
 # --- 1. Discrete Fourier Transform (DFT) ---
 def perform_dft(image):
+    # cv2.dft, NumPy's or SciPy's FFT, whichever calibrated fastest on this host
+    return backends.dispatch("dft_magnitude", image)
+
+backends.define_operation(
+    "dft_magnitude",
+    lambda size, dtype: (np.random.default_rng(0).integers(1, 256, (size, size)).astype(dtype),),
+    dtypes=("uint8", "float32"),
+)
+
+@backends.register_backend("dft_magnitude", "opencv")
+def _dft_magnitude_opencv(image):
     dft = cv2.dft(np.float32(image), flags=cv2.DFT_COMPLEX_OUTPUT)
     dft_shift = np.fft.fftshift(dft)
     magnitude_spectrum = 20 * np.log(cv2.magnitude(dft_shift[:, :, 0], dft_shift[:, :, 1]))
     return magnitude_spectrum
 
-dft_result = perform_dft(image)
-
-# --- 2. Z-Transform ---
-def z_transform(image, a=0.9):
-    rows, cols = image.shape
-    z_transformed = np.zeros_like(image, dtype=np.float32)
-
-    for r in range(rows):
-        z_transformed[r, :] = np.cumsum(image[r, :] * (a ** np.arange(cols)))
-
-    for c in range(cols):
-        z_transformed[:, c] = np.cumsum(z_transformed[:, c] * (a ** np.arange(rows)))
-
-    return z_transformed
-
-z_transform_result = z_transform(image)
+@backends.register_backend("dft_magnitude", "numpy")
+def _dft_magnitude_numpy(image):
+    dft_shift = np.fft.fftshift(np.fft.fft2(np.float32(image)))
+    return (20 * np.log(np.abs(dft_shift))).astype(np.float32)
 
-# --- 3. Karhunen–Loève Transform (KLT, using PCA) ---
-def kl_transform(image, n_components=20):
-    rows, cols = image.shape
-    flat_image = image.reshape(-1, cols)
+@backends.register_backend("dft_magnitude", "scipy", requires="scipy")
+def _dft_magnitude_scipy(image):
+    from scipy import fft
+    dft_shift = fft.fftshift(fft.fft2(np.float32(image), workers=-1))
+    return (20 * np.log(np.abs(dft_shift))).astype(np.float32)
 
-    # Perform PCA (KLT Approximation)
-    pca = PCA(n_components=n_components)
-    reduced = pca.fit_transform(flat_image)
-    reconstructed = pca.inverse_transform(reduced)
-    return reconstructed.reshape(rows, cols)
-
-klt_result = kl_transform(image, n_components=50)
-
-# --- Display Results ---
-plt.figure(figsize=(10, 10))
-
-# Original Image
-plt.subplot(2, 2, 1)
-plt.title("Original Image")
-plt.imshow(image, cmap='gray')
-
-# DFT Result
-plt.subplot(2, 2, 2)
-plt.title("DFT Magnitude Spectrum")
-plt.imshow(dft_result, cmap='gray')
-
-# Z-Transform Result
-plt.subplot(2, 2, 3)
-plt.title("Z-Transform Result")
-plt.imshow(z_transform_result, cmap='gray')
-
-# KLT Result
-plt.subplot(2, 2, 4)
-plt.title("KLT (PCA) Result")
-plt.imshow(klt_result, cmap='gray')
-
-plt.tight_layout()
-plt.show()
+# --- 2. Z-Transform ---
+def z_transform(image, a=0.9, dtype=np.float64):
+    # Separable geometric weighting: one cumulative sum along the columns,
+    # then one down the rows. Works on (H, W) images and (N, H, W) stacks.
+    # dtype sets the accumulation precision; np.float32 halves memory traffic.
+    image = np.asarray(image)
+    rows, cols = image.shape[-2:]
+    col_weights = a ** np.arange(cols, dtype=dtype)
+    row_weights = a ** np.arange(rows, dtype=dtype)
+
+    z_transformed = np.cumsum(image * col_weights, axis=-1, dtype=dtype)
+    z_transformed *= row_weights[:, None]
+    np.cumsum(z_transformed, axis=-2, out=z_transformed)
+
+    return z_transformed.astype(np.float32, copy=False)
+
+# --- 3. Karhunen–Loève Transform (KLT) ---
+def kl_transform(image, n_components=20, basis=None):
+    # Rows are the observations. Pass a fitted/loaded klt.KLTBasis to project
+    # with a shared basis instead of refitting on this image.
+    if basis is None:
+        basis = KLTBasis(n_components).fit([image])
+    return basis.reconstruct(image)
+
+def main():
+    # Load the grayscale image
+    image = cv2.imread('/content/barbara.jpg', cv2.IMREAD_GRAYSCALE)
+
+    dft_result = perform_dft(image)
+
+    z_transform_result = z_transform(image)
+
+    klt_result = kl_transform(image, n_components=50)
+
+    # --- Display Results ---
+    plt.figure(figsize=(10, 10))
+
+    # Original Image
+    plt.subplot(2, 2, 1)
+    plt.title("Original Image")
+    plt.imshow(image, cmap='gray')
+
+    # DFT Result
+    plt.subplot(2, 2, 2)
+    plt.title("DFT Magnitude Spectrum")
+    plt.imshow(dft_result, cmap='gray')
+
+    # Z-Transform Result
+    plt.subplot(2, 2, 3)
+    plt.title("Z-Transform Result")
+    plt.imshow(z_transform_result, cmap='gray')
+
+    # KLT Result
+    plt.subplot(2, 2, 4)
+    plt.title("KLT (PCA) Result")
+    plt.imshow(klt_result, cmap='gray')
+
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -1,93 +1,157 @@
 import cv2
 import numpy as np
-from skimage import exposure
-from skimage.measure import shannon_entropy
-import matplotlib.pyplot as plt
+import backends
+from lazy_imports import LazyModule, lazy_function
+from viz import plt
 
-# Load a grayscale image
-image = cv2.imread("/content/lenna.png", cv2.IMREAD_GRAYSCALE)
-
-# Load a reference image for histogram matching
-reference_image = cv2.imread("/content/barbara.jpg", cv2.IMREAD_GRAYSCALE)
+# skimage is only imported when matching or entropy is first used
+exposure = LazyModule("skimage.exposure")
+shannon_entropy = lazy_function("skimage.measure", "shannon_entropy")
 
 # --- 1. Histogram Equalization ---
-def histogram_equalization(image):
-    equalized = cv2.equalizeHist(image)
+def histogram_equalization(image, batch=False):
+    # batch=True treats the first axis of an (N, H, W) uint8 array as N
+    # grayscale images, equalized independently
+    if batch:
+        if image.ndim != 3:
+            raise ValueError(f"Expected an (N, H, W) batch of grayscale images, got shape {image.shape}")
+        return _equalize_batch(image)
+    if image.ndim != 2:
+        raise ValueError(f"Expected a 2-D grayscale image, got shape {image.shape}; "
+                         "pass batch=True for an (N, H, W) batch")
+    equalized = backends.dispatch("equalize", image)
     return equalized
 
-equalized_image = histogram_equalization(image)
+backends.define_operation(
+    "equalize",
+    lambda size, dtype: (np.random.default_rng(0).integers(0, 200, (size, size)).astype(dtype),),
+    check=np.array_equal,
+)
+
+@backends.register_backend("equalize", "opencv")
+def _equalize_opencv(image):
+    return cv2.equalizeHist(image)
+
+@backends.register_backend("equalize", "numpy")
+def _equalize_numpy(image):
+    # The table cv2.equalizeHist builds: levels above the darkest present one
+    # map to round(255 * (cdf - h_min) / (total - h_min)) in float32
+    hist = np.bincount(image.ravel(), minlength=256)
+    first = int(np.argmax(hist > 0))
+    total = image.size
+    if hist[first] == total:
+        return np.full_like(image, first)
+    scale = np.float32(255) / np.float32(total - hist[first])
+    lut = np.rint((np.cumsum(hist) - hist[first]).astype(np.float32) * scale)
+    lut = np.clip(lut, 0, 255).astype(np.uint8)
+    return lut[image]
+
+def _equalize_batch(images):
+    # cv2.equalizeHist costs a few microseconds per thumbnail, less than a
+    # vectorized NumPy histogram/gather over the whole batch, so the batch
+    # is run image by image straight into one preallocated output
+    equalized = np.empty_like(images)
+    for image, out in zip(images, equalized):
+        cv2.equalizeHist(image, dst=out)
+    return equalized
 
 # --- 2. Histogram Matching ---
 def histogram_matching(source, reference):
     matched = exposure.match_histograms(source, reference)
     return np.uint8(matched)
 
-matched_image = histogram_matching(image, reference_image)
-
 # --- 3. Contrast Enhancement (CLAHE) ---
 def contrast_enhancement(image, clip_limit=2.0, tile_grid_size=(8, 8)):
     clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
     enhanced = clahe.apply(image)
     return enhanced
 
-enhanced_image = contrast_enhancement(image)
-
 # --- 4. Entropy Calculation ---
-def calculate_entropy(image):
-    return shannon_entropy(image)
-
-# Entropy Calculations
-entropy_original = calculate_entropy(image)
-entropy_reference = calculate_entropy(reference_image)
-entropy_equalized = calculate_entropy(equalized_image)
-entropy_matched = calculate_entropy(matched_image)
-entropy_enhanced = calculate_entropy(enhanced_image)
-
-# --- Display Results ---
-plt.figure(figsize=(18, 18))
-
-
-# Row 1: Original Image and Histogram
-plt.subplot(4, 2, 1)
-plt.title(f"Original Image\nEntropy: {entropy_original:.2f}")
-plt.imshow(image, cmap='gray')
-
-plt.subplot(4, 2, 2)
-plt.title("Original Histogram")
-plt.hist(image.ravel(), bins=256, color='blue', alpha=0.7)
-plt.xlabel("Pixel Intensity")
-plt.ylabel("Frequency")
-
-# Row 2: Reference Image and Histogram
-plt.subplot(4, 2, 3)
-plt.title(f"Reference Image\nEntropy: {entropy_reference:.2f}")
-plt.imshow(reference_image, cmap='gray')
-
-plt.subplot(4, 2, 4)
-plt.title("Reference Histogram")
-plt.hist(reference_image.ravel(), bins=256, color='orange', alpha=0.7)
-plt.xlabel("Pixel Intensity")
-plt.ylabel("Frequency")
-
-# Row 3: Histogram Equalization and Matching
-plt.subplot(4, 2, 5)
-plt.title(f"Histogram Equalization\nEntropy: {entropy_equalized:.2f}")
-plt.imshow(equalized_image, cmap='gray')
-
-plt.subplot(4, 2, 6)
-plt.title(f"Histogram Matching\nEntropy: {entropy_matched:.2f}")
-plt.imshow(matched_image, cmap='gray')
-
-# Row 4: Contrast Enhanced and Histogram
-plt.subplot(4, 2, 7)
-plt.title(f"Contrast Enhanced\nEntropy: {entropy_enhanced:.2f}")
-plt.imshow(enhanced_image, cmap='gray')
-
-plt.subplot(4, 2, 8)
-plt.title("Enhanced Histogram (CLAHE)")
-plt.hist(enhanced_image.ravel(), bins=256, color='green', alpha=0.7)
-plt.xlabel("Pixel Intensity")
-plt.ylabel("Frequency")
-
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+def _batch_histograms(images):
+    # One bincount over (image index * 256 + level) gives every histogram at once
+    n = images.shape[0]
+    offsets = (np.arange(n, dtype=np.intp) * 256).reshape((n,) + (1,) * (images.ndim - 1))
+    return np.bincount((images + offsets).ravel(), minlength=n * 256).reshape(n, 256)
+
+def calculate_entropy(image, batch=False):
+    # batch=True treats the first axis as N images and returns N entropies;
+    # uint8 batches are counted with a single bincount
+    if not batch:
+        return shannon_entropy(image)
+    if image.dtype != np.uint8:
+        return np.array([shannon_entropy(im) for im in image])
+    p = _batch_histograms(image) / np.float64(image[0].size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(p > 0, -p * np.log2(p), 0.0)
+    return terms.sum(axis=1)
+
+def main():
+    # Load a grayscale image
+    image = cv2.imread("/content/lenna.png", cv2.IMREAD_GRAYSCALE)
+
+    # Load a reference image for histogram matching
+    reference_image = cv2.imread("/content/barbara.jpg", cv2.IMREAD_GRAYSCALE)
+
+    equalized_image = histogram_equalization(image)
+
+    matched_image = histogram_matching(image, reference_image)
+
+    enhanced_image = contrast_enhancement(image)
+
+    # Entropy Calculations
+    entropy_original = calculate_entropy(image)
+    entropy_reference = calculate_entropy(reference_image)
+    entropy_equalized = calculate_entropy(equalized_image)
+    entropy_matched = calculate_entropy(matched_image)
+    entropy_enhanced = calculate_entropy(enhanced_image)
+
+    # --- Display Results ---
+    plt.figure(figsize=(18, 18))
+
+    # Row 1: Original Image and Histogram
+    plt.subplot(4, 2, 1)
+    plt.title(f"Original Image\nEntropy: {entropy_original:.2f}")
+    plt.imshow(image, cmap='gray')
+
+    plt.subplot(4, 2, 2)
+    plt.title("Original Histogram")
+    plt.hist(image.ravel(), bins=256, color='blue', alpha=0.7)
+    plt.xlabel("Pixel Intensity")
+    plt.ylabel("Frequency")
+
+    # Row 2: Reference Image and Histogram
+    plt.subplot(4, 2, 3)
+    plt.title(f"Reference Image\nEntropy: {entropy_reference:.2f}")
+    plt.imshow(reference_image, cmap='gray')
+
+    plt.subplot(4, 2, 4)
+    plt.title("Reference Histogram")
+    plt.hist(reference_image.ravel(), bins=256, color='orange', alpha=0.7)
+    plt.xlabel("Pixel Intensity")
+    plt.ylabel("Frequency")
+
+    # Row 3: Histogram Equalization and Matching
+    plt.subplot(4, 2, 5)
+    plt.title(f"Histogram Equalization\nEntropy: {entropy_equalized:.2f}")
+    plt.imshow(equalized_image, cmap='gray')
+
+    plt.subplot(4, 2, 6)
+    plt.title(f"Histogram Matching\nEntropy: {entropy_matched:.2f}")
+    plt.imshow(matched_image, cmap='gray')
+
+    # Row 4: Contrast Enhanced and Histogram
+    plt.subplot(4, 2, 7)
+    plt.title(f"Contrast Enhanced\nEntropy: {entropy_enhanced:.2f}")
+    plt.imshow(enhanced_image, cmap='gray')
+
+    plt.subplot(4, 2, 8)
+    plt.title("Enhanced Histogram (CLAHE)")
+    plt.hist(enhanced_image.ravel(), bins=256, color='green', alpha=0.7)
+    plt.xlabel("Pixel Intensity")
+    plt.ylabel("Frequency")
+
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Lets a module name a heavy dependency at top level without paying its
+    import cost until a function actually uses it.
+
+    Parameters:
+        name (str): Fully qualified module name, e.g. "matplotlib.pyplot".
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_function(module_name, name):
+    """
+    Return a stand-in for module_name.name that imports the module on first call.
+
+    Keeps call sites such as eigh(matrix) unchanged while deferring the
+    import of scipy/skimage/sklearn until the function is actually used.
+
+    Parameters:
+        module_name (str): Module that defines the function, e.g. "scipy.linalg".
+        name (str): Function name, e.g. "eigh".
+
+    Returns:
+        callable: Wrapper forwarding all arguments to the real function.
+    """
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), name)(*args, **kwargs)
+
+    call.__name__ = name
+    call.__qualname__ = name
+    call.__doc__ = f"Lazily imported {module_name}.{name}."
+    return call
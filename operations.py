@@ -0,0 +1,235 @@
+"""
+Registry of whole-image operations that batch tools can run by name.
+
+Each operation takes a decoded image plus keyword parameters and returns
+the image to be written. The registry also records how its input should
+be decoded (grayscale, color or unchanged bit depth).
+"""
+
+import functools
+
+import cv2
+import numpy as np
+
+import Imagemorphologicalprocessing
+import Imageregistration
+import Imagesegmenation
+import lab1_A
+import lab1_b
+import lab1_c
+import lab1_d
+import lab2_b
+import lab2_c
+import lab2_d
+import median_filters
+import tiling
+
+# Registered operations: name -> (function, cv2.imread flag)
+OPERATIONS = {}
+
+# Neighbourhood radius of local operations: name -> int or callable(**params)
+HALOS = {}
+
+
+def register_operation(name, imread_flag=cv2.IMREAD_GRAYSCALE, halo=None):
+    """
+    Register an operation under a name usable from the batch CLI.
+
+    Parameters:
+        name (str): Operation name, e.g. "gamma".
+        imread_flag (int): How input files are decoded for this operation.
+        halo (int or callable): Pixels of context the operation reads around
+            each output pixel, or a function of its parameters returning it.
+            Only operations with a halo can be tiled exactly.
+    """
+    def decorator(fn):
+        OPERATIONS[name] = (fn, imread_flag)
+        if halo is not None:
+            HALOS[name] = halo
+        return fn
+    return decorator
+
+
+def get_operation(name):
+    """Return (function, imread flag) for a registered operation."""
+    if name not in OPERATIONS:
+        raise ValueError(f"Unknown operation {name!r}; choose from {', '.join(sorted(OPERATIONS))}")
+    return OPERATIONS[name]
+
+
+def get_halo(name, params=None):
+    """
+    Return the halo an operation needs for tiled execution.
+
+    Raises ValueError for operations that are not local (point transforms
+    need no halo and report 0; global ones such as watershed have none).
+    """
+    get_operation(name)
+    if name not in HALOS:
+        raise ValueError(f"Operation {name!r} is not local and cannot be tiled exactly")
+    halo = HALOS[name]
+    return halo(**(params or {})) if callable(halo) else halo
+
+
+def _kernel_radius(kernel_size=3, **_):
+    return max(np.atleast_1d(kernel_size)) // 2
+
+
+def _morphology_radius(kernel_size=5, **_):
+    # Opening and closing apply two passes of the structuring element
+    return 2 * (kernel_size // 2)
+
+
+# --- 1. Point Transforms ---
+@register_operation("negative", halo=0)
+def negative(image):
+    return lab1_A.image_negative(image)
+
+
+@register_operation("log", cv2.IMREAD_UNCHANGED)
+def log(image, c=1):
+    return lab1_b.log_transformation(image, c)
+
+
+@register_operation("gamma", cv2.IMREAD_UNCHANGED, halo=0)
+def gamma(image, gamma=1.0):
+    return lab1_c.power_law_transformation(image, gamma)
+
+
+# --- 2. Spatial and Frequency Filters ---
+@register_operation("mean", halo=_kernel_radius)
+def mean(image, kernel_size=3):
+    return lab1_d.mean_filter(image, kernel_size)
+
+
+@register_operation("median", halo=_kernel_radius)
+def median(image, kernel_size=3):
+    return lab1_d.median_filter(image, kernel_size)
+
+
+# Not tileable: salt and pepper are detected at the whole image's extreme values
+@register_operation("adaptive-median", cv2.IMREAD_UNCHANGED)
+def adaptive_median(image, max_kernel=7, threshold=None):
+    return median_filters.adaptive_median_filter(image, max_kernel, threshold)
+
+
+@register_operation("gaussian", halo=_kernel_radius)
+def gaussian(image, kernel_size=3, sigma=1):
+    return lab1_d.gaussian_filter(image, kernel_size, sigma)
+
+
+@register_operation("sharpen", halo=1)
+def sharpen(image):
+    return lab1_d.sharpening_filter(image)
+
+
+@register_operation("laplacian", halo=1)
+def laplacian(image):
+    return lab1_d.laplacian_4(image)
+
+
+@register_operation("homomorphic")
+def homomorphic(image, gamma_low=0.5, gamma_high=1.5, c=1, d0=50):
+    return lab2_c.homomorphic_filter(image, gamma_low, gamma_high, c, d0)
+
+
+# --- 3. Histogram Processing ---
+@register_operation("equalize")
+def equalize(image):
+    return lab2_b.histogram_equalization(image)
+
+
+@register_operation("clahe")
+def clahe(image, clip_limit=2.0, tile_size=8):
+    return lab2_b.contrast_enhancement(image, clip_limit, (tile_size, tile_size))
+
+
+@register_operation("equalize-color", cv2.IMREAD_COLOR)
+def equalize_color(image):
+    rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return cv2.cvtColor(lab2_d.equalize_color_histogram(rgb), cv2.COLOR_RGB2BGR)
+
+
+# --- 4. Morphology ---
+@register_operation("erode", halo=_morphology_radius)
+def erode(image, kernel_size=5):
+    return Imagemorphologicalprocessing.perform_erosion(image, np.ones((kernel_size, kernel_size), np.uint8))
+
+
+@register_operation("dilate", halo=_morphology_radius)
+def dilate(image, kernel_size=5):
+    return Imagemorphologicalprocessing.perform_dilation(image, np.ones((kernel_size, kernel_size), np.uint8))
+
+
+@register_operation("open", halo=_morphology_radius)
+def opening(image, kernel_size=5):
+    return Imagemorphologicalprocessing.perform_opening(image, np.ones((kernel_size, kernel_size), np.uint8))
+
+
+@register_operation("close", halo=_morphology_radius)
+def closing(image, kernel_size=5):
+    return Imagemorphologicalprocessing.perform_closing(image, np.ones((kernel_size, kernel_size), np.uint8))
+
+
+# --- 5. Segmentation ---
+@register_operation("threshold", halo=0)
+def threshold(image, thresh_value=127):
+    return Imagesegmenation.threshold_segmentation(image, thresh_value)
+
+
+@register_operation("watershed")
+def watershed(image):
+    return Imagesegmenation.region_based_segmentation(image)
+
+
+@register_operation("edges")
+def edges(image):
+    return Imagesegmenation.edge_based_segmentation(image)
+
+
+# --- 6. Registration ---
+@functools.lru_cache(maxsize=4)
+def _load_reference(path):
+    reference = cv2.imread(path, cv2.IMREAD_COLOR)
+    if reference is None:
+        raise ValueError(f"Reference image not found: {path}")
+    return reference
+
+
+@register_operation("register", cv2.IMREAD_COLOR)
+def register(image, reference):
+    # The reference is decoded once per worker process and reused
+    aligned, _ = Imageregistration.register_images(image, _load_reference(reference))
+    if aligned is None:
+        raise ValueError("Not enough matches found to register the image.")
+    return aligned
+
+
+# --- 7. Halo Check ---
+def check_halos(shape=(300, 300), tile_size=64, seed=0):
+    """
+    Run every tileable operation tiled and on the whole image, at its
+    default parameters, and count the pixels that differ. A non-zero count
+    means the declared halo is too small.
+
+    Parameters:
+        shape (tuple): Size of the random test image.
+        tile_size (int): Tile edge length; small tiles put many seams in.
+        seed (int): Seed of the test image.
+
+    Returns:
+        dict: Operation name -> number of differing pixels.
+    """
+    rng = np.random.default_rng(seed)
+    # Smoothed noise, so filters see texture as well as flat areas
+    noise = rng.integers(0, 256, shape, dtype=np.uint8)
+    gray = cv2.addWeighted(noise, 0.5, cv2.GaussianBlur(noise, (9, 9), 3), 0.5, 0)
+    color = cv2.merge([gray, np.roll(gray, 7, axis=0), np.roll(gray, 7, axis=1)])
+    mismatches = {}
+    for name in sorted(HALOS):
+        fn, imread_flag = OPERATIONS[name]
+        image = color if imread_flag == cv2.IMREAD_COLOR else gray
+        expected = fn(image)
+        tiled = tiling.run_tiled(fn, image, get_halo(name), tile_size=tile_size, workers=1)
+        mismatches[name] = int(np.count_nonzero(expected != tiled))
+    return mismatches
@@ -0,0 +1,369 @@
+import functools
+
+import cv2
+import numpy as np
+
+# Registered point operations: name -> (table function, needs image max)
+_POINT_OPS = {}
+
+
+def register_point_op(name, needs_max=False):
+    """
+    Register a point transform so it can be compiled into a lookup table.
+
+    The decorated function receives every input level as an integer array,
+    the input full-scale value (255 for 8-bit, 4095 for 12-bit, ...), the
+    output full-scale value and the op parameters, and returns the output
+    value for each level. Ops whose output depends on the image maximum
+    (e.g. max-normalized log) set needs_max=True and receive it as the
+    max_value parameter.
+
+    Parameters:
+        name (str): Name used with point_lut/apply_point_op.
+        needs_max (bool): Whether the op needs the image maximum.
+    """
+    def decorator(table_fn):
+        _POINT_OPS[name] = (table_fn, needs_max)
+        return table_fn
+    return decorator
+
+
+# --- 1. Built-in Point Transforms ---
+# With in_max == out_max == 255 each table reproduces the arithmetic of the
+# 8-bit function it replaces, so results are bit-identical.
+@register_point_op("negative")
+def _negative_table(levels, in_max, out_max):
+    negative = in_max - levels
+    return negative if in_max == out_max else negative * (out_max / in_max)
+
+
+@register_point_op("log", needs_max=True)
+def _log_table(levels, in_max, out_max, c=1, max_value=255):
+    # Same float32 arithmetic as lab1_b.log_transformation
+    image_log = c * np.log1p(levels.astype(np.float32))
+    peak = c * np.log1p(np.float32(max_value))
+    if peak == 0:
+        return np.zeros(levels.shape, dtype=np.float32)
+    return np.clip(image_log / peak * out_max, 0, out_max)
+
+
+@register_point_op("log_max", needs_max=True)
+def _log_max_table(levels, in_max, out_max, max_value=255):
+    # Same arithmetic as dip_lab.log_transform: c = 255 / log(1 + max)
+    image_float = levels.astype(np.float32)
+    c = out_max / (np.log(1 + np.float32(max_value)))
+    return c * np.log(1 + image_float)
+
+
+@register_point_op("gamma")
+def _gamma_table(levels, in_max, out_max, gamma=1.0):
+    # Same arithmetic as lab1_c.power_law_transformation
+    return np.power(levels / in_max, gamma) * out_max
+
+
+# --- 2. Table Compilation and Application ---
+def _full_scale(dtype, bit_depth=None):
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        return 1.0
+    if bit_depth is not None:
+        return 2 ** bit_depth - 1
+    return int(np.iinfo(dtype).max)
+
+
+def _output_scale(in_dtype, out_dtype, bit_depth):
+    # Same container in and out keeps the input bit depth (12-bit stays
+    # 12-bit); a different output dtype uses that dtype's full range.
+    if np.dtype(out_dtype) == np.dtype(in_dtype):
+        return _full_scale(in_dtype, bit_depth)
+    return _full_scale(out_dtype)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_lut(op, params, size, in_max, out_max, out_dtype):
+    table_fn, _ = _POINT_OPS[op]
+    levels = np.arange(size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.asarray(table_fn(levels, in_max, out_max, **dict(params)))
+    values = np.clip(np.nan_to_num(values, posinf=out_max, neginf=0), 0, out_max)
+    lut = values.astype(out_dtype)
+    lut.setflags(write=False)
+    return lut
+
+
+def point_lut(op, bit_depth=8, out_dtype=None, **params):
+    """
+    Compile a registered point transform into a lookup table.
+
+    8-bit input gives a 256-entry table, 9- to 16-bit input a 65,536-entry
+    table. Tables are memoized by (op, params, bit depth, output dtype) and
+    returned read-only.
+
+    Parameters:
+        op (str): Registered op name, e.g. "negative", "log", "gamma".
+        bit_depth (int): Significant bits of the input (8, 10, 12, 16, ...).
+        out_dtype (numpy.dtype): Table dtype. Defaults to the input
+            container (uint8 or uint16), keeping the input bit depth.
+        **params: Op parameters, e.g. gamma=2.0.
+
+    Returns:
+        numpy.ndarray: Lookup table of shape (256,) or (65536,).
+    """
+    if op not in _POINT_OPS:
+        raise ValueError(f"Unknown point operation: {op!r}")
+    if not 1 <= bit_depth <= 16:
+        raise ValueError("Lookup tables support bit depths from 1 to 16.")
+    in_dtype = np.uint8 if bit_depth <= 8 else np.uint16
+    out_dtype = np.dtype(in_dtype if out_dtype is None else out_dtype)
+    size = 256 if bit_depth <= 8 else 65536
+    return _compile_lut(op, tuple(sorted(params.items())), size, 2 ** bit_depth - 1,
+                        _output_scale(in_dtype, out_dtype, bit_depth), out_dtype.str)
+
+
+def apply_lut(image, lut, out=None):
+    """
+    Map every pixel of an integer image through a lookup table in one gather.
+
+    Parameters:
+        image (numpy.ndarray): uint8 or uint16 image of any shape, including
+            (N, H, W[, C]) batches.
+        lut (numpy.ndarray): Table with one entry per possible input value.
+        out (numpy.ndarray): Optional destination of the result's shape/dtype.
+
+    Returns:
+        numpy.ndarray: Image of the same shape with the table's dtype.
+    """
+    if image.dtype not in (np.uint8, np.uint16):
+        raise ValueError("Lookup tables can only be applied to uint8 or uint16 images.")
+    if lut.shape[0] < np.iinfo(image.dtype).max + 1:
+        raise ValueError(f"A {image.dtype} image needs a {np.iinfo(image.dtype).max + 1}-entry table.")
+    if image.dtype == np.uint8 and (image.ndim == 2 or (image.ndim == 3 and image.shape[2] <= 4)):
+        return cv2.LUT(image, lut, dst=out)
+    if image.dtype == np.uint8 and image.flags.c_contiguous and (out is None or out.flags.c_contiguous):
+        # Batches (N, H, W[, C]): the table is elementwise, so view them as one 2-D image
+        flat = image.reshape(-1, image.shape[-1])
+        dst = None if out is None else out.reshape(flat.shape)
+        return cv2.LUT(flat, lut, dst=dst).reshape(image.shape)
+    return np.take(lut, image, out=out)
+
+
+def _apply_float(image, op, params, out_dtype, inplace, float_max):
+    # Work in float32, reusing the input buffer when allowed
+    if image.dtype == np.float32 and inplace:
+        x = image
+    else:
+        x = image.astype(np.float32)
+    out_max = float_max if np.dtype(out_dtype).kind == "f" else _full_scale(out_dtype)
+    if op == "negative":
+        np.subtract(np.float32(float_max), x, out=x)
+        x *= np.float32(out_max / float_max)
+    elif op == "gamma":
+        x /= np.float32(float_max)
+        np.power(x, np.float32(params.get("gamma", 1.0)), out=x)
+        x *= np.float32(out_max)
+    elif op in ("log", "log_max"):
+        c = params.get("c", 1)
+        np.log1p(x, out=x)
+        peak = c * (np.log1p(np.float32(params["max_value"])) if "max_value" in params else x.max())
+        if peak == 0:
+            x[...] = 0
+        else:
+            x *= np.float32(c * out_max / peak)
+    else:
+        raise ValueError(f"No float32 implementation for {op!r}; use integer input.")
+    np.clip(x, 0, out_max, out=x)
+    return x if np.dtype(out_dtype) == np.float32 else x.astype(out_dtype)
+
+
+def apply_point_op(image, op, out_dtype=None, bit_depth=None, inplace=False, float_max=255.0,
+                   **params):
+    """
+    Apply a registered point transform without float64 temporaries.
+
+    Integer input (uint8, or 10/12/16-bit data in uint16) goes through a
+    memoized 256- or 65,536-entry lookup table: a single gather at the
+    input's own bytes per pixel. Float input is processed in float32, in
+    place when inplace=True, on the [0, float_max] scale.
+
+    Parameters:
+        image (numpy.ndarray): Input image (grayscale or color).
+        op (str): Registered op name.
+        out_dtype (numpy.dtype): Output dtype. Defaults to the input dtype;
+            integer outputs of another dtype use that dtype's full range.
+        bit_depth (int): Significant bits of integer input. Defaults to the
+            container width (8 or 16).
+        inplace (bool): Reuse a float32 input buffer for the result.
+        float_max (float): Full-scale value of float input; 255 matches the
+            lab functions, use 1.0 for normalized data.
+        **params: Op parameters. max_value is filled in from the image for
+            ops that need it.
+
+    Returns:
+        numpy.ndarray: Transformed image.
+    """
+    if op not in _POINT_OPS:
+        raise ValueError(f"Unknown point operation: {op!r}")
+    out_dtype = image.dtype if out_dtype is None else np.dtype(out_dtype)
+    if image.dtype.kind == "f":
+        return _apply_float(image, op, params, out_dtype, inplace, float_max)
+    if image.dtype not in (np.uint8, np.uint16):
+        raise ValueError(f"Unsupported image dtype: {image.dtype}")
+
+    if bit_depth is None:
+        bit_depth = image.dtype.itemsize * 8
+    if _POINT_OPS[op][1] and "max_value" not in params:
+        params["max_value"] = int(image.max())
+    return apply_lut(image, point_lut(op, bit_depth=bit_depth, out_dtype=out_dtype, **params))
+
+
+# --- 3. Fused Point-Operation Chains ---
+class PointChain:
+    """
+    A sequence of point transforms folded into one composite lookup table.
+
+    Applying the chain costs a single table gather regardless of its length,
+    instead of one full-size intermediate image per step. Steps whose table
+    depends on the image maximum (e.g. "log") are resolved against the
+    maximum of their actual input, which is found from the levels present
+    in the source image.
+
+    Example:
+        chain = PointChain().then("negative").then("log", c=1).then("gamma", gamma=0.8)
+        result = chain.apply(image)
+    """
+
+    def __init__(self, steps=()):
+        self.steps = tuple((op, tuple(sorted(dict(params).items()))) for op, params in steps)
+        for op, _ in self.steps:
+            if op not in _POINT_OPS:
+                raise ValueError(f"Unknown point operation: {op!r}")
+
+    def then(self, op, **params):
+        """Return a new chain with one more step appended."""
+        return PointChain([(o, p) for o, p in self.steps] + [(op, params)])
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        names = " -> ".join(op for op, _ in self.steps) or "identity"
+        return f"PointChain({names})"
+
+    @property
+    def intermediates_eliminated(self):
+        """Full-size intermediate images the step-by-step version would allocate."""
+        return max(len(self.steps) - 1, 0)
+
+    def lut(self, image=None):
+        """
+        Compile the chain into one uint8 lookup table.
+
+        Parameters:
+            image (numpy.ndarray): Source image, required only when a step
+                needs the image maximum.
+
+        Returns:
+            numpy.ndarray: uint8 table of shape (256,).
+        """
+        if not any(_POINT_OPS[op][1] for op, _ in self.steps):
+            return _compile_chain(self.steps, None)
+        if image is None:
+            raise ValueError(f"{self!r} needs the source image to resolve its maxima.")
+        present = cv2.calcHist([image.reshape(image.shape[0], -1)], [0], None, [256], [0, 256]).ravel() > 0
+        return _compile_chain(self.steps, tuple(np.flatnonzero(present)))
+
+    def apply(self, image):
+        """
+        Apply every step of the chain in a single memory pass.
+
+        Parameters:
+            image (numpy.ndarray): uint8 image of any shape.
+
+        Returns:
+            numpy.ndarray: Transformed uint8 image.
+        """
+        return apply_lut(image, self.lut(image))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_chain(steps, present_levels):
+    composite = np.arange(256, dtype=np.uint8)
+    for op, params in steps:
+        params = dict(params)
+        if _POINT_OPS[op][1] and "max_value" not in params:
+            params["max_value"] = int(composite[list(present_levels)].max())
+        composite = point_lut(op, **params)[composite]
+    composite.setflags(write=False)
+    return composite
+
+
+# --- 4. Parameter Sweeps ---
+def _sweep_float(image, op, param, values):
+    out = np.empty((len(values),) + image.shape, dtype=np.uint8)
+    if op == "gamma" and param == "gamma":
+        # Shared work: one normalization and one log; each gamma is then
+        # exp(gamma * log(x)), a scale plus an exp
+        with np.errstate(divide="ignore"):
+            log_normalized = np.log(image.astype(np.float32) / np.float32(255.0))
+        scaled = np.empty(image.shape, dtype=np.float32)
+        for p, gamma in enumerate(values):
+            if gamma == 0:
+                out[p] = 255
+                continue
+            if gamma == 1:
+                out[p] = image / 255.0 * 255
+                continue
+            np.multiply(log_normalized, np.float32(gamma), out=scaled)
+            np.exp(scaled, out=scaled)
+            scaled *= 255
+            out[p] = scaled
+    elif op == "log" and param == "c":
+        # c * log1p(x) normalized by its own maximum: compute log1p and the
+        # maximum once, then rescale per c
+        image_log = np.log1p(image.astype(np.float32))
+        peak = image_log.max()
+        for p, c in enumerate(values):
+            if c == 0 or peak == 0:
+                out[p] = 0
+                continue
+            out[p] = np.clip(image_log * np.float32(255.0 / peak), 0, 255)
+    else:
+        raise ValueError(f"Sweeping {op!r} over {param!r} needs uint8 input.")
+    return out
+
+
+def sweep_point_op(image, op, param, values, **fixed):
+    """
+    Evaluate one point transform for many values of a single parameter.
+
+    For uint8/uint16 input every output plane is a gather through its own
+    lookup table, written straight into the result stack. Float input
+    shares the normalization/log across all values and derives each plane
+    by rescaling (supported for "gamma" over gamma and "log" over c).
+
+    Parameters:
+        image (numpy.ndarray): Input image (grayscale or color).
+        op (str): Registered op name, e.g. "gamma".
+        param (str): Name of the parameter to sweep, e.g. "gamma".
+        values (list): Parameter values to evaluate.
+        **fixed: Other op parameters held constant; bit_depth may be given
+            for 10/12-bit data stored in uint16.
+
+    Returns:
+        numpy.ndarray: Stack of shape (len(values),) + image.shape, uint8
+            for float input and the input dtype otherwise.
+    """
+    if op not in _POINT_OPS:
+        raise ValueError(f"Unknown point operation: {op!r}")
+    values = list(values)
+    if image.dtype.kind == "f":
+        return _sweep_float(image, op, param, values)
+
+    bit_depth = fixed.pop("bit_depth", image.dtype.itemsize * 8)
+    if _POINT_OPS[op][1] and "max_value" not in fixed:
+        fixed["max_value"] = int(image.max())
+    out = np.empty((len(values),) + image.shape, dtype=image.dtype)
+    for p, value in enumerate(values):
+        lut = point_lut(op, bit_depth=bit_depth, **{**fixed, param: value})
+        apply_lut(image, lut, out=out[p])
+    return out
@@ -0,0 +1,340 @@
+"""
+Content-addressed cache for the results of expensive operations.
+
+Results are keyed by a hash of the input bytes, the operation name, the
+canonicalized parameters (array arguments are hashed too, other objects
+through a cache_token() method) and the versions of this cache format,
+NumPy and OpenCV. Calls with a parameter that has neither a content-based
+form nor an importable name run uncached. An in-memory LRU tier holds recent
+results up to a byte budget; an optional on-disk tier keeps .npy files
+under a directory, evicting least recently used entries past its size
+budget. Disk hits are returned as read-only memory maps, so a repeated
+report render reads pages on demand instead of recomputing FFTs or
+eigendecompositions.
+
+Usage:
+    cache = ResultCache("~/.cache/dip", memory_bytes=512 * 2**20, disk_bytes=8 * 2**30)
+    spectrum = cache.wrap(lab2_a.perform_dft, "dft")
+    magnitude = spectrum(image)               # Computed
+    magnitude = spectrum(image)               # Served from memory
+    aligned, H = cache.wrap(Imageregistration.register_images, "register")(moving, fixed)
+"""
+
+import collections
+import functools
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import threading
+
+import cv2
+import numpy as np
+
+# Bump when a cached operation changes its output so stale entries miss
+CACHE_VERSION = 1
+
+_MISS = object()
+
+
+# --- 1. Keys ---
+def hash_array(array):
+    """Hex digest of an array's dtype, shape and bytes."""
+    array = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(memoryview(array).cast("B"))
+    return digest.hexdigest()
+
+
+def _global_name(value):
+    # "module.qualname" for classes and functions importable under that name
+    module, qualname = getattr(value, "__module__", None), getattr(value, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        return None
+    target = sys.modules.get(module)
+    for part in qualname.split("."):
+        target = getattr(target, part, None)
+    return f"{module}.{qualname}" if target is value else None
+
+
+def _canonical(value):
+    if isinstance(value, np.ndarray):
+        return ["ndarray", hash_array(value)]
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, np.dtype):
+        return value.str
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    name = _global_name(value)
+    if name is not None:
+        return name
+    if callable(getattr(value, "cache_token", None)):
+        return [f"{type(value).__module__}.{type(value).__qualname__}", _canonical(value.cache_token())]
+    # A repr may embed the object's address, which a later object can reuse
+    raise TypeError(f"Cannot build a cache key from a {type(value).__name__}; "
+                    "give it a cache_token() method returning its content")
+
+
+def cache_key(op_name, image, params=None):
+    """
+    Key for an operation applied to an image with the given parameters.
+
+    Parameters:
+        op_name (str): Operation name.
+        image (numpy.ndarray): Input image.
+        params (dict): Remaining arguments; arrays are hashed by content,
+            other objects through their cache_token() method.
+
+    Returns:
+        str: Hex digest.
+
+    Raises:
+        TypeError: If a parameter has no content-based form.
+    """
+    payload = json.dumps([CACHE_VERSION, np.__version__, cv2.__version__, op_name,
+                          hash_array(image), _canonical(params or {})], sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+# --- 2. Result Layout ---
+def _parts(result):
+    # (kind, list of arrays or None) for an array or a tuple of arrays
+    if isinstance(result, tuple):
+        return "tuple", [None if r is None else np.asarray(r) for r in result]
+    return "array", [np.asarray(result)]
+
+
+def _assemble(kind, arrays):
+    return tuple(arrays) if kind == "tuple" else arrays[0]
+
+
+def _nbytes(arrays):
+    return sum(a.nbytes for a in arrays if a is not None)
+
+
+def _frozen(array):
+    if array is None:
+        return None
+    array = np.array(array, copy=True)
+    array.setflags(write=False)
+    return array
+
+
+# --- 3. Cache ---
+class ResultCache:
+    """
+    Two-tier (memory, disk) cache for operation results.
+
+    Results must be arrays or tuples of arrays (None entries allowed).
+
+    Parameters:
+        directory (str): Disk tier location. None keeps the cache in memory only.
+        memory_bytes (int): Budget of the in-memory LRU tier.
+        disk_bytes (int): Budget of the disk tier.
+    """
+
+    def __init__(self, directory=None, memory_bytes=256 * 2**20, disk_bytes=4 * 2**30):
+        self.directory = os.path.expanduser(directory) if directory else None
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+        self.uncached = 0
+        self._memory = collections.OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    # Memory tier
+    def _remember(self, key, kind, arrays):
+        size = _nbytes(arrays)
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._memory_used -= self._memory.pop(key)[2]
+            self._memory[key] = (kind, arrays, size)
+            self._memory_used += size
+            while self._memory_used > self.memory_bytes:
+                _, (_, _, evicted) = self._memory.popitem(last=False)
+                self._memory_used -= evicted
+
+    # Disk tier
+    def _entry_dir(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _load(self, key):
+        path = self._entry_dir(key)
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+            arrays = [None if missing else np.load(os.path.join(path, f"{i}.npy"), mmap_mode="r")
+                      for i, missing in enumerate(meta["missing"])]
+        except (OSError, ValueError, KeyError):
+            return None
+        os.utime(path)  # Mark as recently used for eviction
+        return meta["kind"], arrays
+
+    def _store(self, key, kind, arrays):
+        path = self._entry_dir(key)
+        staging = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        os.makedirs(staging, exist_ok=True)
+        for i, array in enumerate(arrays):
+            if array is not None:
+                np.save(os.path.join(staging, f"{i}.npy"), array)
+        with open(os.path.join(staging, "meta.json"), "w") as f:
+            json.dump({"kind": kind, "missing": [a is None for a in arrays]}, f)
+        try:
+            os.rename(staging, path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)  # Another process stored it first
+        self._evict_disk()
+
+    def _disk_entries(self):
+        entries = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_dir() and ".tmp" not in entry.name:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    entries.append((entry.stat().st_mtime, size, entry.path))
+        return entries
+
+    def _evict_disk(self):
+        entries = sorted(self._disk_entries())
+        used = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if used <= self.disk_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            used -= size
+
+    # Public API
+    def get(self, key, default=None):
+        """Return a cached result, or default on a miss."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits["memory"] += 1
+                return _assemble(entry[0], entry[1])
+        if self.directory:
+            loaded = self._load(key)
+            if loaded is not None:
+                self.hits["disk"] += 1
+                self._remember(key, *loaded)
+                return _assemble(*loaded)
+        self.misses += 1
+        return default
+
+    def put(self, key, result):
+        """Store a result in both tiers and return its cached (read-only) form."""
+        kind, arrays = _parts(result)
+        arrays = [_frozen(a) for a in arrays]
+        self._remember(key, kind, arrays)
+        if self.directory:
+            self._store(key, kind, arrays)
+        return _assemble(kind, arrays)
+
+    def get_or_compute(self, op_name, fn, image, *args, **kwargs):
+        """
+        Return fn(image, *args, **kwargs), computing it only on a cache miss.
+        Arguments are canonicalized against fn's signature, so positional,
+        keyword and default spellings of the same call share an entry. Calls
+        with a parameter cache_key() cannot hash are run uncached.
+        """
+        try:
+            bound = inspect.signature(fn).bind(image, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(list(bound.arguments.items())[1:])
+        except (TypeError, ValueError):
+            params = {"args": args, "kwargs": kwargs}
+        try:
+            key = cache_key(op_name, image, params)
+        except TypeError:
+            self.uncached += 1
+            return fn(image, *args, **kwargs)
+        result = self.get(key, _MISS)
+        if result is _MISS:
+            result = self.put(key, fn(image, *args, **kwargs))
+        return result
+
+    def wrap(self, fn, op_name=None):
+        """Return a cached version of fn; op_name defaults to its qualified name."""
+        op_name = op_name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def cached(image, *args, **kwargs):
+            return self.get_or_compute(op_name, fn, image, *args, **kwargs)
+        cached.cache = self
+        return cached
+
+    def clear(self, disk=False):
+        """Empty the memory tier, and the disk tier too if disk=True."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+        if disk and self.directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            os.makedirs(self.directory, exist_ok=True)
+
+
+# --- 4. Key Check ---
+class _Token:
+    def __init__(self, array):
+        self.array = array
+
+    def cache_token(self):
+        return hash_array(self.array)
+
+
+def check_keys():
+    """
+    Check that keys follow parameter content rather than object identity.
+
+    Returns:
+        list: Descriptions of the checks that failed; empty when all pass.
+    """
+    failures = []
+    image = np.zeros((4, 4), np.uint8)
+    first = cache_key("op", image, {"basis": _Token(np.ones(3))})
+    # A new object may reuse the freed address of the first one
+    second = cache_key("op", image, {"basis": _Token(np.zeros(3))})
+    if first == second:
+        failures.append("objects with different content share a key")
+    if first != cache_key("op", image, {"basis": _Token(np.ones(3))}):
+        failures.append("objects with equal content get different keys")
+    for value in (object(), lambda x: x):
+        try:
+            cache_key("op", image, {"value": value})
+            failures.append(f"a {type(value).__name__} without a cache_token() was keyed")
+        except TypeError:
+            pass
+    cache = ResultCache()
+    calls = []
+    cached = cache.wrap(lambda img, value: calls.append(value) or img, "identity")
+    cached(image, value=object())
+    cached(image, value=object())
+    if len(calls) != 2 or cache.uncached != 2:
+        failures.append("calls with an unkeyable parameter were served from the cache")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check_keys()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("ok" if not failures else f"{len(failures)} failed")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,254 @@
+"""
+Process pool that moves frames through shared memory instead of pickles.
+
+Input and output arrays live in multiprocessing.shared_memory blocks; only
+(name, shape, dtype) descriptors cross the process boundary. Workers attach
+to the blocks, run the operation on the input view and write the result
+into the output block, so a 100 MB frame is never serialized. Blocks are
+recycled from a pool keyed by size.
+
+Usage:
+    with SharedMemoryExecutor(max_workers=4) as executor:
+        futures = [executor.submit(lab2_c.homomorphic_filter, frame) for frame in frames]
+        for future in futures:
+            result = future.result()       # Array backed by shared memory
+            cv2.imwrite(..., result)
+            executor.release(result)       # Return its block to the pool
+"""
+
+import collections
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# --- 1. Block Pool ---
+class SharedArrayPool:
+    """
+    Recycles shared-memory blocks so repeated frames of one size reuse them.
+
+    Parameters:
+        max_free (int): Free blocks kept per size; extras are unlinked.
+    """
+
+    def __init__(self, max_free=8):
+        self.max_free = max_free
+        self._free = {}
+        self._blocks = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, shape, dtype):
+        """
+        Return an array of the given shape and dtype backed by a pooled block.
+
+        Returns:
+            tuple: (numpy.ndarray, descriptor) where descriptor is (name, shape, dtype str).
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(n) for n in shape)
+        nbytes = max(1, int(np.prod(shape)) * dtype.itemsize)
+        with self._lock:
+            free = self._free.get(nbytes)
+            shm = free.pop() if free else None
+        if shm is None:
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            with self._lock:
+                self._blocks[shm.name] = shm
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        return array, (shm.name, shape, dtype.str)
+
+    def release(self, descriptor):
+        """Return a block to the pool, unlinking it if the pool is full."""
+        name = descriptor[0]
+        with self._lock:
+            shm = self._blocks.get(name)
+            if shm is None:
+                return
+            free = self._free.setdefault(self._nbytes(descriptor), [])
+            if len(free) < self.max_free:
+                free.append(shm)
+                return
+            del self._blocks[name]
+        shm.close()
+        shm.unlink()
+
+    @staticmethod
+    def _nbytes(descriptor):
+        _, shape, dtype = descriptor
+        return max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+
+    def close(self):
+        """Unlink every block owned by the pool. Arrays handed out become invalid."""
+        with self._lock:
+            blocks, self._blocks, self._free = self._blocks, {}, {}
+        for shm in blocks.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass  # A caller still holds a view; the segment is unlinked regardless
+            shm.unlink()
+
+
+# --- 2. Worker Side ---
+# Blocks attached by this worker process, reused across tasks, least
+# recently used first. The pool unlinks surplus blocks, but a segment stays
+# mapped until every process that attached it closes it.
+_MAX_ATTACHED = 16
+_attached = collections.OrderedDict()
+
+
+def _attach(descriptor):
+    name, shape, dtype = descriptor
+    shm = _attached.pop(name, None)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+    _attached[name] = shm
+    while len(_attached) > _MAX_ATTACHED:
+        _, evicted = _attached.popitem(last=False)
+        try:
+            evicted.close()
+        except BufferError:
+            pass  # A view outlived its task; the mapping goes with the view
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _run_shared(fn, in_desc, out_desc, args, kwargs):
+    image = _attach(in_desc)
+    out = _attach(out_desc)
+    result = np.asarray(fn(image, *args, **kwargs))
+    if result.shape != out.shape or result.dtype != out.dtype:
+        raise ValueError(f"{getattr(fn, '__name__', fn)} returned {result.dtype}{result.shape}, "
+                         f"expected {out.dtype}{out.shape}; pass out_shape/out_dtype to submit().")
+    np.copyto(out, result)
+
+
+# --- 3. Executor ---
+class SharedMemoryExecutor:
+    """
+    ProcessPoolExecutor front end that passes frames through shared memory.
+
+    Functions must be picklable (module-level), take the image as their first
+    argument and return an array. By default the output has the input's shape
+    and dtype; operations that change either (region_based_segmentation
+    returns BGR for a grayscale input) declare it with out_shape/out_dtype.
+
+    Parameters:
+        max_workers (int): Worker processes. Defaults to the CPU count.
+        pool (SharedArrayPool): Block pool to draw from. One is created if omitted.
+    """
+
+    def __init__(self, max_workers=None, pool=None):
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else SharedArrayPool()
+        self._outputs = {}
+        self._inputs = {}
+        self._lock = threading.Lock()
+
+    def empty(self, shape, dtype=np.uint8):
+        """
+        Allocate a shared input array the caller fills in place.
+
+        Frames submitted from such an array are not copied at all. The caller
+        keeps ownership and hands it back with release().
+        """
+        array, descriptor = self.pool.acquire(shape, dtype)
+        with self._lock:
+            self._inputs[id(array)] = (array, descriptor)
+        return array
+
+    def submit(self, fn, image, *args, out_shape=None, out_dtype=None, **kwargs):
+        """
+        Run fn(image, *args, **kwargs) in a worker through shared memory.
+
+        Parameters:
+            fn (callable): Picklable operation.
+            image (numpy.ndarray): Input frame, or an array from empty().
+            out_shape (tuple): Output shape. Defaults to the input shape.
+            out_dtype (dtype): Output dtype. Defaults to the input dtype.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the output array, which stays
+            valid until passed to release().
+        """
+        with self._lock:
+            owned = self._inputs.get(id(image))
+        if owned is not None and owned[0] is image:
+            in_desc, temporary = owned[1], False
+        else:
+            image = np.asarray(image)
+            staged, in_desc = self.pool.acquire(image.shape, image.dtype)
+            np.copyto(staged, image)
+            temporary = True
+
+        out_shape = image.shape if out_shape is None else out_shape
+        out_dtype = image.dtype if out_dtype is None else out_dtype
+        out, out_desc = self.pool.acquire(out_shape, out_dtype)
+
+        future = self._executor.submit(_run_shared, fn, in_desc, out_desc, args, kwargs)
+        result = _SharedFuture(future, out)
+        with self._lock:
+            self._outputs[id(out)] = (out, out_desc)
+
+        def done(f):
+            if temporary:
+                self.pool.release(in_desc)
+            if f.exception() is not None:
+                self.release(out)
+
+        future.add_done_callback(done)
+        return result
+
+    def map(self, fn, images, *args, out_shape=None, out_dtype=None, **kwargs):
+        """Yield output arrays in order; release each once it has been consumed."""
+        futures = [self.submit(fn, image, *args, out_shape=out_shape, out_dtype=out_dtype, **kwargs)
+                   for image in images]
+        for future in futures:
+            yield future.result()
+
+    def release(self, array):
+        """Return an output array, or an array from empty(), to the block pool."""
+        with self._lock:
+            entry = self._outputs.pop(id(array), None) or self._inputs.pop(id(array), None)
+        if entry is not None:
+            self.pool.release(entry[1])
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+        if self._owns_pool:
+            with self._lock:
+                self._outputs.clear()
+                self._inputs.clear()
+            self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+class _SharedFuture:
+    """Future wrapper whose result is the shared output array."""
+
+    def __init__(self, future, out):
+        self._future = future
+        self._out = out
+
+    def result(self, timeout=None):
+        self._future.result(timeout)
+        return self._out
+
+    def exception(self, timeout=None):
+        return self._future.exception(timeout)
+
+    def done(self):
+        return self._future.done()
+
+    def cancel(self):
+        return self._future.cancel()
+
+    def add_done_callback(self, fn):
+        self._future.add_done_callback(lambda _: fn(self))
@@ -0,0 +1,162 @@
+"""
+Memory-mapped image stacks with streaming reducers.
+
+An ImageStack is an (N, H, W) or (N, H, W, C) array stored in a .npy file
+and memory-mapped, so frames are written and read without ever holding
+the whole stack. The reducers (mean, variance, median, sigma-clipped mean)
+walk the stack in bands of rows sized to a memory budget; averaging
+10,000 4K frames needs a few hundred MB instead of the hundreds of GB a
+float64 np.mean over the full stack would.
+
+Usage:
+    stack = ImageStack.from_files("frames.npy", sorted(glob.glob("frames/*.png")))
+    averaged = stack.mean().astype(np.uint8)
+    background = stack.median()
+"""
+
+import cv2
+import numpy as np
+
+# Default working memory for one band of a reducer
+DEFAULT_BUDGET = 256 * 1024 * 1024
+
+
+class ImageStack:
+    """
+    A stack of same-sized frames backed by a memory-mapped .npy file.
+
+    Parameters:
+        path (str): .npy file holding an (N, H, W[, C]) array.
+        mode (str): "r" for read-only, "r+" to modify frames in place.
+    """
+
+    def __init__(self, path, mode="r"):
+        self.path = str(path)
+        self.data = np.load(self.path, mmap_mode=mode)
+        if self.data.ndim not in (3, 4):
+            raise ValueError(f"Expected an (N, H, W[, C]) stack, got shape {self.data.shape}")
+
+    @classmethod
+    def create(cls, path, count, frame_shape, dtype=np.uint8):
+        """Create an empty stack of count frames, ready to be filled with stack[i] = frame."""
+        data = np.lib.format.open_memmap(str(path), mode="w+", dtype=dtype,
+                                         shape=(count,) + tuple(frame_shape))
+        del data
+        return cls(path, mode="r+")
+
+    @classmethod
+    def from_images(cls, path, images, count=None):
+        """
+        Write frames one at a time into a new stack.
+
+        Parameters:
+            path (str): Destination .npy file.
+            images (iterable): Same-shaped frames; may be a generator.
+            count (int): Number of frames; required when images has no len().
+
+        Returns:
+            ImageStack: The stack, opened read-write.
+        """
+        count = len(images) if count is None else count
+        iterator = iter(images)
+        first = np.asarray(next(iterator))
+        stack = cls.create(path, count, first.shape, first.dtype)
+        stack[0] = first
+        written = 1
+        for frame in iterator:
+            if written == count:
+                raise ValueError(f"Got more than the {count} frames announced")
+            stack[written] = frame
+            written += 1
+        if written != count:
+            raise ValueError(f"Expected {count} frames, got {written}")
+        stack.data.flush()
+        return stack
+
+    @classmethod
+    def from_files(cls, path, files, imread_flag=cv2.IMREAD_GRAYSCALE):
+        """Decode image files one by one into a new stack."""
+        def frames():
+            for file in files:
+                frame = cv2.imread(str(file), imread_flag)
+                if frame is None:
+                    raise ValueError(f"Could not decode {file}")
+                yield frame
+        return cls.from_images(path, frames(), count=len(files))
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __setitem__(self, index, frame):
+        self.data[index] = frame
+
+    @property
+    def frame_shape(self):
+        return self.data.shape[1:]
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def bands(self, bytes_per_value=8, budget=DEFAULT_BUDGET):
+        """
+        Yield (y0, y1, band) with band = stack[:, y0:y1] read into memory.
+
+        The band height keeps N * rows * W * C * bytes_per_value within budget.
+        """
+        count, height = self.data.shape[:2]
+        row_values = count * int(np.prod(self.data.shape[2:]))
+        rows = max(1, min(height, budget // max(1, row_values * bytes_per_value)))
+        for y0 in range(0, height, rows):
+            y1 = min(y0 + rows, height)
+            yield y0, y1, np.asarray(self.data[:, y0:y1])
+
+    def _reduce(self, reducer, bytes_per_value, budget):
+        out = np.empty(self.frame_shape, dtype=np.float64)
+        for y0, y1, band in self.bands(bytes_per_value, budget):
+            out[y0:y1] = reducer(band)
+        return out
+
+    # --- Streaming reducers ---
+    def mean(self, budget=DEFAULT_BUDGET):
+        """Per-pixel mean over the stack as float64, equal to np.mean(stack, axis=0)."""
+        return self._reduce(lambda band: band.mean(axis=0, dtype=np.float64), 2, budget)
+
+    def variance(self, ddof=0, budget=DEFAULT_BUDGET):
+        """Per-pixel variance over the stack as float64."""
+        return self._reduce(lambda band: band.var(axis=0, dtype=np.float64, ddof=ddof), 10, budget)
+
+    def median(self, budget=DEFAULT_BUDGET):
+        """Per-pixel median over the stack as float64, equal to np.median(stack, axis=0)."""
+        return self._reduce(lambda band: np.median(band, axis=0), 10, budget)
+
+    def sigma_clipped_mean(self, sigma=3.0, iterations=3, budget=DEFAULT_BUDGET):
+        """
+        Per-pixel mean after iteratively rejecting values more than sigma
+        standard deviations from the mean, e.g. to drop transient objects.
+
+        Parameters:
+            sigma (float): Rejection threshold in standard deviations.
+            iterations (int): Maximum number of clipping passes.
+            budget (int): Working memory per band in bytes.
+        """
+        def clipped(band):
+            values = band.astype(np.float32)
+            keep = np.ones(values.shape, dtype=bool)
+            mean = values.mean(axis=0, dtype=np.float64)
+            for _ in range(iterations):
+                count = keep.sum(axis=0)
+                mean = np.where(keep, values, 0).sum(axis=0, dtype=np.float64) / np.maximum(count, 1)
+                std = np.sqrt(np.where(keep, (values - mean) ** 2, 0).sum(axis=0, dtype=np.float64)
+                              / np.maximum(count, 1))
+                new_keep = np.abs(values - mean) <= sigma * std
+                if np.array_equal(new_keep, keep):
+                    break
+                keep = new_keep
+            count = keep.sum(axis=0)
+            clipped_mean = np.where(keep, values, 0).sum(axis=0, dtype=np.float64) / np.maximum(count, 1)
+            return np.where(count > 0, clipped_mean, mean)
+        return self._reduce(clipped, 24, budget)
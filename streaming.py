@@ -0,0 +1,384 @@
+"""
+Generator pipelines for running the lab operations on video.
+
+Frames are pulled lazily from a cv2.VideoCapture (file or camera index)
+or an image sequence, passed through stages and pushed into a sink:
+
+    report = (frames("clip.mp4", prefetch=True)
+              | Stage(cv2.cvtColor, code=cv2.COLOR_BGR2GRAY)
+              | lab2_b.histogram_equalization
+              | Stage(lab1_d.median_filter, kernel_size=5, threaded=True)
+              | VideoSink("out.mp4", fps=25, threaded=True))
+    print(report)
+
+Without threads each stage holds one frame at a time. A threaded stage
+(or prefetching source, or threaded sink) runs in its own thread behind a
+queue of at most `buffer` frames. Every stage records its own processing
+time, so the report shows per-stage FPS, and every queue records how long
+its producer was blocked on a full queue (backpressure: downstream is the
+bottleneck) and how long its consumer was starved on an empty one.
+"""
+
+import abc
+import atexit
+import glob
+import os
+import queue
+import threading
+import time
+
+import cv2
+
+_DONE = object()
+
+# Producer threads still running, stopped at exit so none is left inside OpenCV
+_active = set()
+
+
+# --- 1. Per-Stage Statistics ---
+class StageStats:
+    """Counters for one stage of a pipeline."""
+
+    def __init__(self, name):
+        self.name = name
+        self.frames = 0
+        self.seconds = 0.0
+        self.blocked = 0.0
+        self.starved = 0.0
+        self.max_queued = 0
+
+    @property
+    def fps(self):
+        return self.frames / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        return {"stage": self.name, "frames": self.frames, "seconds": self.seconds,
+                "fps": self.fps, "blocked_s": self.blocked, "starved_s": self.starved,
+                "max_queued": self.max_queued}
+
+
+class RunReport:
+    """Result of draining a pipeline into a sink."""
+
+    def __init__(self, stats, seconds, result=None):
+        self.stats = stats
+        self.seconds = seconds
+        self.result = result
+
+    @property
+    def frames(self):
+        return self.stats[-1].frames if self.stats else 0
+
+    def as_dicts(self):
+        return [s.as_dict() for s in self.stats]
+
+    def __str__(self):
+        lines = [f"{'stage':<28} {'frames':>7} {'fps':>9} {'blocked s':>10} {'starved s':>10} {'max q':>6}"]
+        for s in self.stats:
+            lines.append(f"{s.name:<28} {s.frames:7d} {s.fps:9.1f} {s.blocked:10.2f} "
+                         f"{s.starved:10.2f} {s.max_queued:6d}")
+        rate = self.frames / self.seconds if self.seconds else 0.0
+        lines.append(f"{self.frames} frames in {self.seconds:.2f} s ({rate:.1f} fps end to end)")
+        return "\n".join(lines)
+
+
+# --- 2. Bounded Thread Hand-off ---
+def _threaded(iterable, stats, buffer):
+    """
+    Iterate `iterable` in a background thread, handing items over through a
+    queue of at most `buffer` items.
+    """
+    items = queue.Queue(maxsize=buffer)
+    stop = threading.Event()
+
+    def hand_off(item):
+        # Wait for room, giving up once the consumer has gone away
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                start = time.perf_counter()
+                delivered = hand_off(item)
+                stats.blocked += time.perf_counter() - start
+                stats.max_queued = max(stats.max_queued, items.qsize())
+                if not delivered:
+                    return
+            hand_off(_DONE)
+        except BaseException as exc:
+            hand_off(exc)
+
+    thread = threading.Thread(target=produce, name=f"stage-{stats.name}", daemon=True)
+    handle = (stop, thread)
+    _active.add(handle)
+    thread.start()
+    try:
+        while True:
+            start = time.perf_counter()
+            item = items.get()
+            stats.starved += time.perf_counter() - start
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+        _active.discard(handle)
+
+
+@atexit.register
+def _stop_threads():
+    for stop, thread in list(_active):
+        stop.set()
+    for stop, thread in list(_active):
+        thread.join(timeout=5)
+
+
+# --- 3. Streams and Stages ---
+class Stream:
+    """
+    A lazy sequence of frames plus the statistics of the stages that made it.
+    Compose with `stream | stage` and finish with `stream | sink`.
+    """
+
+    def __init__(self, iterable, stats=()):
+        self._iterable = iterable
+        self.stats = list(stats)
+
+    def __iter__(self):
+        return iter(self._iterable)
+
+    def __or__(self, other):
+        if isinstance(other, Sink):
+            return other.run(self)
+        if isinstance(other, str):
+            other = Stage.from_operation(other)
+        elif not isinstance(other, Stage):
+            other = Stage(other)
+        return other.attach(self)
+
+    def report(self):
+        return [s.as_dict() for s in self.stats]
+
+
+class Stage:
+    """
+    Apply fn(frame, **params) to every frame.
+
+    Parameters:
+        fn (callable): Any of the lab functions taking an image first.
+        name (str): Label in the report. Defaults to the function name.
+        threaded (bool): Run this stage (and pull from upstream) in its own thread.
+        buffer (int): Frames queued after a threaded stage.
+        **params: Keyword parameters for fn.
+    """
+
+    def __init__(self, fn, name=None, threaded=False, buffer=4, **params):
+        self.fn = fn
+        self.name = name or getattr(fn, "__name__", repr(fn))
+        self.threaded = threaded
+        self.buffer = buffer
+        self.params = params
+
+    @classmethod
+    def from_operation(cls, name, threaded=False, buffer=4, **params):
+        """Build a stage from an operation registered in operations.py."""
+        import operations
+        fn, _ = operations.get_operation(name)
+        return cls(fn, name=name, threaded=threaded, buffer=buffer, **params)
+
+    def attach(self, upstream):
+        stats = StageStats(self.name)
+
+        def run():
+            for frame in upstream:
+                start = time.perf_counter()
+                result = self.fn(frame, **self.params)
+                stats.seconds += time.perf_counter() - start
+                stats.frames += 1
+                yield result
+
+        iterable = _threaded(run(), stats, self.buffer) if self.threaded else run()
+        return Stream(iterable, upstream.stats + [stats])
+
+
+# --- 4. Sources ---
+def _sequence_paths(source):
+    if isinstance(source, (list, tuple)):
+        return [str(path) for path in source]
+    if os.path.isdir(source):
+        return sorted(os.path.join(source, name) for name in os.listdir(source)
+                      if os.path.splitext(name)[1].lower() in
+                      (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp"))
+    if any(ch in source for ch in "*?["):
+        return sorted(glob.glob(source))
+    return None
+
+
+def frames(source, prefetch=False, buffer=8, imread_flag=cv2.IMREAD_COLOR, max_frames=None):
+    """
+    Lazily decode frames from a video, a camera or an image sequence.
+
+    Parameters:
+        source (int, str or list): Camera index, video file, directory,
+            glob pattern or list of image paths.
+        prefetch (bool): Decode in a background thread ahead of the pipeline.
+        buffer (int): Decoded frames queued when prefetching.
+        imread_flag (int): cv2.imread flag for image sequences.
+        max_frames (int): Stop after this many frames (useful for cameras).
+
+    Returns:
+        Stream: Frames in BGR (or as imread_flag decodes them).
+    """
+    stats = StageStats("decode")
+    paths = None if isinstance(source, int) else _sequence_paths(source)
+
+    def decode():
+        count = 0
+        if paths is not None:
+            for path in paths:
+                if max_frames is not None and count >= max_frames:
+                    return
+                start = time.perf_counter()
+                frame = cv2.imread(path, imread_flag)
+                stats.seconds += time.perf_counter() - start
+                if frame is None:
+                    raise ValueError(f"Could not decode {path}")
+                stats.frames += 1
+                count += 1
+                yield frame
+            return
+        capture = cv2.VideoCapture(source)
+        if not capture.isOpened():
+            raise ValueError(f"Could not open video source {source!r}")
+        try:
+            while max_frames is None or count < max_frames:
+                start = time.perf_counter()
+                ok, frame = capture.read()
+                stats.seconds += time.perf_counter() - start
+                if not ok:
+                    return
+                stats.frames += 1
+                count += 1
+                yield frame
+        finally:
+            capture.release()
+
+    iterable = _threaded(decode(), stats, buffer) if prefetch else decode()
+    return Stream(iterable, [stats])
+
+
+# --- 5. Sinks ---
+class Sink(abc.ABC):
+    """
+    Base class for pipeline ends. Subclasses implement write(frame) and
+    optionally close() and result().
+
+    Parameters:
+        threaded (bool): Run everything upstream in a background thread so
+            encoding overlaps with processing.
+        buffer (int): Frames queued in front of a threaded sink.
+    """
+
+    name = "sink"
+
+    def __init__(self, threaded=False, buffer=8):
+        self.threaded = threaded
+        self.buffer = buffer
+
+    @abc.abstractmethod
+    def write(self, frame):
+        """Consume one frame."""
+
+    def close(self):
+        pass
+
+    def result(self):
+        return None
+
+    def run(self, stream):
+        stats = StageStats(self.name)
+        source = _threaded(iter(stream), stats, self.buffer) if self.threaded else stream
+        start = time.perf_counter()
+        try:
+            for frame in source:
+                t0 = time.perf_counter()
+                self.write(frame)
+                stats.seconds += time.perf_counter() - t0
+                stats.frames += 1
+        finally:
+            self.close()
+        return RunReport(stream.stats + [stats], time.perf_counter() - start, self.result())
+
+
+class VideoSink(Sink):
+    """
+    Encode frames to a video file. The writer opens on the first frame, so
+    its size and color mode follow the pipeline output.
+    """
+
+    name = "encode"
+
+    def __init__(self, path, fps=30.0, fourcc="mp4v", threaded=False, buffer=8):
+        super().__init__(threaded, buffer)
+        self.path = path
+        self.fps = fps
+        self.fourcc = fourcc
+        self._writer = None
+
+    def write(self, frame):
+        if self._writer is None:
+            height, width = frame.shape[:2]
+            self._writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps,
+                                           (width, height), frame.ndim == 3)
+            if not self._writer.isOpened():
+                raise ValueError(f"Could not open video writer for {self.path}")
+        self._writer.write(frame)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.release()
+
+
+class ImageSequenceSink(Sink):
+    """
+    Write frames as numbered images, e.g. pattern="out/frame_{:06d}.png".
+    """
+
+    name = "encode"
+
+    def __init__(self, pattern, threaded=False, buffer=8):
+        super().__init__(threaded, buffer)
+        self.pattern = pattern
+        self._index = 0
+
+    def write(self, frame):
+        path = self.pattern.format(self._index)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if not cv2.imwrite(path, frame):
+            raise ValueError(f"Could not encode {path}")
+        self._index += 1
+
+
+class Collect(Sink):
+    """Keep the output frames in a list, returned as the report's result."""
+
+    name = "collect"
+
+    def __init__(self, threaded=False, buffer=8):
+        super().__init__(threaded, buffer)
+        self._frames = []
+
+    def write(self, frame):
+        self._frames.append(frame)
+
+    def result(self):
+        return self._frames
@@ -0,0 +1,238 @@
+"""
+Lightweight per-stage tracing for multi-step operations.
+
+Wrap the steps of a function in spans, or whole functions with @traced.
+While tracing is disabled (the default) span() returns a shared no-op
+object, so instrumented code costs one global check per stage. Once
+enabled, every span records its wall time, the shapes and dtypes of the
+arrays handed to record(), and optionally the bytes allocated through
+NumPy/Python (tracemalloc; OpenCV's internal scratch buffers are not
+seen).
+
+Usage:
+    import tracing
+    tracing.enable(memory=True)
+    Imagesegmenation.region_based_segmentation(image)
+    print(tracing.summary())
+    tracing.export_chrome_trace("segmentation.json")   # chrome://tracing or Perfetto
+
+Instrumenting a function:
+    with span("distance_transform") as s:
+        dist = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
+        s.record(dist)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+_enabled = False
+_memory = False
+# Whether enable() started tracemalloc, and so disable() should stop it
+_started_tracemalloc = False
+_events = []
+_lock = threading.Lock()
+_local = threading.local()
+_origin = time.perf_counter()
+
+
+class _NullSpan:
+    """Stand-in returned while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def record(self, *arrays, **named):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class Span:
+    """One timed stage; created by span() while tracing is enabled."""
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.shapes = {}
+        self.mem_start = None
+
+    def record(self, *arrays, **named):
+        """Attach the shape and dtype of result arrays to this span."""
+        for i, array in enumerate(arrays):
+            named.setdefault(f"out{i}" if len(arrays) > 1 else "out", array)
+        for key, array in named.items():
+            shape = getattr(array, "shape", None)
+            if shape is not None:
+                self.shapes[key] = f"{getattr(array, 'dtype', '')}{tuple(shape)}"
+
+    def __enter__(self):
+        stack = _stack()
+        self.depth = len(stack)
+        if _memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak_abs = max(stack[-1].peak_abs, peak)
+            tracemalloc.reset_peak()
+            self.mem_start = self.peak_abs = current
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        stack = _stack()
+        stack.pop()
+        event = {"name": self.name, "ts": (self.start - _origin) * 1e6, "dur": (end - self.start) * 1e6,
+                 "tid": threading.get_ident(), "depth": self.depth,
+                 "parent": stack[-1].name if stack else None, "args": dict(self.args)}
+        if self.shapes:
+            event["args"]["shapes"] = self.shapes
+        if self.mem_start is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.peak_abs = max(self.peak_abs, peak)
+            event["args"]["allocated_bytes"] = current - self.mem_start
+            event["args"]["peak_bytes"] = self.peak_abs - self.mem_start
+            if stack:
+                stack[-1].peak_abs = max(stack[-1].peak_abs, self.peak_abs)
+            tracemalloc.reset_peak()
+        with _lock:
+            _events.append(event)
+        return False
+
+
+# --- 1. Instrumentation API ---
+def span(name, **args):
+    """
+    Context manager timing one stage. Extra keyword arguments are stored
+    with the event (keep them small: sizes, parameters).
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, args)
+
+
+def traced(name=None):
+    """Decorator recording each call of a function as a span."""
+    def decorator(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with Span(label, {}) as s:
+                if args:
+                    s.record(input=args[0])
+                result = fn(*args, **kwargs)
+                s.record(*(result if isinstance(result, tuple) else (result,)))
+                return result
+        return wrapper
+    return decorator
+
+
+def enable(memory=False):
+    """
+    Start recording spans.
+
+    Parameters:
+        memory (bool): Also record allocated and peak bytes per span via
+            tracemalloc, which slows Python-level allocation noticeably.
+    """
+    global _enabled, _memory, _started_tracemalloc
+    _memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    _enabled = True
+
+
+def disable():
+    """Stop recording; collected events are kept until reset()."""
+    global _enabled, _memory, _started_tracemalloc
+    _enabled = False
+    # Tracing the caller started before enable() is theirs to stop
+    if _started_tracemalloc and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _started_tracemalloc = False
+    _memory = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Drop all recorded events."""
+    with _lock:
+        _events.clear()
+
+
+def events():
+    """Recorded events as a list of dicts (times in microseconds)."""
+    with _lock:
+        return list(_events)
+
+
+# --- 2. Export ---
+def export_chrome_trace(path):
+    """
+    Write events in the Chrome trace-event format, viewable in
+    chrome://tracing or https://ui.perfetto.dev.
+    """
+    pid = os.getpid()
+    trace = [{"name": e["name"], "ph": "X", "ts": e["ts"], "dur": e["dur"],
+              "pid": pid, "tid": e["tid"], "args": e["args"]} for e in events()]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+def summary(sort="total"):
+    """
+    Per-stage table: calls, total and mean time, share of the enclosing
+    stage's time, and the largest allocation seen.
+
+    Parameters:
+        sort (str): "total" to order by total time, "order" to keep first-seen order.
+
+    Returns:
+        str: Formatted table.
+    """
+    rows = {}
+    totals = {}
+    for e in events():
+        row = rows.setdefault((e["parent"], e["name"]), {"calls": 0, "total": 0.0, "peak": None})
+        row["calls"] += 1
+        row["total"] += e["dur"]
+        totals[e["name"]] = totals.get(e["name"], 0.0) + e["dur"]
+        peak = e["args"].get("peak_bytes")
+        if peak is not None:
+            row["peak"] = max(row["peak"] or 0, peak)
+    for (parent, name), row in rows.items():
+        row["share"] = row["total"] / totals[parent] if parent in totals and totals[parent] else None
+
+    items = list(rows.items())
+    if sort == "total":
+        items.sort(key=lambda item: -item[1]["total"])
+    lines = [f"{'stage':<52} {'calls':>6} {'total ms':>10} {'mean ms':>9} {'share':>7} {'peak MiB':>9}"]
+    for (parent, name), row in items:
+        label = f"{parent} > {name}" if parent else name
+        share = f"{row['share']:.0%}" if row["share"] is not None else ""
+        peak = f"{row['peak'] / 2**20:.1f}" if row["peak"] is not None else ""
+        lines.append(f"{label:<52} {row['calls']:6d} {row['total'] / 1000:10.2f} "
+                     f"{row['total'] / row['calls'] / 1000:9.3f} {share:>7} {peak:>9}")
+    return "\n".join(lines)
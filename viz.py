@@ -0,0 +1,19 @@
+"""
+Optional plotting layer for the lab demos.
+
+The image-processing modules never import matplotlib themselves; their
+demo code (main() or the __main__ blocks) draws through the plt proxy
+below, which imports matplotlib.pyplot only when the first figure is
+created. Headless workers that just call the processing functions never
+load matplotlib.
+"""
+
+from lazy_imports import LazyModule
+
+plt = LazyModule("matplotlib.pyplot")
+
+
+def cv2_imshow(image):
+    """Show a BGR image with Colab's cv2_imshow, importing it only when called."""
+    from google.colab.patches import cv2_imshow as colab_imshow
+    colab_imshow(image)